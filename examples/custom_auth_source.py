@@ -1,11 +1,13 @@
 """
 自定义认证源示例
 """
+import operator
+from collections import defaultdict
 
 from senweaver_oauth import AuthConfig, AuthRequest, AuthRequestBuilder
 from senweaver_oauth.enums.auth_source import AuthSource
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
@@ -26,6 +28,11 @@ class CustomAuthSource:
         scope_delimiter=" "
     )
 
+# 用户信息中需要复制的字段，一次调用取出全部字段
+_USER_FIELDS = operator.itemgetter(
+    'id', 'username', 'nickname', 'avatar', 'blog', 'company', 'location', 'email', 'bio', 'gender'
+)
+
 
 # 实现自定义认证源
 class AuthCustomSource(BaseAuthSource):
@@ -53,15 +60,9 @@ class AuthCustomSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
-            
-        params = {
-            'grant_type': 'authorization_code',
-            'code': callback.code,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'redirect_uri': self.config.redirect_uri
-        }
+            return EMPTY_CODE_RESPONSE
+            
+        params = self._token_body(callback.code)
         
         try:
             response = self.http_client.post(self.source.access_token_url, data=params)
@@ -85,7 +86,7 @@ class AuthCustomSource(BaseAuthSource):
         except Exception as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
-    def get_user_info(self, token: AuthToken) -> AuthUserResponse:
+    def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
         """
         获取用户信息
         
@@ -96,37 +97,54 @@ class AuthCustomSource(BaseAuthSource):
             用户信息
         """
         try:
-            headers = {'Authorization': f"Bearer {token.access_token}"}
+            headers = {'Authorization': token.authorization}
             response = self.http_client.get(self.source.user_info_url, headers=headers)
             
             if 'error' in response:
                 return AuthUserResponse.failure(response.get('error_description', '获取用户信息失败'))
                 
-            user = AuthUser(
-                uuid=str(response.get('id')),
-                username=response.get('username'),
-                nickname=response.get('nickname'),
-                avatar=response.get('avatar'),
-                blog=response.get('blog'),
-                company=response.get('company'),
-                location=response.get('location'),
-                email=response.get('email'),
-                remark=response.get('bio'),
-                gender=response.get('gender'),
-                source=self.source.name,
-                token={
-                    'access_token': token.access_token,
-                    'refresh_token': token.refresh_token,
-                    'expires_in': token.expires_in
-                },
-                raw_user_info=response
-            )
+            user = self._build_user(token, response)
             
             return AuthUserResponse.success(user)
             
         except Exception as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
             
+    def _build_user(self, token: AuthToken, response: dict) -> AuthUser:
+        """
+        根据用户信息响应构建用户对象
+        
+        Args:
+            token: 访问令牌
+            response: 用户信息响应
+            
+        Returns:
+            用户对象
+        """
+        # 缺失的字段取值为None
+        uid, username, nickname, avatar, blog, company, location, email, bio, gender = _USER_FIELDS(
+            defaultdict(lambda: None, response)
+        )
+        return AuthUser(
+            uuid=str(uid),
+            username=username,
+            nickname=nickname,
+            avatar=avatar,
+            blog=blog,
+            company=company,
+            location=location,
+            email=email,
+            remark=bio,
+            gender=gender,
+            source=self.source.name,
+            token={
+                'access_token': token.access_token,
+                'refresh_token': token.refresh_token,
+                'expires_in': token.expires_in
+            },
+            raw_user_info=response
+        )
+        
     def refresh_token(self, refresh_token: str) -> AuthTokenResponse:
         """
         刷新访问令牌
@@ -137,12 +155,7 @@ class AuthCustomSource(BaseAuthSource):
         Returns:
             新的访问令牌
         """
-        params = {
-            'grant_type': 'refresh_token',
-            'refresh_token': refresh_token,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret
-        }
+        params = self._refresh_body(refresh_token)
         
         try:
             response = self.http_client.post(self.source.refresh_token_url, data=params)
@@ -165,6 +178,100 @@ class AuthCustomSource(BaseAuthSource):
         except Exception as e:
             return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}")
 
+    async def get_access_token_async(self, callback: AuthCallback) -> AuthTokenResponse:
+        """
+        异步获取访问令牌
+        
+        Args:
+            callback: 回调参数
+            
+        Returns:
+            访问令牌
+        """
+        if not callback.code:
+            return EMPTY_CODE_RESPONSE
+            
+        params = self._token_body(callback.code)
+        
+        try:
+            response = await self.async_http_client.post(self.source.access_token_url, data=params)
+            
+            if 'error' in response:
+                return AuthTokenResponse.failure(
+                    message=response.get('error_description', '获取访问令牌失败')
+                )
+                
+            token = AuthToken(
+                access_token=response.get('access_token'),
+                token_type=response.get('token_type'),
+                expires_in=response.get('expires_in', 7200),
+                refresh_token=response.get('refresh_token'),
+                scope=response.get('scope'),
+                code=callback.code
+            )
+            
+            return AuthTokenResponse.success(token)
+            
+        except Exception as e:
+            return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
+            
+    async def get_user_info_async(self, token: AuthToken, **kwargs) -> AuthUserResponse:
+        """
+        异步获取用户信息
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            用户信息
+        """
+        try:
+            headers = {'Authorization': token.authorization}
+            response = await self.async_http_client.get(self.source.user_info_url, headers=headers)
+            
+            if 'error' in response:
+                return AuthUserResponse.failure(response.get('error_description', '获取用户信息失败'))
+                
+            user = self._build_user(token, response)
+            
+            return AuthUserResponse.success(user)
+            
+        except Exception as e:
+            return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
+            
+    async def refresh_token_async(self, refresh_token: str) -> AuthTokenResponse:
+        """
+        异步刷新访问令牌
+        
+        Args:
+            refresh_token: 刷新令牌
+            
+        Returns:
+            新的访问令牌
+        """
+        params = self._refresh_body(refresh_token)
+        
+        try:
+            response = await self.async_http_client.post(self.source.refresh_token_url, data=params)
+            
+            if 'error' in response:
+                return AuthTokenResponse.failure(
+                    message=response.get('error_description', '刷新访问令牌失败')
+                )
+                
+            token = AuthToken(
+                access_token=response.get('access_token'),
+                token_type=response.get('token_type'),
+                expires_in=response.get('expires_in', 7200),
+                refresh_token=response.get('refresh_token'),
+                scope=response.get('scope')
+            )
+            
+            return AuthTokenResponse.success(token)
+            
+        except Exception as e:
+            return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}")
+
 
 def main():
     """
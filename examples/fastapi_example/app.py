@@ -1,15 +1,19 @@
 """
 使用FastAPI创建的OAuth登录示例
 """
+import asyncio
 import os
-from typing import Dict, Optional, List
+import traceback
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional, List
 
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from dotenv import load_dotenv
 import sys
 from pathlib import Path
@@ -21,13 +25,24 @@ import logging
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from senweaver_oauth import AuthConfig
+from senweaver_oauth.cache.memory import MemoryCacheStore
+from senweaver_oauth.http.shared import aclose_shared_clients
 from senweaver_oauth.source.wechat_mini import AuthWechatMiniSource
 
 # 加载环境变量
 load_dotenv()
 
 
-app = FastAPI(title="SenWeaver OAuth Example")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    应用生命周期：关闭时释放共享的HTTP连接池
+    """
+    yield
+    await aclose_shared_clients()
+
+
+app = FastAPI(title="SenWeaver OAuth Example", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # 配置模板
 templates = Jinja2Templates(directory="templates")
@@ -155,40 +170,93 @@ OAUTH_CONFIGS = {
     }
 }
 
-# 过滤掉未配置的平台
-def available_platforms() -> List[AuthSource]:    
-    result = []
-    for platform, config in OAUTH_CONFIGS.items():
-        if config["client_id"] and config["client_secret"]:
-            source = AuthDefaultSource.get_source(platform)
-            if source is None:
-                source = AuthSource(name=platform)
-            result.append(source)
+# 过滤掉未配置的平台，配置在启动后不再变化，只需计算一次
+_AVAILABLE_PLATFORMS: List[AuthSource] = [
+    AuthDefaultSource.get_source(platform) or AuthSource(name=platform)
+    for platform, config in OAUTH_CONFIGS.items()
+    if config["client_id"] and config["client_secret"]
+]
+
+# 已配置的平台名称
+_ENABLED_PLATFORMS = frozenset(
+    platform for platform, config in OAUTH_CONFIGS.items()
+    if config["client_id"] and config["client_secret"]
+)
+
+def available_platforms() -> List[AuthSource]:
+    return _AVAILABLE_PLATFORMS
+
+def check_platform(platform: str) -> None:
+    """
+    检查平台是否已支持并正确配置
+    """
+    if platform in _ENABLED_PLATFORMS:
+        return
+    if platform not in OAUTH_CONFIGS:
+        raise HTTPException(status_code=404, detail=f"未支持的平台: {platform}")
+    raise HTTPException(status_code=400, detail=f"平台 {platform} 未正确配置")
+
+def get_auth_request(platform: str):
+    """
+    获取平台的认证请求
+    AuthRequestBuilder会按认证配置缓存已构建的请求，重复调用不会重新创建认证源
+    """
+    config = OAUTH_CONFIGS[platform]
+    auth_config = AuthConfig(
+        client_id=config["client_id"],
+        client_secret=config["client_secret"],
+        redirect_uri=config["redirect_uri"],
+        extras=config.get("extras", {})
+    )
+    auth_request = AuthRequestBuilder.builder().source(platform).auth_config(auth_config).build()
+    if "source" in config:
+        auth_request.auth_source.source = config["source"]
+    return auth_request
+
+def user_to_dict(auth_user) -> Dict[str, Any]:
+    """
+    将用户信息转换为字典
+    """
+    return {
+        "uuid": auth_user.uuid,
+        "username": auth_user.username,
+        "nickname": auth_user.nickname,
+        "avatar": auth_user.avatar,
+        "email": auth_user.email,
+        "gender": auth_user.gender,
+        "source": auth_user.source
+    }
 
-    return result
+# 请求和响应模型的公共配置：忽略多余字段，创建后不可修改
+class FrozenModel(BaseModel):
+    model_config = ConfigDict(extra='ignore', frozen=True)
 
 # 响应模型
-class OAuthResponse(BaseModel):
+class OAuthResponse(FrozenModel):
     code: int
     message: str
     data: Optional[Dict] = None
 
 # 请求模型
-class WechatMiniLoginRequest(BaseModel):
+class WechatMiniLoginRequest(FrozenModel):
     code: str
 
-class WechatMiniUserInfoRequest(BaseModel):
+class WechatMiniUserInfoRequest(FrozenModel):
     session_id: str
     encrypted_data: str
     iv: str
 
-class WechatMiniOneStepLoginRequest(BaseModel):
+class WechatMiniOneStepLoginRequest(FrozenModel):
     code: str
     encrypted_data: str
     iv: str
 
-# 简单会话存储
-wechat_mini_sessions = {}
+class BatchCallbackRequest(FrozenModel):
+    platform: str
+    params: Dict[str, Any]
+
+# 小程序会话存储，会话随session_key一起过期（默认2小时）
+wechat_mini_sessions = MemoryCacheStore(maxsize=100000, ttl=7200)
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
@@ -209,25 +277,11 @@ async def auth(platform: str):
     """
     认证
     """
-    if platform not in OAUTH_CONFIGS:
-        raise HTTPException(status_code=404, detail=f"未支持的平台: {platform}")
-    
-    config = OAUTH_CONFIGS[platform]
-    if not config["client_id"] or not config["client_secret"]:
-        raise HTTPException(status_code=400, detail=f"平台 {platform} 未正确配置")
+    check_platform(platform)
     
     # 创建授权请求
     try:
-        auth_config = AuthConfig(
-            client_id=config["client_id"],
-            client_secret=config["client_secret"],
-            redirect_uri=config["redirect_uri"],
-            extras=config.get("extras", {})
-        )
-        # 使用AuthRequestBuilder构建请求        
-        auth_request = AuthRequestBuilder.builder().source(platform).auth_config(auth_config).build()
-        if "source" in config:
-            auth_request.auth_source.source = config["source"]
+        auth_request = get_auth_request(platform)
         auth_url = auth_request.authorize()
 
         return RedirectResponse(auth_url)
@@ -240,29 +294,18 @@ async def callback(platform: str, request: Request):
     """
     回调
     """
-    if platform not in OAUTH_CONFIGS:
-        raise HTTPException(status_code=404, detail=f"未支持的平台: {platform}")
+    check_platform(platform)
     
-    config = OAUTH_CONFIGS[platform]
     params = dict(request.query_params)
     
     try:
-        auth_config = AuthConfig(
-            client_id=config["client_id"],
-            client_secret=config["client_secret"],
-            redirect_uri=config["redirect_uri"],
-            extras=config.get("extras", {})
-        )
-        # 使用AuthRequestBuilder构建请求
-        auth_request = AuthRequestBuilder.builder().source(platform).auth_config(auth_config).build()
-        if "source" in config:
-            auth_request.auth_source.source = config["source"]
+        auth_request = get_auth_request(platform)
         # 打印调试信息
         logger.info(f"Platform: {platform}")
         logger.info(f"Callback params: {params}")
         
         # 调用登录方法
-        auth_user_response = auth_request.login(params)
+        auth_user_response = await auth_request.login_async(params)
         
         # 检查响应状态
         if auth_user_response.code != 200 or not auth_user_response.data:
@@ -275,29 +318,42 @@ async def callback(platform: str, request: Request):
             # 调整到服务页面
             return RedirectResponse(auth_user_response.data.service_url)
         
-        # 获取用户信息并转换为字典
-        auth_user = auth_user_response.data
-        user_dict = {
-            "uuid": auth_user.uuid,
-            "username": auth_user.username,
-            "nickname": auth_user.nickname,
-            "avatar": auth_user.avatar,
-            "email": auth_user.email,
-            "gender": auth_user.gender,
-            "source": auth_user.source
-        }
-        
         # 返回用户信息
         return {
             "platform": platform,
-            "user": user_dict,
+            "user": user_to_dict(auth_user_response.data),
         }
     except Exception as e:
         logger.error(f"处理回调失败: {str(e)}")
-        import traceback
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"处理回调失败: {str(e)}")
 
+@app.post("/auth/batch")
+async def batch_callback(items: List[BatchCallbackRequest]):
+    """
+    批量回调
+    同一用户关联多个平台时，一次提交多个平台的回调参数，并发完成登录
+    所有请求共享同一个异步HTTP客户端的连接池
+    """
+    for item in items:
+        check_platform(item.platform)
+    
+    results = await asyncio.gather(
+        *[get_auth_request(item.platform).login_async(item.params) for item in items],
+        return_exceptions=True
+    )
+    
+    response = []
+    for item, result in zip(items, results):
+        if isinstance(result, Exception):
+            logger.error(f"处理回调失败: {item.platform}: {str(result)}")
+            response.append({"platform": item.platform, "error": f"处理回调失败: {str(result)}", "code": 500})
+        elif result.code != 200 or not result.data:
+            response.append({"platform": item.platform, "error": result.message or "登录失败", "code": result.code})
+        else:
+            response.append({"platform": item.platform, "user": user_to_dict(result.data)})
+    return response
+
 @app.post("/api/login/wechat_mini", response_model=OAuthResponse)
 async def wechat_mini_login(request: WechatMiniOneStepLoginRequest):
     """
@@ -321,16 +377,15 @@ async def wechat_mini_login(request: WechatMiniOneStepLoginRequest):
     auth_source = AuthWechatMiniSource(auth_config)
 
     params = request.model_dump()
-    user_response = auth_source.login(params)
+    user_response = await auth_source.login_async(params)
     if user_response.code != 200:
         return OAuthResponse(
             code=user_response.code,
             message=user_response.message
         )    
     # 生成会话ID
-    import uuid
-    session_id = str(uuid.uuid4())
-    wechat_mini_sessions[session_id] = user_response.data.token
+    session_id = uuid.uuid4().hex
+    wechat_mini_sessions.set(session_id, user_response.data.token)
 
     auth_user = user_response.data
     user_dict = {
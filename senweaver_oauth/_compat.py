@@ -0,0 +1,93 @@
+"""
+兼容性工具
+
+按需使用可选依赖，未安装时回退到标准库实现
+"""
+import json
+import sys
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+# Python 3.10+ 的dataclass支持slots参数，旧版本退化为普通dataclass
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    解析JSON数据，安装了orjson时使用orjson
+
+    Args:
+        data: JSON字符串或字节串
+
+    Returns:
+        解析后的数据
+
+    Raises:
+        ValueError: 数据不是合法的JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> bytes:
+    """
+    序列化为JSON字节串，安装了orjson时使用orjson
+    无法直接序列化的类型（如datetime、UUID）会转换为字符串；
+    与标准库一致，字典中整数、None等非字符串的键转换为字符串
+
+    Args:
+        value: 需要序列化的数据
+
+    Returns:
+        JSON字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str).encode('utf-8')
+
+
+def msgpack_dumps(value: Any) -> bytes:
+    """
+    序列化为msgpack字节串
+    无法直接序列化的类型（如datetime、UUID）会转换为字符串
+
+    Args:
+        value: 需要序列化的数据
+
+    Returns:
+        msgpack字节串
+
+    Raises:
+        ImportError: 未安装msgpack
+    """
+    if msgpack is None:
+        raise ImportError("使用msgpack编码需要安装msgpack: pip install senweaver-oauth[msgpack]")
+    return msgpack.packb(value, use_bin_type=True, default=str)
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """
+    解析msgpack数据
+
+    Args:
+        data: msgpack字节串
+
+    Returns:
+        解析后的数据
+
+    Raises:
+        ImportError: 未安装msgpack
+    """
+    if msgpack is None:
+        raise ImportError("解析msgpack数据需要安装msgpack: pip install senweaver-oauth[msgpack]")
+    return msgpack.unpackb(data, raw=False)
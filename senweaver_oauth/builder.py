@@ -1,14 +1,64 @@
 """
 认证请求构建器
 """
-from typing import Optional, List, Callable, Type
+import importlib
+import pkgutil
+from functools import lru_cache
+from typing import Optional, List, Callable, Type, FrozenSet
 
+from senweaver_oauth.cache.base import CacheStore
+from senweaver_oauth.cache.default import DefaultCacheStore
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_source import AuthSource, AuthDefaultSource
+from senweaver_oauth.http.http_client import HttpClient
+from senweaver_oauth.http.shared import get_shared_client
 from senweaver_oauth.request import AuthRequest
+from senweaver_oauth import source as _source_package
 from senweaver_oauth.source.base import BaseAuthSource
 
 
+# source包中的平台模块名，只列出模块不导入，模块名与平台名称一致
+_SOURCE_MODULES: FrozenSet[str] = frozenset(
+    module_info.name for module_info in pkgutil.iter_modules(_source_package.__path__)
+    if module_info.name != 'base'
+)
+
+
+@lru_cache(maxsize=None)
+def _load_source_class(source_name: str) -> Optional[Type[BaseAuthSource]]:
+    """
+    按平台名称导入认证源类，只有实际使用的平台才会导入对应模块
+    类名为Auth + 驼峰式模块名 + Source，例如wechat_open -> AuthWechatOpenSource
+    
+    Args:
+        source_name: 平台名称，小写
+        
+    Returns:
+        认证源类，如果不存在则返回None
+    """
+    if source_name not in _SOURCE_MODULES:
+        return None
+    class_name = f"Auth{''.join(p.title() for p in source_name.split('_'))}Source"
+    module = importlib.import_module(f"{_source_package.__name__}.{source_name}")
+    return getattr(module, class_name, None)
+
+
+@lru_cache(maxsize=256)
+def _get_or_build(auth_source_class: Type[BaseAuthSource], http_client: HttpClient,
+                  config: AuthConfig, cache_store: CacheStore) -> AuthRequest:
+    """
+    按(认证源类, HTTP客户端, 认证配置, 缓存存储)缓存认证请求实例
+    缓存存储和HTTP客户端是构建时的默认实例，替换默认实例后会重新构建，不会沿用旧实例
+    
+    Returns:
+        认证请求实例
+    """
+    auth_source = auth_source_class(config)
+    auth_source.http_client = http_client
+    auth_source.cache_store = cache_store
+    return AuthRequest(auth_source)
+
+
 class AuthRequestBuilder:
     """
     认证请求构建器
@@ -23,6 +73,7 @@ class AuthRequestBuilder:
         self._auth_config: Optional[AuthConfig] = None
         self._auth_config_function: Optional[Callable[[str], AuthConfig]] = None
         self._extend_sources: List[Type[AuthSource]] = []
+        self._http_client: Optional[HttpClient] = None
         
     @classmethod
     def builder(cls) -> 'AuthRequestBuilder':
@@ -86,9 +137,32 @@ class AuthRequestBuilder:
         self._extend_sources = sources
         return self
         
+    def http_client(self, client: HttpClient) -> 'AuthRequestBuilder':
+        """
+        设置HTTP客户端
+        
+        Args:
+            client: HTTP客户端，不设置时使用进程内共享的客户端
+            
+        Returns:
+            构建器实例
+        """
+        self._http_client = client
+        return self
+        
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        清空已构建的认证请求缓存
+        替换默认缓存存储或共享HTTP客户端后会自动重新构建，无需调用；
+        可用于释放不再使用的认证配置对应的认证请求
+        """
+        _get_or_build.cache_clear()
+        
     def build(self) -> AuthRequest:
         """
         构建认证请求
+        相同认证源和认证配置会复用已构建的认证请求实例
         
         Returns:
             认证请求实例
@@ -109,11 +183,9 @@ class AuthRequestBuilder:
         if not auth_source_class:
             raise ValueError(f"未找到认证源类: {self._source}")
             
-        # 创建认证源实例
-        auth_source = auth_source_class(config)
-        
-        # 创建认证请求
-        return AuthRequest(auth_source)
+        # 创建或复用认证请求，未指定HTTP客户端时使用进程内共享的客户端
+        http_client = self._http_client or get_shared_client()
+        return _get_or_build(auth_source_class, http_client, config, DefaultCacheStore.get_instance())
         
     def _get_auth_config(self) -> AuthConfig:
         """
@@ -156,48 +228,4 @@ class AuthRequestBuilder:
         Returns:
             认证源类，如果不存在则返回None
         """
-        # 根据认证源名称获取对应的认证源类
-        source_name = self._source.lower()
-        
-        # 标准方式：将下划线转为驼峰式，首字母大写
-        parts = source_name.split('_')
-        class_name = ''.join(p.title() for p in parts)
-        
-        # 尝试直接从source目录导入模块
-        try:
-            import importlib
-            import sys
-            
-            # 打印调试信息
-            print(f"尝试导入模块: senweaver_oauth.source.{source_name}")
-            print(f"期望的类名: Auth{class_name}Source")
-            
-            # 列出所有已加载的模块
-            loaded_modules = [m for m in sys.modules.keys() if m.startswith('senweaver_oauth.source')]
-            print(f"已加载的source模块: {loaded_modules}")
-            
-            # 尝试导入模块
-            module = importlib.import_module(f"senweaver_oauth.source.{source_name}")
-            
-            # 列出模块中的所有类
-            module_attrs = dir(module)
-            source_classes = [attr for attr in module_attrs if attr.startswith('Auth') and attr.endswith('Source')]
-            print(f"模块中的认证源类: {source_classes}")
-            
-            # 获取指定的类
-            source_class = getattr(module, f"Auth{class_name}Source")
-            print(f"找到认证源类: {source_class.__name__}")
-            
-            return source_class
-        except Exception as e:
-            import traceback
-            print(f"导入认证源类失败: {e}")
-            print(traceback.format_exc())
-            
-            # 尝试第二种方式导入
-            try:
-                module = importlib.import_module(f"senweaver_oauth.source.auth_{source_name}_source")
-                return getattr(module, f"Auth{class_name}Source")
-            except Exception as e2:
-                print(f"第二种方式导入失败: {e2}")
-                return None 
\ No newline at end of file
+        return _load_source_class(self._source.lower())
@@ -6,10 +6,12 @@ from senweaver_oauth.cache.base import CacheStore
 from senweaver_oauth.cache.default import DefaultCacheStore
 from senweaver_oauth.cache.memory import MemoryCacheStore
 from senweaver_oauth.cache.redis import RedisCacheStore
+from senweaver_oauth.cache.redis_async import AsyncRedisCacheStore
 
 __all__ = [
     'CacheStore',
     'DefaultCacheStore',
     'MemoryCacheStore',
-    'RedisCacheStore'
+    'RedisCacheStore',
+    'AsyncRedisCacheStore'
 ] 
\ No newline at end of file
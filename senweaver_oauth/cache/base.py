@@ -2,7 +2,7 @@
 缓存存储接口
 """
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 
 class CacheStore(ABC):
@@ -50,4 +50,58 @@ class CacheStore(ABC):
         """
         清空缓存
         """
-        pass 
\ No newline at end of file
+        pass 
+        
+    def set_if_absent(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """
+        仅在键不存在时设置缓存
+        默认先get再set，不保证原子性，存储可以重写此方法提供原子实现
+        
+        Args:
+            key: 缓存键
+            value: 缓存值
+            timeout: 过期时间，单位：秒，None表示使用默认过期时间
+            
+        Returns:
+            是否设置成功
+        """
+        if self.get(key) is not None:
+            return False
+        self.set(key, value, timeout)
+        return True
+        
+    def mget(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        批量获取缓存
+        默认逐个调用get，支持批量操作的存储可以重写此方法
+        
+        Args:
+            keys: 缓存键列表
+            
+        Returns:
+            缓存值列表，顺序与keys一致，不存在的键对应None
+        """
+        return [self.get(key) for key in keys]
+        
+    def mset(self, mapping: Dict[str, Any], timeout: Optional[int] = None) -> None:
+        """
+        批量设置缓存
+        默认逐个调用set，支持批量操作的存储可以重写此方法
+        
+        Args:
+            mapping: 缓存键到缓存值的映射
+            timeout: 过期时间，单位：秒，None表示使用默认过期时间
+        """
+        for key, value in mapping.items():
+            self.set(key, value, timeout)
+            
+    def mdelete(self, keys: Iterable[str]) -> None:
+        """
+        批量删除缓存
+        默认逐个调用delete，支持批量操作的存储可以重写此方法
+        
+        Args:
+            keys: 缓存键列表
+        """
+        for key in keys:
+            self.delete(key)
@@ -1,28 +1,51 @@
 """
 内存缓存存储实现
 """
-from typing import Any, Optional
-
-from cachetools import TTLCache
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
 
 from senweaver_oauth.cache.base import CacheStore
 
+# 分片数量，必须为2的幂
+_SHARD_COUNT = 16
+
 
 class MemoryCacheStore(CacheStore):
     """
     内存缓存存储实现
+    缓存按键的哈希值分布到多个分片中，每个分片使用独立的锁，减少并发访问时的锁竞争；
+    分片写满时淘汰最近最少使用的缓存，过期的缓存在读取时或排到淘汰队首时删除
     """
     
-    def __init__(self, maxsize: int = 1000, ttl: int = 180):
+    def __init__(self, maxsize: int = 1000, ttl: int = 180,
+                 timer: Callable[[], float] = time.monotonic):
         """
         初始化
         
         Args:
             maxsize: 最大缓存数量
             ttl: 默认过期时间，单位：秒
+            timer: 计时函数，返回单调递增的秒数，可以替换为低精度的时钟以减少系统调用
         """
+        self.maxsize = maxsize
         self.ttl = ttl
-        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.timer = timer
+        self._shard_maxsize = max(1, -(-maxsize // _SHARD_COUNT))
+        self._shards = [(OrderedDict(), threading.Lock()) for _ in range(_SHARD_COUNT)]
+        
+    def _get_shard(self, key: str):
+        """
+        获取键所在的分片
+        
+        Args:
+            key: 缓存键
+        
+        Returns:
+            (按访问顺序排列的缓存字典, 锁)
+        """
+        return self._shards[hash(key) & (_SHARD_COUNT - 1)]
         
     def get(self, key: str) -> Optional[Any]:
         """
@@ -30,11 +53,22 @@ class MemoryCacheStore(CacheStore):
         
         Args:
             key: 缓存键
-            
+        
         Returns:
             缓存值，如果不存在则返回None
         """
-        return self.cache.get(key)
+        data, lock = self._get_shard(key)
+        with lock:
+            item = data.get(key)
+            if item is None:
+                return None
+            expire, value = item
+            if self.timer() >= expire:
+                # 惰性删除过期的缓存
+                del data[key]
+                return None
+            data.move_to_end(key)
+            return value
         
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
         """
@@ -45,9 +79,52 @@ class MemoryCacheStore(CacheStore):
             value: 缓存值
             timeout: 过期时间，单位：秒，None表示使用默认过期时间
         """
-        # 如果指定了过期时间，则使用指定的过期时间
-        ttl = timeout or self.ttl
-        self.cache[key] = value
+        now = self.timer()
+        data, lock = self._get_shard(key)
+        with lock:
+            self._put(data, key, value, now, timeout)
+        
+    def set_if_absent(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """
+        仅在键不存在或已过期时设置缓存，在分片锁内原子完成
+        
+        Args:
+            key: 缓存键
+            value: 缓存值
+            timeout: 过期时间，单位：秒，None表示使用默认过期时间
+            
+        Returns:
+            是否设置成功
+        """
+        now = self.timer()
+        data, lock = self._get_shard(key)
+        with lock:
+            item = data.get(key)
+            if item is not None and now < item[0]:
+                return False
+            self._put(data, key, value, now, timeout)
+            return True
+        
+    def _put(self, data: OrderedDict, key: str, value: Any, now: float, timeout: Optional[int]) -> None:
+        """
+        写入分片，调用方需持有分片锁
+        
+        Args:
+            data: 分片的缓存字典
+            key: 缓存键
+            value: 缓存值
+            now: 当前时间
+            timeout: 过期时间，单位：秒，None表示使用默认过期时间
+        """
+        if key in data:
+            data.move_to_end(key)
+        elif len(data) >= self._shard_maxsize:
+            # 分片已满时淘汰最近最少使用的缓存，并顺带删除队首已过期的缓存；
+            # 不遍历整个分片，每个缓存最多被删除一次，写入的均摊开销为O(1)
+            data.popitem(last=False)
+            while data and next(iter(data.values()))[0] <= now:
+                data.popitem(last=False)
+        data[key] = (now + (timeout or self.ttl), value)
         
     def delete(self, key: str) -> None:
         """
@@ -56,11 +133,14 @@ class MemoryCacheStore(CacheStore):
         Args:
             key: 缓存键
         """
-        if key in self.cache:
-            del self.cache[key]
+        data, lock = self._get_shard(key)
+        with lock:
+            data.pop(key, None)
         
     def clear(self) -> None:
         """
         清空缓存
         """
-        self.cache.clear() 
\ No newline at end of file
+        for data, lock in self._shards:
+            with lock:
+                data.clear()
@@ -1,11 +1,24 @@
 """
 Redis缓存存储实现
 """
-import json
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from senweaver_oauth._compat import json_dumps, json_loads, msgpack_dumps, msgpack_loads
 from senweaver_oauth.cache.base import CacheStore
 
+# JSON值可能的首字符
+_JSON_FIRST_CHARS = frozenset('{["tfn-0123456789')
+_JSON_FIRST_BYTES = frozenset(c.encode('ascii') for c in _JSON_FIRST_CHARS)
+
+# msgpack编码值的标记字节，使用控制字符，不会与JSON或普通文本冲突
+_MSGPACK_TAG = b'\x01'
+
+# 支持的复杂对象编码方式
+_CODECS = ('json', 'msgpack')
+
+# 直接写入Redis、不需要编码的类型
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
 
 class RedisCacheStore(CacheStore):
     """
@@ -13,75 +26,141 @@ class RedisCacheStore(CacheStore):
     
     使用Redis作为缓存存储，支持过期时间
     """
+    # clear时每次SCAN的数量
+    _SCAN_COUNT = 500
+    # clear时管道中累积的UNLINK批次数
+    _PIPELINE_BATCHES = 10
     
-    def __init__(self, redis_client, prefix: str = "senweaver:", ttl: int = 180):
+    def __init__(self, redis_client=None, prefix: str = "senweaver:", ttl: int = 180, *,
+                 url: Optional[str] = None, max_connections: int = 8, codec: str = 'json'):
         """
         初始化
         
         Args:
-            redis_client: Redis客户端实例
+            redis_client: Redis客户端实例，为None时根据url创建
             prefix: 缓存键前缀，用于区分不同应用的缓存
             ttl: 默认过期时间，单位：秒
+            url: Redis连接地址，例如redis://localhost:6379/0
+            max_connections: 根据url创建客户端时连接池的最大连接数，OAuth回调的并发度通常不高，较小的连接池即可
+            codec: 复杂对象的编码方式，json或msgpack；msgpack编码的值带有标记字节，
+                   读取时自动识别，切换编码方式后已有数据仍可读取
+            
+        Raises:
+            ValueError: redis_client和url均未提供，或编码方式不支持
         """
+        if codec not in _CODECS:
+            raise ValueError(f"不支持的编码方式: {codec}")
+        if redis_client is None:
+            if not url:
+                raise ValueError("redis_client和url不能同时为空")
+            import redis as redis_module
+            # 不解码响应，直接将原始字节交给JSON解析
+            redis_client = redis_module.Redis(
+                connection_pool=redis_module.ConnectionPool.from_url(
+                    url, max_connections=max_connections, decode_responses=False
+                )
+            )
         self.redis = redis_client
         self.prefix = prefix
+        # 键前缀预先编码为字节串，各方法中直接拼接完整的键交给redis-py，省去其内部的编码
+        self._prefix_b = prefix.encode('utf-8')
         self.ttl = ttl
+        self.codec = codec
     
-    def _get_key(self, key: str) -> str:
+    @staticmethod
+    def _dumps(value: Any, codec: str = 'json') -> Any:
         """
-        获取完整的缓存键
+        序列化缓存值，复杂对象按编码方式转换为JSON或带标记字节的msgpack
         
         Args:
-            key: 缓存键
+            value: 缓存值
+            codec: 编码方式
             
         Returns:
-            完整的缓存键
+            写入Redis的值
         """
-        return f"{self.prefix}{key}"
-    
-    def get(self, key: str) -> Optional[Any]:
+        # 按精确类型判断，子类按复杂对象编码
+        if type(value) not in _PRIMITIVE_TYPES:
+            if codec == 'msgpack':
+                return _MSGPACK_TAG + msgpack_dumps(value)
+            return json_dumps(value)
+        return value
+        
+    @staticmethod
+    def _loads(value: Any) -> Optional[Any]:
         """
-        获取缓存
+        反序列化缓存值
         
         Args:
-            key: 缓存键
+            value: Redis返回的值
             
         Returns:
-            缓存值，如果不存在则返回None
+            缓存值，带msgpack标记或能解析为JSON时返回解析结果，否则返回原始文本
         """
-        full_key = self._get_key(key)
-        value = self.redis.get(full_key)
-        
         if value is None:
             return None
         
+        # 首字符不可能开始JSON的值直接作为文本返回，避免解析失败抛出异常
+        if isinstance(value, bytes):
+            if value[:1] == _MSGPACK_TAG:
+                return msgpack_loads(value[1:])
+            if value[:1] not in _JSON_FIRST_BYTES:
+                return value.decode('utf-8')
+        elif isinstance(value, str) and value[:1] not in _JSON_FIRST_CHARS:
+            return value
+        
         try:
             # 尝试解析为JSON
-            return json.loads(value)
-        except (TypeError, json.JSONDecodeError):
+            return json_loads(value)
+        except (TypeError, ValueError):
             # 如果不是JSON，则返回原始值
             if isinstance(value, bytes):
                 return value.decode('utf-8')
             return value
     
-    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+    def get(self, key: str) -> Optional[Any]:
+        """
+        获取缓存
+        
+        Args:
+            key: 缓存键
+            
+        Returns:
+            缓存值，如果不存在则返回None
+        """
+        return self._loads(self.redis.get(self._prefix_b + key.encode('utf-8')))
+    
+    def set(self, key: str, value: Any, timeout: Optional[int] = None, nx: bool = False) -> Optional[bool]:
         """
         设置缓存
         
         Args:
             key: 缓存键
             value: 缓存值
-            timeout: 过期时间，单位：秒，None表示使用默认过期时间
+            timeout: 过期时间，单位：秒，None表示使用默认过期时间，0表示永不过期
+            nx: 为True时仅在键不存在时设置
+            
+        Returns:
+            redis-py的返回值，nx为True且键已存在时为None
         """
-        full_key = self._get_key(key)
         ttl = timeout if timeout is not None else self.ttl
         
-        # 如果是复杂对象，则转换为JSON字符串
-        if not isinstance(value, (str, int, float, bool, bytes)) and value is not None:
-            value = json.dumps(value)
+        # 设置缓存，有过期时间时在同一条SET命令中指定
+        return self.redis.set(self._prefix_b + key.encode('utf-8'), self._dumps(value, self.codec), ex=ttl or None, nx=nx)
+    
+    def set_if_absent(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """
+        仅在键不存在时设置缓存，使用一条SET NX命令原子完成
         
-        # 设置缓存，并指定过期时间
-        self.redis.set(full_key, value, ex=ttl)
+        Args:
+            key: 缓存键
+            value: 缓存值
+            timeout: 过期时间，单位：秒，None表示使用默认过期时间
+            
+        Returns:
+            是否设置成功
+        """
+        return bool(self.set(key, value, timeout, nx=True))
     
     def delete(self, key: str) -> None:
         """
@@ -90,15 +169,74 @@ class RedisCacheStore(CacheStore):
         Args:
             key: 缓存键
         """
-        full_key = self._get_key(key)
-        self.redis.delete(full_key)
+        self.redis.delete(self._prefix_b + key.encode('utf-8'))
+    
+    def mget(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        批量获取缓存，使用一次MGET完成
+        
+        Args:
+            keys: 缓存键列表
+            
+        Returns:
+            缓存值列表，顺序与keys一致，不存在的键对应None
+        """
+        prefix = self._prefix_b
+        full_keys = [prefix + key.encode('utf-8') for key in keys]
+        if not full_keys:
+            return []
+        loads = self._loads
+        return [loads(value) for value in self.redis.mget(full_keys)]
+    
+    def mset(self, mapping: Dict[str, Any], timeout: Optional[int] = None) -> None:
+        """
+        批量设置缓存，使用管道在一次网络往返中完成
+        
+        Args:
+            mapping: 缓存键到缓存值的映射
+            timeout: 过期时间，单位：秒，None表示使用默认过期时间
+        """
+        if not mapping:
+            return
+        ttl = timeout if timeout is not None else self.ttl
+        prefix, dumps, codec, ex = self._prefix_b, self._dumps, self.codec, ttl or None
+        pipe = self.redis.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipe.set(prefix + key.encode('utf-8'), dumps(value, codec), ex=ex)
+        pipe.execute()
+    
+    def mdelete(self, keys: Iterable[str]) -> None:
+        """
+        批量删除缓存，使用一次UNLINK完成
+        
+        Args:
+            keys: 缓存键列表
+        """
+        prefix = self._prefix_b
+        full_keys = [prefix + key.encode('utf-8') for key in keys]
+        if full_keys:
+            self.redis.unlink(*full_keys)
     
     def clear(self) -> None:
         """
         清空缓存
         
         注意：此方法会清空所有以prefix开头的键
+        使用SCAN分批遍历，避免KEYS阻塞Redis；使用UNLINK由Redis异步释放内存
         """
-        keys = self.redis.keys(f"{self.prefix}*")
-        if keys:
-            self.redis.delete(*keys) 
\ No newline at end of file
+        pipe = self.redis.pipeline(transaction=False)
+        pending = 0
+        cursor = 0
+        while True:
+            cursor, keys = self.redis.scan(cursor=cursor, match=f"{self.prefix}*", count=self._SCAN_COUNT)
+            if keys:
+                pipe.unlink(*keys)
+                pending += 1
+                # 每积累一定批次执行一次，避免管道过大
+                if pending >= self._PIPELINE_BATCHES:
+                    pipe.execute()
+                    pending = 0
+            if cursor == 0:
+                break
+        if pending:
+            pipe.execute() 
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""
+异步Redis缓存存储实现
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from senweaver_oauth.cache.redis import _CODECS, RedisCacheStore
+
+
+class AsyncRedisCacheStore:
+    """
+    异步Redis缓存存储实现
+    
+    基于redis.asyncio，接口与RedisCacheStore一致，所有方法均为协程，
+    在ASGI应用中与访问第三方平台的HTTP请求并发执行
+    """
+    # clear时每次SCAN的数量
+    _SCAN_COUNT = RedisCacheStore._SCAN_COUNT
+    # clear时管道中累积的UNLINK批次数
+    _PIPELINE_BATCHES = RedisCacheStore._PIPELINE_BATCHES
+    
+    def __init__(self, redis_client=None, prefix: str = "senweaver:", ttl: int = 180, *,
+                 url: Optional[str] = None, max_connections: int = 8, codec: str = 'json'):
+        """
+        初始化
+        
+        Args:
+            redis_client: redis.asyncio.Redis客户端实例，为None时根据url创建
+            prefix: 缓存键前缀，用于区分不同应用的缓存
+            ttl: 默认过期时间，单位：秒
+            url: Redis连接地址，例如redis://localhost:6379/0
+            max_connections: 根据url创建客户端时连接池的最大连接数，OAuth回调的并发度通常不高，较小的连接池即可
+            codec: 复杂对象的编码方式，json或msgpack
+            
+        Raises:
+            ValueError: redis_client和url均未提供，或编码方式不支持
+        """
+        if codec not in _CODECS:
+            raise ValueError(f"不支持的编码方式: {codec}")
+        if redis_client is None:
+            if not url:
+                raise ValueError("redis_client和url不能同时为空")
+            import redis.asyncio as redis_module
+            # 不解码响应，直接将原始字节交给JSON解析
+            redis_client = redis_module.Redis(
+                connection_pool=redis_module.ConnectionPool.from_url(
+                    url, max_connections=max_connections, decode_responses=False
+                )
+            )
+        self.redis = redis_client
+        self.prefix = prefix
+        self._prefix_b = prefix.encode('utf-8')
+        self.ttl = ttl
+        self.codec = codec
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        获取缓存
+        
+        Args:
+            key: 缓存键
+            
+        Returns:
+            缓存值，如果不存在则返回None
+        """
+        return RedisCacheStore._loads(await self.redis.get(self._prefix_b + key.encode('utf-8')))
+    
+    async def set(self, key: str, value: Any, timeout: Optional[int] = None, nx: bool = False) -> Optional[bool]:
+        """
+        设置缓存
+        
+        Args:
+            key: 缓存键
+            value: 缓存值
+            timeout: 过期时间，单位：秒，None表示使用默认过期时间，0表示永不过期
+            nx: 为True时仅在键不存在时设置
+            
+        Returns:
+            redis-py的返回值，nx为True且键已存在时为None
+        """
+        ttl = timeout if timeout is not None else self.ttl
+        return await self.redis.set(
+            self._prefix_b + key.encode('utf-8'), RedisCacheStore._dumps(value, self.codec), ex=ttl or None, nx=nx
+        )
+    
+    async def set_if_absent(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """
+        仅在键不存在时设置缓存，使用一条SET NX命令原子完成
+        
+        Args:
+            key: 缓存键
+            value: 缓存值
+            timeout: 过期时间，单位：秒，None表示使用默认过期时间
+            
+        Returns:
+            是否设置成功
+        """
+        return bool(await self.set(key, value, timeout, nx=True))
+    
+    async def delete(self, key: str) -> None:
+        """
+        删除缓存
+        
+        Args:
+            key: 缓存键
+        """
+        await self.redis.delete(self._prefix_b + key.encode('utf-8'))
+    
+    async def mget(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """
+        批量获取缓存，使用一次MGET完成
+        
+        Args:
+            keys: 缓存键列表
+            
+        Returns:
+            缓存值列表，顺序与keys一致，不存在的键对应None
+        """
+        prefix = self._prefix_b
+        full_keys = [prefix + key.encode('utf-8') for key in keys]
+        if not full_keys:
+            return []
+        loads = RedisCacheStore._loads
+        return [loads(value) for value in await self.redis.mget(full_keys)]
+    
+    async def mset(self, mapping: Dict[str, Any], timeout: Optional[int] = None) -> None:
+        """
+        批量设置缓存，使用管道在一次网络往返中完成
+        
+        Args:
+            mapping: 缓存键到缓存值的映射
+            timeout: 过期时间，单位：秒，None表示使用默认过期时间
+        """
+        if not mapping:
+            return
+        ttl = timeout if timeout is not None else self.ttl
+        prefix, dumps, codec, ex = self._prefix_b, RedisCacheStore._dumps, self.codec, ttl or None
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(prefix + key.encode('utf-8'), dumps(value, codec), ex=ex)
+            await pipe.execute()
+    
+    async def mdelete(self, keys: Iterable[str]) -> None:
+        """
+        批量删除缓存，使用一次UNLINK完成
+        
+        Args:
+            keys: 缓存键列表
+        """
+        prefix = self._prefix_b
+        full_keys = [prefix + key.encode('utf-8') for key in keys]
+        if full_keys:
+            await self.redis.unlink(*full_keys)
+    
+    async def clear(self) -> None:
+        """
+        清空缓存
+        
+        注意：此方法会清空所有以prefix开头的键
+        使用SCAN分批遍历，避免KEYS阻塞Redis；使用UNLINK由Redis异步释放内存
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pending = 0
+            cursor = 0
+            while True:
+                cursor, keys = await self.redis.scan(cursor=cursor, match=f"{self.prefix}*", count=self._SCAN_COUNT)
+                if keys:
+                    pipe.unlink(*keys)
+                    pending += 1
+                    # 每积累一定批次执行一次，避免管道过大
+                    if pending >= self._PIPELINE_BATCHES:
+                        await pipe.execute()
+                        pending = 0
+                if cursor == 0:
+                    break
+            if pending:
+                await pipe.execute()
@@ -4,11 +4,15 @@ AuthConfig - OAuth认证配置类
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Any
 
+from senweaver_oauth._compat import DATACLASS_SLOTS
+from senweaver_oauth.utils import validate_http_url
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AuthConfig:
     """
     OAuth认证配置类
+    创建后不可修改，可以直接作为缓存的键（extras不参与哈希，但参与相等比较）
     """
     client_id: str
     client_secret: str
@@ -20,13 +24,30 @@ class AuthConfig:
     user_info_endpoint: Optional[str] = None
     access_token_endpoint: Optional[str] = None
     refresh_token_endpoint: Optional[str] = None
-    extras: Dict[str, Any] = field(default_factory=dict)
+    extras: Dict[str, Any] = field(default_factory=dict, hash=False)
     
     def __post_init__(self):
         """
         初始化后的处理
         """
-        if not self.client_id:
-            raise ValueError("client_id不能为空")
-        if not self.client_secret:
-            raise ValueError("client_secret不能为空")
\ No newline at end of file
+        _validate(self)
+
+
+def _validate(config: AuthConfig) -> None:
+    """
+    校验认证配置，只在创建时执行一次
+    
+    Args:
+        config: 认证配置
+        
+    Raises:
+        ValueError: 必填参数为空或平台接口地址格式不正确
+    """
+    if not config.client_id:
+        raise ValueError("client_id不能为空")
+    if not config.client_secret:
+        raise ValueError("client_secret不能为空")
+    # redirect_uri可以是原生应用的自定义协议（RFC 8252），只校验平台接口地址
+    validate_http_url('user_info_endpoint', config.user_info_endpoint)
+    validate_http_url('access_token_endpoint', config.access_token_endpoint)
+    validate_http_url('refresh_token_endpoint', config.refresh_token_endpoint)
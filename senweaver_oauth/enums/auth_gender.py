@@ -2,7 +2,7 @@
 用户性别枚举
 """
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 
 
 class AuthGender(Enum):
@@ -14,26 +14,38 @@ class AuthGender(Enum):
     FEMALE = 2   # 女
     
     @classmethod
-    def get_gender(cls, gender_code: Optional[str]) -> 'AuthGender':
+    def get_gender(cls, gender_code: Optional[Union[str, int]]) -> 'AuthGender':
         """
         根据性别代码获取性别枚举
         
         Args:
-            gender_code: 性别代码，不同平台可能使用不同的代码
+            gender_code: 性别代码，不同平台可能使用不同的代码，可以是字符串或整数
             
         Returns:
             性别枚举
         """
-        # 转换为字符串处理
         if gender_code is None:
             return cls.UNKNOWN
-            
-        gender_str = str(gender_code).lower()
-        
-        # 处理常见的性别代码
-        if gender_str in ('1', 'm', 'male', '男'):
-            return cls.MALE
-        elif gender_str in ('2', 'f', 'female', '女'):
-            return cls.FEMALE
-        else:
-            return cls.UNKNOWN 
\ No newline at end of file
+        # 整数代码直接查表，跳过字符串转换（bool不按整数处理）
+        if type(gender_code) is int:
+            return _INT_GENDER_MAP.get(gender_code, cls.UNKNOWN)
+        # 其他代码转换为小写字符串后查表
+        return _GENDER_MAP.get(str(gender_code).lower(), cls.UNKNOWN)
+
+
+# 常见的性别代码
+_GENDER_MAP = {
+    '1': AuthGender.MALE,
+    'm': AuthGender.MALE,
+    'male': AuthGender.MALE,
+    '男': AuthGender.MALE,
+    '2': AuthGender.FEMALE,
+    'f': AuthGender.FEMALE,
+    'female': AuthGender.FEMALE,
+    '女': AuthGender.FEMALE,
+}
+
+_INT_GENDER_MAP = {
+    1: AuthGender.MALE,
+    2: AuthGender.FEMALE,
+}
@@ -1,37 +1,54 @@
 """
 授权来源枚举
 """
-from typing import Optional, List
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Optional, List, Tuple
 
+from senweaver_oauth._compat import DATACLASS_SLOTS
+from senweaver_oauth.enums.auth_scope import AuthScope
+from senweaver_oauth.utils import validate_http_url
 
+
+@dataclass(frozen=True, repr=False, **DATACLASS_SLOTS)
 class AuthSource:
     """
     授权平台基类
+    创建后不可修改，可以作为字典或缓存的键；非空的URL必须是http或https的绝对地址
+    
+    Attributes:
+        name: 平台名称
+        authorize_url: 授权URL
+        access_token_url: 获取token的URL
+        user_info_url: 获取用户信息的URL
+        revoke_token_url: 撤销token的URL
+        refresh_token_url: 刷新token的URL
+        scope_delimiter: scope分隔符
+        title: 平台标题
     """
-    def __init__(self, name: str, authorize_url: str, access_token_url: str, 
-                 user_info_url: str, revoke_token_url: Optional[str] = None,
-                 refresh_token_url: Optional[str] = None, scope_delimiter: str = ' ', title: Optional[str] = None):
+    name: str
+    authorize_url: str
+    access_token_url: str
+    user_info_url: str
+    revoke_token_url: Optional[str] = None
+    refresh_token_url: Optional[str] = None
+    scope_delimiter: str = ' '
+    title: Optional[str] = None
+    # 默认scope字符串，创建时拼接一次，生成授权URL时直接使用
+    default_scope: str = field(init=False, compare=False)
+    
+    def __post_init__(self):
         """
-        初始化
-        
-        Args:
-            name: 平台名称
-            authorize_url: 授权URL
-            access_token_url: 获取token的URL
-            user_info_url: 获取用户信息的URL
-            revoke_token_url: 撤销token的URL
-            refresh_token_url: 刷新token的URL
-            scope_delimiter: scope分隔符
-            title: 平台标题
+        初始化后处理
         """
-        self.name = name
-        self.title = title or name
-        self.authorize_url = authorize_url
-        self.access_token_url = access_token_url
-        self.user_info_url = user_info_url
-        self.revoke_token_url = revoke_token_url
-        self.refresh_token_url = refresh_token_url
-        self.scope_delimiter = scope_delimiter
+        # 平台的URL在创建时校验一次，请求时直接使用
+        for name in ('authorize_url', 'access_token_url', 'user_info_url', 'revoke_token_url', 'refresh_token_url'):
+            validate_http_url(name, getattr(self, name))
+        # 平台名称驻留，作为字典键比较时可以直接按身份命中
+        object.__setattr__(self, 'name', sys.intern(self.name))
+        if not self.title:
+            object.__setattr__(self, 'title', self.name)
+        object.__setattr__(self, 'default_scope', AuthScope.get_scope_str(self.name, self.scope_delimiter))
         
     def __str__(self) -> str:
         return self.name
@@ -44,6 +61,13 @@ class AuthDefaultSource:
     """
     默认支持的平台
     """
+    # 属性名到平台的注册表，模块导入时构建
+    _REGISTRY: Dict[str, AuthSource] = {}
+    # 所有平台名称
+    _NAMES: Tuple[str, ...] = ()
+    # 查找表，除属性名外还包含小写形式和平台名称，常见写法无需转换大小写
+    _LOOKUP: Dict[str, AuthSource] = {}
+    
     GITHUB = AuthSource(
         name="github",
         title="GitHub",
@@ -425,11 +449,10 @@ class AuthDefaultSource:
         Returns:
             授权平台对象，如果不存在则返回None
         """
-        source_name = source_name.upper()
-        try:
-            return getattr(cls, source_name)
-        except (AttributeError, KeyError):
-            return None
+        source = cls._LOOKUP.get(source_name)
+        if source is None:
+            source = cls._REGISTRY.get(source_name.upper())
+        return source
             
     @classmethod
     def values(cls) -> List[AuthSource]:
@@ -439,8 +462,7 @@ class AuthDefaultSource:
         Returns:
             所有支持的平台列表
         """
-        return [getattr(cls, attr) for attr in dir(cls) 
-                if not attr.startswith('_') and isinstance(getattr(cls, attr), AuthSource)]
+        return list(cls._REGISTRY.values())
                 
     @classmethod
     def names(cls) -> List[str]:
@@ -450,4 +472,36 @@ class AuthDefaultSource:
         Returns:
             所有支持的平台名称列表
         """
-        return [source.name for source in cls.values()] 
\ No newline at end of file
+        return list(cls._NAMES)
+        
+    def __init_subclass__(cls, **kwargs):
+        """
+        子类中新增的平台同样加入注册表
+        """
+        super().__init_subclass__(**kwargs)
+        _build_registry(cls)
+
+
+def _build_registry(cls: type) -> None:
+    """
+    构建平台注册表，按属性名排序，包含父类中定义的平台
+    
+    Args:
+        cls: AuthDefaultSource或其子类
+    """
+    sources: Dict[str, AuthSource] = {}
+    for klass in reversed(cls.__mro__):
+        for attr, value in vars(klass).items():
+            if not attr.startswith('_') and isinstance(value, AuthSource):
+                sources[sys.intern(attr)] = value
+    cls._REGISTRY = dict(sorted(sources.items()))
+    cls._NAMES = tuple(source.name for source in cls._REGISTRY.values())
+    lookup: Dict[str, AuthSource] = {}
+    for attr, source in cls._REGISTRY.items():
+        lookup[source.name] = source
+        lookup[sys.intern(attr.lower())] = source
+        lookup[attr] = source
+    cls._LOOKUP = lookup
+
+
+_build_registry(AuthDefaultSource)
@@ -3,11 +3,23 @@ HTTP客户端模块
 """
 
 from senweaver_oauth.http.http_config import HttpConfig
-from senweaver_oauth.http.http_client import HttpClient
+from senweaver_oauth.http.http_client import HttpClient, HttpError, HTTP_ERRORS
+from senweaver_oauth.http.async_http_client import AsyncHttpClient
 from senweaver_oauth.http.requests_http_client import RequestsHttpClient
+from senweaver_oauth.http.httpx_http_client import HttpxHttpClient, HttpxAsyncHttpClient
+from senweaver_oauth.http.shared import get_shared_client, set_shared_client, get_shared_async_client, aclose_shared_clients
 
 __all__ = [
     'HttpConfig',
     'HttpClient',
-    'RequestsHttpClient'
+    'HttpError',
+    'HTTP_ERRORS',
+    'AsyncHttpClient',
+    'RequestsHttpClient',
+    'HttpxHttpClient',
+    'HttpxAsyncHttpClient',
+    'get_shared_client',
+    'set_shared_client',
+    'get_shared_async_client',
+    'aclose_shared_clients'
 ] 
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+异步HTTP客户端接口
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, Union
+
+
+class AsyncHttpClient(ABC):
+    """
+    异步HTTP客户端接口
+    方法与HttpClient一致，均需await调用，适用于FastAPI等异步框架
+    请求体同样按data的类型编码：字典以JSON发送，字符串以表单原样发送
+    """
+    
+    @abstractmethod
+    async def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        GET请求
+        
+        Args:
+            url: 请求URL
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        pass
+        
+    @abstractmethod
+    async def post(self, url: str, data: Optional[Union[Dict[str, Any], str]] = None,
+                   params: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        POST请求
+        
+        Args:
+            url: 请求URL
+            data: 请求体数据，字典以JSON发送，字符串视为已编码的表单数据
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        pass
+        
+    @abstractmethod
+    async def put(self, url: str, data: Optional[Union[Dict[str, Any], str]] = None,
+                  params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        PUT请求
+        
+        Args:
+            url: 请求URL
+            data: 请求体数据，字典以JSON发送，字符串视为已编码的表单数据
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        pass
+        
+    @abstractmethod
+    async def delete(self, url: str, params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        DELETE请求
+        
+        Args:
+            url: 请求URL
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        pass
+        
+    async def aclose(self) -> None:
+        """
+        关闭客户端，释放连接池
+        """
+        pass
@@ -2,12 +2,41 @@
 HTTP客户端接口
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Type, Union
+
+# 调用第三方平台接口时可预期的异常：
+# 网络错误（requests的异常继承自OSError，httpx的异常由客户端转换为OSError）、4xx和5xx状态码对应的HttpError，
+# 以及响应不是JSON或缺少字段、字段类型不符时的解析错误
+HTTP_ERRORS: Tuple[Type[Exception], ...] = (OSError, ValueError, KeyError, TypeError)
+
+
+class HttpError(OSError):
+    """
+    HTTP状态错误，响应状态码为4xx或5xx时由客户端抛出
+    继承自OSError，可被HTTP_ERRORS捕获；响应内容已解析，便于读取平台返回的错误信息
+    """
+    
+    def __init__(self, status: int, body: Dict[str, Any], url: str = ''):
+        """
+        初始化
+        
+        Args:
+            status: 响应状态码
+            body: 解析后的响应内容
+            url: 请求URL
+        """
+        super().__init__(f"HTTP {status} Error for url: {url}")
+        self.status = status
+        self.body = body
 
 
 class HttpClient(ABC):
     """
     HTTP客户端接口
+    
+    请求体的编码由data的类型决定：字典以JSON发送，字符串是已编码的表单数据，
+    需要以application/x-www-form-urlencoded原样发送。部分认证源以字符串发送表单，
+    自定义的HTTP客户端需要按此约定处理，不能把字符串再编码为JSON
     """
     
     @abstractmethod
@@ -27,7 +56,7 @@ class HttpClient(ABC):
         pass
         
     @abstractmethod
-    def post(self, url: str, data: Optional[Dict[str, Any]] = None, 
+    def post(self, url: str, data: Optional[Union[Dict[str, Any], str]] = None, 
              params: Optional[Dict[str, Any]] = None, 
              headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
@@ -35,7 +64,7 @@ class HttpClient(ABC):
         
         Args:
             url: 请求URL
-            data: 请求体数据
+            data: 请求体数据，字典以JSON发送，字符串视为已编码的表单数据
             params: 请求参数
             headers: 请求头
             
@@ -45,7 +74,7 @@ class HttpClient(ABC):
         pass
         
     @abstractmethod
-    def put(self, url: str, data: Optional[Dict[str, Any]] = None, 
+    def put(self, url: str, data: Optional[Union[Dict[str, Any], str]] = None, 
             params: Optional[Dict[str, Any]] = None, 
             headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
@@ -53,7 +82,7 @@ class HttpClient(ABC):
         
         Args:
             url: 请求URL
-            data: 请求体数据
+            data: 请求体数据，字典以JSON发送，字符串视为已编码的表单数据
             params: 请求参数
             headers: 请求头
             
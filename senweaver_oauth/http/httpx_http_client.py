@@ -0,0 +1,417 @@
+"""
+基于httpx库的HTTP客户端实现
+"""
+from typing import Dict, Any, Optional, Union
+
+from senweaver_oauth._compat import json_loads
+from senweaver_oauth.http.async_http_client import AsyncHttpClient
+from senweaver_oauth.http.http_client import HttpClient, HttpError
+from senweaver_oauth.http.http_config import HttpConfig
+from senweaver_oauth.http.shared import get_shared_async_client
+
+
+def _import_httpx():
+    """
+    导入httpx
+
+    Returns:
+        httpx模块
+
+    Raises:
+        ImportError: 未安装httpx
+    """
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError("使用httpx客户端需要安装httpx: pip install senweaver-oauth[async]") from e
+    return httpx
+
+
+# 连接失败时的重试次数，与RequestsHttpClient的重试策略一致；httpx传输层只重试连接失败，读取失败不重试
+CONNECT_RETRIES = 2
+
+
+def _client_kwargs(config: HttpConfig, transport_class, limits) -> Dict[str, Any]:
+    """
+    根据HTTP配置生成httpx客户端参数，安装了h2时启用HTTP/2
+    跟随重定向并在连接失败时重试，与requests的默认行为保持一致
+
+    Args:
+        config: HTTP配置
+        transport_class: 传输层类，httpx.HTTPTransport或httpx.AsyncHTTPTransport
+        limits: 连接池限制，httpx.Limits
+
+    Returns:
+        httpx客户端参数
+    """
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+    transport_kwargs = {
+        'verify': config.verify_ssl,
+        'http2': http2,
+        'limits': limits,
+        'retries': CONNECT_RETRIES
+    }
+    # 代理按协议挂载到各自的传输层
+    mounts = None
+    if config.proxy:
+        mounts = {
+            f"{scheme}://": transport_class(proxy=proxy, **transport_kwargs)
+            for scheme, proxy in config.proxy.items()
+        }
+    return {
+        'headers': config.headers,
+        'timeout': config.timeout,
+        'follow_redirects': True,
+        'transport': transport_class(**transport_kwargs),
+        'mounts': mounts
+    }
+
+
+def _request_url(url: str, params: Optional[Dict[str, Any]]):
+    """
+    按requests的规则合并请求参数
+    值为None的参数不发送，布尔值编码为True/False，参数追加到URL已有的查询字符串之后
+
+    Args:
+        url: 请求URL
+        params: 请求参数
+
+    Returns:
+        合并参数后的httpx.URL对象
+    """
+    httpx = _import_httpx()
+    url = httpx.URL(url)
+    if not params:
+        return url
+    params = {
+        key: str(value) if isinstance(value, bool) else value
+        for key, value in params.items()
+        if value is not None
+    }
+    return url.copy_merge_params(params)
+
+
+def _body_kwargs(data: Optional[Union[Dict[str, Any], str]],
+                 headers: Optional[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    生成请求体和请求头参数
+    只有发送表单数据且未指定Content-Type时才复制请求头并补充，其他情况原样传递
+
+    Args:
+        data: 请求体数据
+        headers: 请求头
+
+    Returns:
+        httpx的请求体和请求头参数
+    """
+    if isinstance(data, str):
+        if not headers or 'Content-Type' not in headers:
+            headers = {**(headers or {}), 'Content-Type': 'application/x-www-form-urlencoded'}
+        return {'content': data, 'headers': headers}
+    if data is None:
+        return {'headers': headers}
+    return {'json': data, 'headers': headers}
+
+
+def _process_response(response) -> Dict[str, Any]:
+    """
+    处理响应数据
+
+    Args:
+        response: httpx.Response对象
+
+    Returns:
+        处理后的响应数据
+
+    Raises:
+        HttpError: 响应状态码为4xx或5xx
+    """
+    # 尝试将响应内容解析为JSON
+    content = response.content
+    try:
+        data = json_loads(content)
+    except ValueError:
+        # 如果不是JSON格式，则按响应声明的编码返回文本内容，避免编码探测
+        data = {'content': content.decode(response.encoding or 'utf-8', errors='replace')}
+    if response.status_code >= 400:
+        raise HttpError(response.status_code, data, str(response.url))
+    return data
+
+
+class HttpxHttpClient(HttpClient):
+    """
+    基于httpx.Client的同步HTTP客户端实现
+    安装了h2时启用HTTP/2，同一主机的请求在一个连接上多路复用
+    
+    需要安装httpx：pip install senweaver-oauth[async]
+    """
+    
+    # 连接池最大连接数
+    MAX_CONNECTIONS = 20
+    
+    # 连接池保持的最大空闲连接数
+    MAX_KEEPALIVE_CONNECTIONS = 10
+    
+    def __init__(self, config: Optional[HttpConfig] = None):
+        """
+        初始化
+        
+        Args:
+            config: HTTP配置
+        """
+        self.config = config or HttpConfig()
+        httpx = _import_httpx()
+        limits = httpx.Limits(
+            max_connections=self.MAX_CONNECTIONS,
+            max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS
+        )
+        self._client = httpx.Client(**_client_kwargs(self.config, httpx.HTTPTransport, limits))
+        
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        GET请求
+        
+        Args:
+            url: 请求URL
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        return self._request('GET', url, params, headers)
+        
+    def post(self, url: str, data: Optional[Union[Dict[str, Any], str]] = None,
+             params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        POST请求
+        
+        Args:
+            url: 请求URL
+            data: 请求体数据，字典以JSON发送，字符串视为已编码的表单数据
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        return self._request('POST', url, params, **_body_kwargs(data, headers))
+        
+    def put(self, url: str, data: Optional[Union[Dict[str, Any], str]] = None,
+            params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        PUT请求
+        
+        Args:
+            url: 请求URL
+            data: 请求体数据，字典以JSON发送，字符串视为已编码的表单数据
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        return self._request('PUT', url, params, **_body_kwargs(data, headers))
+        
+    def delete(self, url: str, params: Optional[Dict[str, Any]] = None,
+               headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        DELETE请求
+        
+        Args:
+            url: 请求URL
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        return self._request('DELETE', url, params, headers)
+        
+    def close(self) -> None:
+        """
+        关闭客户端，释放连接池
+        """
+        self._client.close()
+        
+    def __enter__(self) -> 'HttpxHttpClient':
+        """
+        进入上下文
+        
+        Returns:
+            客户端本身
+        """
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        退出上下文时关闭客户端
+        """
+        self.close()
+        
+    def _request(self, method: str, url: str, params: Optional[Dict[str, Any]],
+                 headers: Optional[Dict[str, str]] = None, **kwargs) -> Dict[str, Any]:
+        """
+        通过httpx.Client发送请求
+        
+        Args:
+            method: 请求方法
+            url: 请求URL
+            params: 请求参数，按requests的规则编码
+            headers: 请求头，与客户端的公共请求头合并
+            **kwargs: 请求体等其他参数
+            
+        Returns:
+            响应数据，JSON格式
+            
+        Raises:
+            HttpError: 响应状态码为4xx或5xx
+            OSError: 网络错误，由httpx的异常转换而来，与requests的异常保持一致
+        """
+        httpx = _import_httpx()
+        try:
+            response = self._client.request(method, _request_url(url, params), headers=headers, **kwargs)
+            return _process_response(response)
+        except httpx.HTTPError as e:
+            raise OSError(str(e)) from e
+
+
+class HttpxAsyncHttpClient(AsyncHttpClient):
+    """
+    基于httpx.AsyncClient的异步HTTP客户端实现
+    
+    需要安装httpx：pip install senweaver-oauth[async]
+    """
+    
+    # 连接池最大连接数
+    MAX_CONNECTIONS = 100
+    
+    # 连接池保持的最大空闲连接数
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    
+    def __init__(self, config: Optional[HttpConfig] = None):
+        """
+        初始化
+        
+        未提供配置时在请求时复用当前事件循环共享的httpx.AsyncClient；
+        提供配置时按配置创建独立的客户端，关闭时一并释放
+        
+        Args:
+            config: HTTP配置
+        """
+        self.config = config or HttpConfig()
+        self._owns_client = config is not None
+        self._client = None
+        if not self._owns_client:
+            return
+        httpx = _import_httpx()
+        limits = httpx.Limits(
+            max_connections=self.MAX_CONNECTIONS,
+            max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS
+        )
+        self._client = httpx.AsyncClient(**_client_kwargs(self.config, httpx.AsyncHTTPTransport, limits))
+        
+    async def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        GET请求
+        
+        Args:
+            url: 请求URL
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        return await self._request('GET', url, params, headers)
+        
+    async def post(self, url: str, data: Optional[Union[Dict[str, Any], str]] = None,
+                   params: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        POST请求
+        
+        Args:
+            url: 请求URL
+            data: 请求体数据，字典以JSON发送，字符串视为已编码的表单数据
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        return await self._request('POST', url, params, **_body_kwargs(data, headers))
+        
+    async def put(self, url: str, data: Optional[Union[Dict[str, Any], str]] = None,
+                  params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        PUT请求
+        
+        Args:
+            url: 请求URL
+            data: 请求体数据，字典以JSON发送，字符串视为已编码的表单数据
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        return await self._request('PUT', url, params, **_body_kwargs(data, headers))
+        
+    async def delete(self, url: str, params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        DELETE请求
+        
+        Args:
+            url: 请求URL
+            params: 请求参数
+            headers: 请求头
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        return await self._request('DELETE', url, params, headers)
+        
+    async def aclose(self) -> None:
+        """
+        关闭客户端，释放连接池；共享的客户端由aclose_shared_clients统一关闭
+        """
+        if self._owns_client:
+            await self._client.aclose()
+            
+    async def _request(self, method: str, url: str, params: Optional[Dict[str, Any]],
+                       headers: Optional[Dict[str, str]] = None, **kwargs) -> Dict[str, Any]:
+        """
+        通过httpx.AsyncClient发送请求
+        
+        Args:
+            method: 请求方法
+            url: 请求URL
+            params: 请求参数，按requests的规则编码
+            headers: 请求头，与客户端的公共请求头合并
+            **kwargs: 请求体等其他参数
+            
+        Returns:
+            响应数据，JSON格式
+            
+        Raises:
+            HttpError: 响应状态码为4xx或5xx
+            OSError: 网络错误，由httpx的异常转换而来，与requests的异常保持一致
+        """
+        httpx = _import_httpx()
+        client = self._client or get_shared_async_client()
+        try:
+            response = await client.request(method, _request_url(url, params), headers=headers, **kwargs)
+            return _process_response(response)
+        except httpx.HTTPError as e:
+            raise OSError(str(e)) from e
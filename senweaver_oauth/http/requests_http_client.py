@@ -1,11 +1,13 @@
 """
 基于requests库的HTTP客户端实现
 """
-import json
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Union
+from urllib3.util.retry import Retry
 
-from senweaver_oauth.http.http_client import HttpClient
+from senweaver_oauth._compat import json_loads
+from senweaver_oauth.http.http_client import HttpClient, HttpError
 from senweaver_oauth.http.http_config import HttpConfig
 
 
@@ -14,6 +16,12 @@ class RequestsHttpClient(HttpClient):
     基于requests库的HTTP客户端实现
     """
     
+    # 连接池缓存的主机数量，OAuth请求通常只访问少数几个平台的域名
+    POOL_CONNECTIONS = 10
+    
+    # 每个主机保持的最大连接数
+    POOL_MAXSIZE = 20
+    
     def __init__(self, config: Optional[HttpConfig] = None):
         """
         初始化
@@ -22,6 +30,36 @@ class RequestsHttpClient(HttpClient):
             config: HTTP配置
         """
         self.config = config or HttpConfig()
+        # 复用Session以保持长连接，避免每次请求重新握手
+        self.session = requests.Session()
+        # 连接失败时请求尚未发出，重试是安全的；读取失败不重试，避免授权码被重复提交
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # 公共配置只设置一次，请求级的请求头由requests与Session的请求头合并
+        self.session.headers.update(self.config.headers)
+        if self.config.proxy:
+            self.session.proxies.update(self.config.proxy)
+        self.session.verify = self.config.verify_ssl
+        
+    def __enter__(self) -> 'RequestsHttpClient':
+        """
+        进入上下文
+        
+        Returns:
+            客户端本身
+        """
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        退出上下文时关闭客户端
+        """
+        self.close()
         
     def get(self, url: str, params: Optional[Dict[str, Any]] = None, 
             headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -36,18 +74,9 @@ class RequestsHttpClient(HttpClient):
         Returns:
             响应数据，JSON格式
         """
-        merged_headers = self._merge_headers(headers)
-        response = requests.get(
-            url=url,
-            params=params,
-            headers=merged_headers,
-            timeout=self.config.timeout,
-            proxies=self.config.proxy,
-            verify=self.config.verify_ssl
-        )
-        return self._process_response(response)
+        return self._request('GET', url, params, headers)
         
-    def post(self, url: str, data: Optional[Dict[str, Any]] = None, 
+    def post(self, url: str, data: Optional[Union[Dict[str, Any], str]] = None, 
              params: Optional[Dict[str, Any]] = None, 
              headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
@@ -55,26 +84,16 @@ class RequestsHttpClient(HttpClient):
         
         Args:
             url: 请求URL
-            data: 请求体数据
+            data: 请求体数据，字典以JSON发送，字符串视为已编码的表单数据
             params: 请求参数
             headers: 请求头
             
         Returns:
             响应数据，JSON格式
         """
-        merged_headers = self._merge_headers(headers)
-        response = requests.post(
-            url=url,
-            json=data,
-            params=params,
-            headers=merged_headers,
-            timeout=self.config.timeout,
-            proxies=self.config.proxy,
-            verify=self.config.verify_ssl
-        )
-        return self._process_response(response)
+        return self._request('POST', url, params, **self._body_kwargs(data, headers))
         
-    def put(self, url: str, data: Optional[Dict[str, Any]] = None, 
+    def put(self, url: str, data: Optional[Union[Dict[str, Any], str]] = None, 
             params: Optional[Dict[str, Any]] = None, 
             headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """
@@ -82,24 +101,14 @@ class RequestsHttpClient(HttpClient):
         
         Args:
             url: 请求URL
-            data: 请求体数据
+            data: 请求体数据，字典以JSON发送，字符串视为已编码的表单数据
             params: 请求参数
             headers: 请求头
             
         Returns:
             响应数据，JSON格式
         """
-        merged_headers = self._merge_headers(headers)
-        response = requests.put(
-            url=url,
-            json=data,
-            params=params,
-            headers=merged_headers,
-            timeout=self.config.timeout,
-            proxies=self.config.proxy,
-            verify=self.config.verify_ssl
-        )
-        return self._process_response(response)
+        return self._request('PUT', url, params, **self._body_kwargs(data, headers))
         
     def delete(self, url: str, params: Optional[Dict[str, Any]] = None, 
                headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -114,31 +123,58 @@ class RequestsHttpClient(HttpClient):
         Returns:
             响应数据，JSON格式
         """
-        merged_headers = self._merge_headers(headers)
-        response = requests.delete(
-            url=url,
+        return self._request('DELETE', url, params, headers)
+        
+    def close(self) -> None:
+        """
+        关闭客户端，释放连接池
+        """
+        self.session.close()
+        
+    def _request(self, method: str, url: str, params: Optional[Dict[str, Any]],
+                 headers: Optional[Dict[str, str]] = None, **kwargs) -> Dict[str, Any]:
+        """
+        通过Session发送请求
+        
+        Args:
+            method: 请求方法
+            url: 请求URL
+            params: 请求参数
+            headers: 请求头，与Session的公共请求头合并
+            **kwargs: 请求体等其他参数
+            
+        Returns:
+            响应数据，JSON格式
+        """
+        response = self.session.request(
+            method,
+            url,
             params=params,
-            headers=merged_headers,
+            headers=headers,
             timeout=self.config.timeout,
-            proxies=self.config.proxy,
-            verify=self.config.verify_ssl
+            **kwargs
         )
         return self._process_response(response)
         
-    def _merge_headers(self, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    @staticmethod
+    def _body_kwargs(data: Optional[Union[Dict[str, Any], str]],
+                     headers: Optional[Dict[str, str]]) -> Dict[str, Any]:
         """
-        合并请求头
+        生成请求体和请求头参数
+        只有发送表单数据且未指定Content-Type时才复制请求头并补充，其他情况原样传递
         
         Args:
+            data: 请求体数据
             headers: 请求头
             
         Returns:
-            合并后的请求头
+            requests的请求体和请求头参数
         """
-        merged_headers = self.config.headers.copy()
-        if headers:
-            merged_headers.update(headers)
-        return merged_headers
+        if isinstance(data, str):
+            if not headers or 'Content-Type' not in headers:
+                headers = {**(headers or {}), 'Content-Type': 'application/x-www-form-urlencoded'}
+            return {'data': data, 'headers': headers}
+        return {'json': data, 'headers': headers}
         
     def _process_response(self, response: requests.Response) -> Dict[str, Any]:
         """
@@ -149,12 +185,17 @@ class RequestsHttpClient(HttpClient):
             
         Returns:
             处理后的响应数据
+            
+        Raises:
+            HttpError: 响应状态码为4xx或5xx
         """
-        response.raise_for_status()
-        
         # 尝试将响应内容解析为JSON
+        content = response.content
         try:
-            return response.json()
-        except json.JSONDecodeError:
-            # 如果不是JSON格式，则返回文本内容
-            return {'content': response.text} 
\ No newline at end of file
+            data = json_loads(content)
+        except ValueError:
+            # 如果不是JSON格式，则按响应声明的编码返回文本内容，避免编码探测
+            data = {'content': content.decode(response.encoding or 'utf-8', errors='replace')}
+        if response.status_code >= 400:
+            raise HttpError(response.status_code, data, response.url)
+        return data 
\ No newline at end of file
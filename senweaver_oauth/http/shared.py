@@ -0,0 +1,102 @@
+"""
+共享HTTP客户端
+
+进程内所有认证源默认复用同一个HTTP客户端，避免每次请求都重新建立TCP + TLS连接
+"""
+import asyncio
+import threading
+import weakref
+from typing import Any, Optional
+
+from senweaver_oauth.http.http_client import HttpClient
+from senweaver_oauth.http.http_config import HttpConfig
+from senweaver_oauth.http.requests_http_client import RequestsHttpClient
+
+_lock = threading.Lock()
+_shared_client: Optional[HttpClient] = None
+# httpx.AsyncClient的连接池绑定创建它的事件循环，因此按事件循环各保留一个客户端，事件循环回收后自动释放
+_shared_async_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]' = weakref.WeakKeyDictionary()
+
+
+def get_shared_client() -> HttpClient:
+    """
+    获取共享的同步HTTP客户端（懒加载）
+
+    Returns:
+        共享的HTTP客户端实例
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _lock:
+            if _shared_client is None:
+                _shared_client = RequestsHttpClient()
+    return _shared_client
+
+
+def set_shared_client(client: HttpClient) -> None:
+    """
+    替换共享的同步HTTP客户端
+
+    Args:
+        client: HTTP客户端实例
+    """
+    global _shared_client
+    _shared_client = client
+
+
+def get_shared_async_client():
+    """
+    获取当前事件循环共享的异步HTTP客户端（懒加载）
+
+    需要安装httpx：pip install senweaver-oauth[async]
+    如果同时安装了h2，则启用HTTP/2；请求头、重定向和重试与共享的同步客户端保持一致
+
+    Returns:
+        当前事件循环共享的httpx.AsyncClient实例
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # 事件循环外无法确定客户端归属，返回新建的客户端，由调用方负责关闭
+        return _create_async_client()
+    client = _shared_async_clients.get(loop)
+    if client is None:
+        with _lock:
+            client = _shared_async_clients.get(loop)
+            if client is None:
+                client = _shared_async_clients[loop] = _create_async_client()
+    return client
+
+
+def _create_async_client():
+    """
+    按默认HTTP配置创建httpx.AsyncClient
+
+    Returns:
+        httpx.AsyncClient实例
+    """
+    # 延迟导入，避免共享模块与httpx客户端模块循环导入
+    from senweaver_oauth.http.httpx_http_client import HttpxAsyncHttpClient, _client_kwargs, _import_httpx
+    httpx = _import_httpx()
+    limits = httpx.Limits(
+        max_connections=HttpxAsyncHttpClient.MAX_CONNECTIONS,
+        max_keepalive_connections=HttpxAsyncHttpClient.MAX_KEEPALIVE_CONNECTIONS
+    )
+    return httpx.AsyncClient(**_client_kwargs(HttpConfig(), httpx.AsyncHTTPTransport, limits))
+
+
+async def aclose_shared_clients() -> None:
+    """
+    关闭共享的HTTP客户端，释放连接池
+
+    一般在应用关闭时调用，例如FastAPI的lifespan；
+    异步客户端只关闭当前事件循环的那一个，其他事件循环的客户端需在各自的事件循环中关闭
+    """
+    global _shared_client
+    with _lock:
+        async_client = _shared_async_clients.pop(asyncio.get_running_loop(), None)
+        client, _shared_client = _shared_client, None
+    if async_client is not None:
+        await async_client.aclose()
+    if client is not None and hasattr(client, 'close'):
+        client.close()
@@ -1,11 +1,13 @@
 """
 授权回调参数
 """
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, ClassVar
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, Any, Union
 
+from senweaver_oauth._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class AuthCallback:
     """
     授权回调参数
@@ -22,9 +24,6 @@ class AuthCallback:
     error_uri: Optional[str] = None  # 错误页面URI
     extras: Dict[str, Any] = field(default_factory=dict)  # 扩展参数
     
-    # 已知字段集合，用于识别哪些是类的字段
-    _known_fields: ClassVar[set] = None
-    
     def __post_init__(self):
         """
         初始化后的处理
@@ -35,33 +34,38 @@ class AuthCallback:
             self.code = self.auth_code
     
     @classmethod
-    def build(cls, data: Dict[str, Any]) -> 'AuthCallback':
+    def build(cls, data: Union[Dict[str, Any], 'AuthCallback']) -> 'AuthCallback':
         """
         构建AuthCallback对象
         
         Args:
-            data: 回调参数字典
+            data: 回调参数字典，已经是AuthCallback对象时直接返回
             
         Returns:
             AuthCallback对象
         """
-        # 初始化已知字段集合
-        if cls._known_fields is None:
-            # 去掉extras字段，它用于存储未知字段
-            cls._known_fields = set(cls.__annotations__.keys()) - {'extras'}
+        if isinstance(data, AuthCallback):
+            return data
+        
+        # 常见的回调参数均为已知字段，直接构建，无需拆分
+        if _KNOWN_FIELDS.issuperset(data):
+            return cls(**data)
         
         # 一次遍历处理所有字段
         kwargs = {}
         extras = {}
         
         for k, v in data.items():
-            if k in cls._known_fields:
+            if k in _KNOWN_FIELDS:
                 kwargs[k] = v
             else:
                 extras[k] = v
                 
-        # 添加extras字段（如果有）
-        if extras:
-            kwargs['extras'] = extras
+        # 未知字段存入extras
+        kwargs['extras'] = extras
             
-        return cls(**kwargs) 
\ No newline at end of file
+        return cls(**kwargs) 
+
+
+# 已知字段集合，用于识别哪些是类的字段，去掉用于存储未知字段的extras
+_KNOWN_FIELDS = frozenset(f.name for f in fields(AuthCallback)) - {'extras'}
@@ -12,10 +12,12 @@ from senweaver_oauth.model.auth_user import AuthUser
 T = TypeVar('T')
 
 
-@dataclass
+# 不使用slots：frozen与slots同时使用时，通过AuthTokenResponse等泛型别名创建实例会失败
+@dataclass(frozen=True)
 class AuthResponse(Generic[T]):
     """
     响应信息
+    创建后不可修改，无参数的常用响应直接复用模块级的共享实例
     """
     code: int  # 状态码
     data: Optional[T] = None  # 响应数据
@@ -34,6 +36,8 @@ class AuthResponse(Generic[T]):
         Returns:
             成功响应对象
         """
+        if data is None and message is None:
+            return _SUCCESS
         return AuthResponse(
             code=200,
             data=data,
@@ -88,6 +92,8 @@ class AuthResponse(Generic[T]):
         Returns:
             未授权响应对象
         """
+        if message == 'Unauthorized':
+            return _UNAUTHORIZED
         return AuthResponse(
             code=401,
             status=ResponseStatus.UNAUTHORIZED,
@@ -105,6 +111,8 @@ class AuthResponse(Generic[T]):
         Returns:
             未实现响应对象
         """
+        if message == 'Not Implemented':
+            return _NOT_IMPLEMENTED
         return AuthResponse(
             code=501,
             status=ResponseStatus.NOT_IMPLEMENTED,
@@ -122,6 +130,8 @@ class AuthResponse(Generic[T]):
         Returns:
             超时响应对象
         """
+        if message == 'Timeout':
+            return _TIMEOUT
         return AuthResponse(
             code=408,
             status=ResponseStatus.TIMEOUT,
@@ -131,4 +141,15 @@ class AuthResponse(Generic[T]):
 
 # 定义常用的响应类型
 AuthTokenResponse = AuthResponse[AuthToken]
-AuthUserResponse = AuthResponse[AuthUser] 
\ No newline at end of file
+AuthUserResponse = AuthResponse[AuthUser]
+
+# 无参数的常用响应，由对应的工厂方法直接返回
+_SUCCESS = AuthResponse(code=200, status=ResponseStatus.SUCCESS, message='Success')
+_UNAUTHORIZED = AuthResponse(code=401, status=ResponseStatus.UNAUTHORIZED, message='Unauthorized')
+_NOT_IMPLEMENTED = AuthResponse(code=501, status=ResponseStatus.NOT_IMPLEMENTED, message='Not Implemented')
+_TIMEOUT = AuthResponse(code=408, status=ResponseStatus.TIMEOUT, message='Timeout')
+
+# 常用的失败响应，不可修改，直接复用
+EMPTY_CODE_RESPONSE: AuthTokenResponse = AuthResponse.failure("授权码不能为空")
+NO_REFRESH_RESPONSE: AuthTokenResponse = AuthResponse.not_implemented("该平台不支持刷新令牌")
+NO_REVOKE_RESPONSE: AuthTokenResponse = AuthResponse.not_implemented("该平台不支持撤销令牌")
@@ -1,12 +1,15 @@
 """
 Token信息模型
 """
+import time
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+from senweaver_oauth._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class AuthToken:
     """
     Token信息
@@ -28,6 +31,41 @@ class AuthToken:
     oauth_token_secret: Optional[str] = None  # 用于部分平台的oauth_token_secret参数
     create_time: datetime = field(default_factory=datetime.now)  # 创建时间
     extras: Dict[str, Any] = field(default_factory=dict)  # 扩展信息
+    authorization: str = field(init=False, repr=False, compare=False)  # Authorization请求头的值
+    _expires_at: Optional[float] = field(init=False, repr=False, compare=False)  # 过期时间戳，不过期为None
+
+    def __post_init__(self):
+        """
+        初始化后处理，预先生成Authorization请求头的值和过期时间戳
+        """
+        self.authorization = "Bearer " + str(self.access_token)
+        # 部分平台以字符串返回过期时间
+        try:
+            expires_in = int(self.expires_in or 0)
+        except (TypeError, ValueError):
+            expires_in = 0
+        # 过期时间小于等于0，默认不过期
+        self._expires_at = self.create_time.timestamp() + expires_in if expires_in > 0 else None
+
+    @property
+    def ext_data(self) -> Dict[str, Any]:
+        """
+        扩展信息，extras的别名，兼容旧版本
+        
+        Returns:
+            扩展信息
+        """
+        return self.extras
+        
+    @ext_data.setter
+    def ext_data(self, value: Dict[str, Any]) -> None:
+        """
+        设置扩展信息
+        
+        Args:
+            value: 扩展信息
+        """
+        self.extras = value
 
     @property
     def expired(self) -> bool:
@@ -37,9 +75,5 @@ class AuthToken:
         Returns:
             是否过期
         """
-        if self.expires_in is None or self.expires_in <= 0:
-            # 过期时间为空或者小于等于0，默认不过期
-            return False
-        
         # 当前时间 > 创建时间 + 过期时间，则表示已过期
-        return datetime.now() > self.create_time.timestamp() + self.expires_in 
\ No newline at end of file
+        return self._expires_at is not None and time.time() > self._expires_at 
\ No newline at end of file
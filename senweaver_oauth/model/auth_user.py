@@ -4,11 +4,12 @@
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 
+from senweaver_oauth._compat import DATACLASS_SLOTS, json_dumps
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.model.auth_token import AuthToken
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AuthUser:
     """
     第三方平台用户信息
@@ -28,6 +29,21 @@ class AuthUser:
     token: Optional[AuthToken] = None  # token信息
     raw_user_info: Optional[Dict[str, Any]] = field(default_factory=dict)  # 原始用户信息
     service_url:Optional[str] = None # 部门平台需要重定向的服务地址
+    _raw_json: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)  # (原始用户信息, JSON字节串)缓存
+
+    def raw_json(self) -> bytes:
+        """
+        获取原始用户信息的JSON字节串
+        首次调用时序列化并缓存，之后直接复用；raw_user_info被重新赋值时重新序列化
+        
+        Returns:
+            JSON字节串
+        """
+        cached = self._raw_json
+        if cached is None or cached[0] is not self.raw_user_info:
+            cached = (self.raw_user_info, json_dumps(self.raw_user_info))
+            self._raw_json = cached
+        return cached[1]
 
     def __str__(self) -> str:
         return f"AuthUser(uuid={self.uuid}, username={self.username}, source={self.source})"
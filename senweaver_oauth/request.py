@@ -1,18 +1,33 @@
 """
 认证请求类
 """
-from typing import Dict, Any, Optional, Type
+from typing import Type
 
 from senweaver_oauth.config import AuthConfig
-from senweaver_oauth.model.auth_response import AuthUserResponse
 from senweaver_oauth.source.base import BaseAuthSource
 
 
 class AuthRequest:
     """
     认证请求类
+    
+    authorize、login、refresh、revoke及其异步版本在初始化时直接绑定为认证源的方法，
+    调用时不再经过一层转发：
+    
+        authorize(state=None, **kwargs) -> str: 生成授权URL
+        login(callback, **kwargs) -> AuthUserResponse: 登录
+        login_async(callback, **kwargs) -> AuthUserResponse: 异步登录
+        refresh(token) -> AuthTokenResponse: 刷新访问令牌
+        refresh_async(token) -> AuthTokenResponse: 异步刷新访问令牌
+        revoke(token) -> AuthTokenResponse: 撤销访问令牌
+        revoke_async(token) -> AuthTokenResponse: 异步撤销访问令牌
     """
     
+    __slots__ = (
+        'auth_source', 'authorize', 'login', 'login_async',
+        'refresh', 'refresh_async', 'revoke', 'revoke_async'
+    )
+    
     def __init__(self, auth_source: BaseAuthSource):
         """
         初始化
@@ -21,54 +36,13 @@ class AuthRequest:
             auth_source: 认证源实例
         """
         self.auth_source = auth_source
-        
-    def authorize(self, state: Optional[str] = None, **kwargs) -> str:
-        """
-        生成授权URL
-        
-        Args:
-            state: 自定义state参数，用于防止CSRF攻击
-            
-        Returns:
-            授权URL
-        """
-        return self.auth_source.authorize(state, **kwargs)
-        
-    def login(self, callback: Dict[str, Any], **kwargs) -> AuthUserResponse:
-        """
-        登录
-        
-        Args:
-            callback: 回调参数
-            
-        Returns:
-            用户信息
-        """
-        return self.auth_source.login(callback, **kwargs)
-        
-    def refresh(self, token: str) -> AuthUserResponse:
-        """
-        刷新访问令牌
-        
-        Args:
-            token: 刷新令牌
-            
-        Returns:
-            新的访问令牌
-        """
-        return self.auth_source.refresh(token)
-        
-    def revoke(self, token: str) -> AuthUserResponse:
-        """
-        撤销访问令牌
-        
-        Args:
-            token: 访问令牌
-            
-        Returns:
-            撤销结果
-        """
-        return self.auth_source.revoke(token)
+        self.authorize = auth_source.authorize
+        self.login = auth_source.login
+        self.login_async = auth_source.login_async
+        self.refresh = auth_source.refresh
+        self.refresh_async = auth_source.refresh_async
+        self.revoke = auth_source.revoke
+        self.revoke_async = auth_source.revoke_async
         
     @classmethod
     def build(cls, auth_source_class: Type[BaseAuthSource], config: AuthConfig) -> 'AuthRequest':
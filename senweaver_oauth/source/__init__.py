@@ -3,47 +3,52 @@
 """
 第三方登录授权模块，各个平台的授权源
 """
-from typing import List
+import importlib
+from typing import Any, Dict, List
 
 from senweaver_oauth.source.base import BaseAuthSource
-from senweaver_oauth.source.alipay import AuthAlipaySource
-from senweaver_oauth.source.aliyun import AuthAliyunSource
-from senweaver_oauth.source.amazon import AuthAmazonSource
-from senweaver_oauth.source.baidu import AuthBaiduSource
-from senweaver_oauth.source.coding import AuthCodingSource
-from senweaver_oauth.source.dingtalk import AuthDingtalkSource
-from senweaver_oauth.source.douyin import AuthDouyinSource
-from senweaver_oauth.source.eleme import AuthElemeSource
-from senweaver_oauth.source.facebook import AuthFacebookSource
-from senweaver_oauth.source.feishu import AuthFeishuSource
-from senweaver_oauth.source.gitee import AuthGiteeSource
-from senweaver_oauth.source.github import AuthGithubSource
-from senweaver_oauth.source.gitlab import AuthGitlabSource
-from senweaver_oauth.source.google import AuthGoogleSource
-from senweaver_oauth.source.huawei import AuthHuaweiSource
-from senweaver_oauth.source.jd import AuthJdSource
-from senweaver_oauth.source.kujiale import AuthKujialeSource
-from senweaver_oauth.source.line import AuthLineSource
-from senweaver_oauth.source.linkedin import AuthLinkedinSource
-from senweaver_oauth.source.meituan import AuthMeituanSource
-from senweaver_oauth.source.microsoft import AuthMicrosoftSource
-from senweaver_oauth.source.xiaomi import AuthXiaomiSource
-from senweaver_oauth.source.oschina import AuthOschinaSource
-from senweaver_oauth.source.pinterest import AuthPinterestSource
-from senweaver_oauth.source.qq import AuthQqSource
-from senweaver_oauth.source.renren import AuthRenrenSource
-from senweaver_oauth.source.slack import AuthSlackSource
-from senweaver_oauth.source.stack_overflow import AuthStackOverflowSource
-from senweaver_oauth.source.taobao import AuthTaobaoSource
-from senweaver_oauth.source.tencent_cloud import AuthTencentCloudSource
-from senweaver_oauth.source.toutiao import AuthToutiaoSource
-from senweaver_oauth.source.twitter import AuthTwitterSource
-from senweaver_oauth.source.wechat import AuthWechatSource
-from senweaver_oauth.source.wechat_enterprise import AuthWechatEnterpriseSource
-from senweaver_oauth.source.wechat_mini import AuthWechatMiniSource
-from senweaver_oauth.source.wechat_open import AuthWechatOpenSource
-from senweaver_oauth.source.weibo import AuthWeiboSource
-from senweaver_oauth.source.xmly import AuthXmlySource
+
+# 认证源类名到模块名的映射，首次访问时才导入对应模块，未使用的平台不会被加载
+_LAZY_SOURCES: Dict[str, str] = {
+    "AuthAlipaySource": "alipay",
+    "AuthAliyunSource": "aliyun",
+    "AuthAmazonSource": "amazon",
+    "AuthBaiduSource": "baidu",
+    "AuthCodingSource": "coding",
+    "AuthDingtalkSource": "dingtalk",
+    "AuthDouyinSource": "douyin",
+    "AuthElemeSource": "eleme",
+    "AuthFacebookSource": "facebook",
+    "AuthFeishuSource": "feishu",
+    "AuthGiteeSource": "gitee",
+    "AuthGithubSource": "github",
+    "AuthGitlabSource": "gitlab",
+    "AuthGoogleSource": "google",
+    "AuthHuaweiSource": "huawei",
+    "AuthJdSource": "jd",
+    "AuthKujialeSource": "kujiale",
+    "AuthLineSource": "line",
+    "AuthLinkedinSource": "linkedin",
+    "AuthMeituanSource": "meituan",
+    "AuthMicrosoftSource": "microsoft",
+    "AuthXiaomiSource": "xiaomi",
+    "AuthOschinaSource": "oschina",
+    "AuthPinterestSource": "pinterest",
+    "AuthQqSource": "qq",
+    "AuthRenrenSource": "renren",
+    "AuthSlackSource": "slack",
+    "AuthStackOverflowSource": "stack_overflow",
+    "AuthTaobaoSource": "taobao",
+    "AuthTencentCloudSource": "tencent_cloud",
+    "AuthToutiaoSource": "toutiao",
+    "AuthTwitterSource": "twitter",
+    "AuthWechatSource": "wechat",
+    "AuthWechatEnterpriseSource": "wechat_enterprise",
+    "AuthWechatMiniSource": "wechat_mini",
+    "AuthWechatOpenSource": "wechat_open",
+    "AuthWeiboSource": "weibo",
+    "AuthXmlySource": "xmly",
+}
 
 __all__: List[str] = [
     "BaseAuthSource",
@@ -85,4 +90,36 @@ __all__: List[str] = [
     "AuthWechatOpenSource",
     "AuthWeiboSource",
     "AuthXmlySource",
-] 
\ No newline at end of file
+] 
+
+
+def __getattr__(name: str) -> Any:
+    """
+    按需导入认证源类
+
+    Args:
+        name: 认证源类名
+
+    Returns:
+        认证源类
+
+    Raises:
+        AttributeError: 不存在的属性
+    """
+    module_name = _LAZY_SOURCES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    source_class = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    # 写入模块全局变量，之后的访问不再经过__getattr__
+    globals()[name] = source_class
+    return source_class
+
+
+def __dir__() -> List[str]:
+    """
+    列出模块属性，包含尚未导入的认证源类
+
+    Returns:
+        属性名列表
+    """
+    return sorted(set(globals()) | set(_LAZY_SOURCES))
@@ -2,17 +2,24 @@
 Amazon认证源
 """
 
+from types import MappingProxyType
 from typing import Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE, NO_REFRESH_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 请求头，要求返回JSON
+_HEADERS = MappingProxyType({
+    'Accept': 'application/json'
+})
+
 
 class AuthAmazonSource(BaseAuthSource):
     """
@@ -43,19 +50,11 @@ class AuthAmazonSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
-            
-        params = {
-            'code': callback.code,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'redirect_uri': self.config.redirect_uri,
-            'grant_type': 'authorization_code'
-        }
+            return EMPTY_CODE_RESPONSE
+            
+        params = {**self._base_token_params, 'code': callback.code}
         
-        headers = {
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -80,7 +79,7 @@ class AuthAmazonSource(BaseAuthSource):
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -95,7 +94,7 @@ class AuthAmazonSource(BaseAuthSource):
         """
         try:
             headers = {
-                'Authorization': f"Bearer {token.access_token}",
+                'Authorization': token.authorization,
                 'Accept': 'application/json'
             }
             response = self.http_client.get(self.source.user_info_url, headers=headers)
@@ -116,7 +115,7 @@ class AuthAmazonSource(BaseAuthSource):
             
             return AuthUserResponse.success(user)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
             
     def refresh_token(self, refresh_token: str) -> AuthTokenResponse:
@@ -130,18 +129,11 @@ class AuthAmazonSource(BaseAuthSource):
             新的访问令牌
         """
         if not self.source.refresh_token_url:
-            return AuthTokenResponse.not_implemented("该平台不支持刷新令牌")
-            
-        params = {
-            'refresh_token': refresh_token,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'grant_type': 'refresh_token'
-        }
+            return NO_REFRESH_RESPONSE
+            
+        params = {**self._base_refresh_params, 'refresh_token': refresh_token}
         
-        headers = {
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -165,5 +157,5 @@ class AuthAmazonSource(BaseAuthSource):
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}") 
\ No newline at end of file
@@ -1,19 +1,32 @@
 """
 百度认证源
 """
-import uuid
-from typing import Dict, Optional
+from secrets import token_urlsafe
+from types import MappingProxyType
+from typing import Any, Dict, Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_scope import AuthScope
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
 from senweaver_oauth.enums.auth_gender import AuthGender
+from senweaver_oauth.http.http_client import HttpError
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE, NO_REFRESH_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 百度性别代码，1表示男性，0表示女性
+_GENDER_MAP = {"1": AuthGender.MALE, "0": AuthGender.FEMALE, 1: AuthGender.MALE, 0: AuthGender.FEMALE}
+
+# 头像URL前缀，拼接用户信息中的portrait；使用HTTPS地址，避免加载头像时从HTTP重定向
+_AVATAR_URL_PREFIX = "https://himg.bdimg.com/sys/portrait/item/"
+
+# 表单请求的请求头
+_HEADERS = MappingProxyType({
+    "Content-Type": "application/x-www-form-urlencoded"
+})
+
 
 class AuthBaiduSource(BaseAuthSource):
     """
@@ -44,30 +57,25 @@ class AuthBaiduSource(BaseAuthSource):
         Returns:
             授权参数
         """
+        return {**self._static_authorize_params(), "state": state or token_urlsafe(16)}
+        
+    def _static_authorize_params(self) -> Dict[str, Any]:
+        """
+        获取授权URL中不变的授权参数，使用默认的build_authorize_url，可以使用授权URL模板
+        
+        Returns:
+            不变的授权参数
+        """
         params = {
             "client_id": self.config.client_id,
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4()),
+            "state": None,
             "display": "popup"
         }
         return params
         
-    def build_authorize_url(self, params: Dict[str, str]) -> str:
-        """
-        构建授权URL
-        
-        Args:
-            params: 授权参数
-            
-        Returns:
-            授权URL
-        """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query}"
-        
     def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
         获取访问令牌
@@ -78,45 +86,23 @@ class AuthBaiduSource(BaseAuthSource):
         Returns:
             访问令牌响应
         """
-        params = {
-            "client_id": self.config.client_id,
-            "client_secret": self.config.client_secret,
-            "code": callback.code,
-            "redirect_uri": self.config.redirect_uri,
-            "grant_type": "authorization_code"
-        }
+        if not callback.code:
+            return EMPTY_CODE_RESPONSE
+            
+        params = self._token_body(callback.code)
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        headers = _HEADERS
         
-        response = self.http_client.post(
-            self.source.access_token_url, 
-            data=params,
-            headers=headers
-        )
-                    
-        data = response
-        
-        if "error" in data:
-            return AuthTokenResponse(
-                code=400,
-                message=f"获取访问令牌失败: {data.get('error_description', data.get('error', ''))}"
+        try:
+            response = self.http_client.post(
+                self.source.access_token_url, 
+                data=params,
+                headers=headers
             )
-            
-        token = AuthToken(
-            access_token=data.get("access_token", ""),
-            token_type=data.get("token_type", ""),
-            expires_in=data.get("expires_in", 0),
-            refresh_token=data.get("refresh_token", ""),
-            scope=data.get("scope", "")
-        )
-        
-        return AuthTokenResponse(
-            code=200,
-            message="获取访问令牌成功",
-            data=token
-        )
+        except HttpError as e:
+            # 百度以4xx状态码返回授权码无效等错误
+            return self._http_error_response(e)
+        return self._parse_token_response(response, code=callback.code)
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
         """
@@ -150,13 +136,14 @@ class AuthBaiduSource(BaseAuthSource):
         # 解析百度用户信息
         user_id = data.get("userid", "") or data.get("openid", "")
         username = data.get("username", "") or data.get("uname", "")
+        portrait = data.get("portrait", "")
         
         # 构建用户信息
         user = AuthUser(
             uuid=f"{self.source.name}_{user_id}",
             username=username,
             nickname=username,
-            avatar=data.get("portrait", ""),  # 头像需要拼接成URL
+            avatar=_AVATAR_URL_PREFIX + portrait if portrait else "",
             gender=self._get_gender(data.get("sex", "")),
             email="",  # 百度API默认不返回邮箱
             location="",
@@ -165,10 +152,6 @@ class AuthBaiduSource(BaseAuthSource):
             raw_user_info=data
         )
         
-        # 补全头像URL
-        if user.avatar:
-            user.avatar = f"http://tb.himg.baidu.com/sys/portrait/item/{user.avatar}"
-        
         return AuthUserResponse(
             code=200,
             message="获取用户信息成功",
@@ -186,49 +169,22 @@ class AuthBaiduSource(BaseAuthSource):
             刷新结果
         """
         if not self.source.refresh_token_url:
-            return AuthTokenResponse(
-                code=400,
-                message="该平台不支持刷新令牌"
-            )
+            return NO_REFRESH_RESPONSE
             
-        params = {
-            "client_id": self.config.client_id,
-            "client_secret": self.config.client_secret,
-            "refresh_token": refresh_token,
-            "grant_type": "refresh_token"
-        }
-        
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        params = self._refresh_body(refresh_token)
         
-        response = self.http_client.post(
-            self.source.refresh_token_url, 
-            data=params,
-            headers=headers
-        )        
-            
-        data = response
+        headers = _HEADERS
         
-        if "error" in data:
-            return AuthTokenResponse(
-                code=400,
-                message=f"刷新访问令牌失败: {data.get('error_description', data.get('error', ''))}"
+        try:
+            response = self.http_client.post(
+                self.source.refresh_token_url, 
+                data=params,
+                headers=headers
             )
-            
-        token = AuthToken(
-            access_token=data.get("access_token", ""),
-            token_type=data.get("token_type", ""),
-            expires_in=data.get("expires_in", 0),
-            refresh_token=data.get("refresh_token", refresh_token),
-            scope=data.get("scope", "")
-        )
-        
-        return AuthTokenResponse(
-            code=200,
-            message="刷新访问令牌成功",
-            data=token
-        )
+        except HttpError as e:
+            # 百度以4xx状态码返回刷新令牌无效等错误
+            return self._http_error_response(e, '刷新访问令牌失败')
+        return self._parse_token_response(response, '刷新访问令牌失败', refresh_token=refresh_token)
         
     def revoke_token(self, token: AuthToken) -> bool:
         """
@@ -261,9 +217,4 @@ class AuthBaiduSource(BaseAuthSource):
         Returns:
             性别枚举
         """
-        if gender == "1":
-            return AuthGender.MALE
-        elif gender == "0":
-            return AuthGender.FEMALE
-        else:
-            return AuthGender.UNKNOWN 
\ No newline at end of file
+        return _GENDER_MAP.get(gender, AuthGender.UNKNOWN)
\ No newline at end of file
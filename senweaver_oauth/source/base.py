@@ -1,21 +1,35 @@
 """
 基础认证源
 """
-import uuid
+import asyncio
+import functools
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from secrets import token_urlsafe
+from types import MappingProxyType
+from urllib.parse import quote, quote_plus, urlencode
+from typing import Dict, Any, Optional, Callable, Union
 
 from senweaver_oauth.cache.base import CacheStore
 from senweaver_oauth.cache.default import DefaultCacheStore
 from senweaver_oauth.config import AuthConfig
-from senweaver_oauth.enums.auth_scope import AuthScope
 from senweaver_oauth.enums.auth_source import AuthSource
-from senweaver_oauth.http.http_client import HttpClient
-from senweaver_oauth.http.requests_http_client import RequestsHttpClient
+from senweaver_oauth.http.async_http_client import AsyncHttpClient
+from senweaver_oauth.http.http_client import HttpClient, HttpError
+from senweaver_oauth.http.httpx_http_client import HttpxAsyncHttpClient
+from senweaver_oauth.http.shared import get_shared_client
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, NO_REFRESH_RESPONSE, NO_REVOKE_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 
+# 标准OAuth2令牌响应中直接对应AuthToken的字段
+_TOKEN_KEYS = ('access_token', 'token_type', 'expires_in', 'refresh_token', 'scope')
+
+# 授权URL查询参数编码时保留的字符，redirect_uri等URL参数保持可读，其余特殊字符（如空格、&、=）按百分号编码
+_QUERY_SAFE = ':/'
+
+# 构建授权URL模板时state的占位符
+_STATE_PLACEHOLDER = '__senweaver_oauth_state__'
+
 
 class BaseAuthSource(ABC):
     """
@@ -24,20 +38,52 @@ class BaseAuthSource(ABC):
     
     def __init__(self, config: AuthConfig, source: AuthSource,
                  http_client: Optional[HttpClient] = None,
-                 cache_store: Optional[CacheStore] = None):
+                 cache_store: Optional[CacheStore] = None,
+                 async_http_client: Optional[AsyncHttpClient] = None):
         """
         初始化
         
         Args:
             config: 认证配置
             source: 认证源
-            http_client: HTTP客户端
+            http_client: HTTP客户端，默认使用进程内共享的客户端
             cache_store: 缓存存储
+            async_http_client: 异步HTTP客户端，默认基于进程内共享的httpx.AsyncClient
         """
         self.config = config
         self.source = source
-        self.http_client = http_client or RequestsHttpClient()
+        self.http_client = http_client or get_shared_client()
+        self._async_http_client = async_http_client
         self.cache_store = cache_store or DefaultCacheStore.get_instance()
+        # 换取和刷新令牌时不变的公共参数，请求时只需合并授权码或刷新令牌
+        self._base_token_params = MappingProxyType({
+            'client_id': config.client_id,
+            'client_secret': config.client_secret,
+            'redirect_uri': config.redirect_uri,
+            'grant_type': 'authorization_code'
+        })
+        self._base_refresh_params = MappingProxyType({
+            'client_id': config.client_id,
+            'client_secret': config.client_secret,
+            'grant_type': 'refresh_token'
+        })
+        # 公共参数预先编码为表单，请求时只需拼接授权码或刷新令牌；与requests一致，省略值为None的参数
+        self._token_body_prefix = urlencode({k: v for k, v in self._base_token_params.items() if v is not None})
+        self._refresh_body_prefix = urlencode({k: v for k, v in self._base_refresh_params.items() if v is not None})
+        # 授权URL中state前后不变的部分，首次生成授权URL时构建，False表示不支持模板
+        self._authorize_url_parts = None
+        
+    @property
+    def async_http_client(self) -> AsyncHttpClient:
+        """
+        异步HTTP客户端，未指定时懒加载，基于进程内共享的httpx.AsyncClient
+        
+        Returns:
+            异步HTTP客户端实例
+        """
+        if self._async_http_client is None:
+            self._async_http_client = HttpxAsyncHttpClient()
+        return self._async_http_client
         
     def authorize(self, state: Optional[str] = None,**kwargs) -> str:
         """
@@ -51,36 +97,79 @@ class BaseAuthSource(ABC):
         """
         # 生成随机state参数
         if not state:
-            state = str(uuid.uuid4())
+            state = token_urlsafe(16)
             
         # 缓存state参数，默认有效期3分钟
         self.cache_store.set(state, state, 180)
+        # 授权URL只有state会变化，支持模板时直接拼接state
+        parts = self._authorize_url_parts
+        if parts is None:
+            parts = self._authorize_url_parts = self._build_authorize_url_parts()
+        if parts:
+            return f"{parts[0]}{quote(state, safe=_QUERY_SAFE)}{parts[1]}"
         # 构建授权参数
         params = self.get_authorize_params(state)
         # 生成授权URL
         return self.build_authorize_url(params)
         
-    def login(self, callback: Dict[str, Any], **kwargs) -> AuthUserResponse:
+    def _static_authorize_params(self) -> Optional[Dict[str, Any]]:
+        """
+        获取授权URL中不变的授权参数，state的值为None，只占据其在URL中的位置
+        
+        子类重写get_authorize_params或build_authorize_url后默认不使用模板；
+        子类的授权参数中只有state会变化、且使用默认的build_authorize_url时，可以重写此方法启用模板
+        
+        Returns:
+            不变的授权参数，None表示不支持模板
+        """
+        cls = type(self)
+        if (cls.get_authorize_params is not _DEFAULT_GET_AUTHORIZE_PARAMS
+                or cls.build_authorize_url is not _DEFAULT_BUILD_AUTHORIZE_URL):
+            return None
+        params = {
+            'response_type': 'code',
+            'client_id': self.config.client_id,
+            'redirect_uri': self.config.redirect_uri,
+            'state': None
+        }
+        scope = self.get_scopes()
+        if scope:
+            params['scope'] = scope
+        return params
+        
+    def _build_authorize_url_parts(self):
+        """
+        构建授权URL模板，即授权URL中state前后不变的两部分
+        
+        Returns:
+            (state之前的部分, state之后的部分)，不支持模板时返回False
+        """
+        params = self._static_authorize_params()
+        if params is None:
+            return False
+        url = self.build_authorize_url({**params, 'state': _STATE_PLACEHOLDER})
+        prefix, found, suffix = url.partition(_STATE_PLACEHOLDER)
+        return (prefix, suffix) if found else False
+        
+    def login(self, callback: Union[Dict[str, Any], AuthCallback], **kwargs) -> AuthUserResponse:
         """
         登录
         
         Args:
-            callback: 回调参数
+            callback: 回调参数字典，或框架集成中已构建好的AuthCallback对象
             **kwargs: 额外参数，将传递给get_user_info
             
         Returns:
             用户信息
         """
+        # 检查state参数，防止CSRF攻击；校验失败时无需构建回调对象
+        if not self._check_state(callback):
+            return AuthUserResponse.failure("state参数不匹配或已过期，请重新授权")
+            
         # 使用AuthCallback的build方法创建对象
         callback_params = AuthCallback.build(callback)
         
-        # 检查state参数，防止CSRF攻击
-        if not self.config.ignore_check_state and callback_params.state:
-            state = self.cache_store.get(callback_params.state)
-            if not state:
-                return AuthUserResponse.failure("state参数不匹配或已过期，请重新授权")
-        
-        # 获取访问令牌
+        # 获取访问令牌，授权码只能使用一次，每次都需要向平台换取，不做缓存
         token_response = self.get_access_token(callback_params)
         if token_response.code != 200:
             return AuthUserResponse(
@@ -92,6 +181,35 @@ class BaseAuthSource(ABC):
         # 获取用户信息，传递额外参数
         return self.get_user_info(token_response.data, **kwargs)
         
+    async def login_async(self, callback: Union[Dict[str, Any], AuthCallback], **kwargs) -> AuthUserResponse:
+        """
+        异步登录
+        
+        Args:
+            callback: 回调参数字典，或框架集成中已构建好的AuthCallback对象
+            **kwargs: 额外参数，将传递给get_user_info_async
+            
+        Returns:
+            用户信息
+        """
+        # 检查state参数，防止CSRF攻击
+        if not self._check_state(callback):
+            return AuthUserResponse.failure("state参数不匹配或已过期，请重新授权")
+            
+        callback_params = AuthCallback.build(callback)
+        
+        # 获取访问令牌，授权码只能使用一次，每次都需要向平台换取，不做缓存
+        token_response = await self.get_access_token_async(callback_params)
+        if token_response.code != 200:
+            return AuthUserResponse(
+                code=token_response.code,
+                status=token_response.status,
+                message=token_response.message
+            )
+            
+        # 获取用户信息，传递额外参数
+        return await self.get_user_info_async(token_response.data, **kwargs)
+        
     def refresh(self, token: str) -> AuthTokenResponse:
         """
         刷新访问令牌
@@ -104,6 +222,18 @@ class BaseAuthSource(ABC):
         """
         return self.refresh_token(token)
         
+    async def refresh_async(self, token: str) -> AuthTokenResponse:
+        """
+        异步刷新访问令牌
+        
+        Args:
+            token: 刷新令牌
+            
+        Returns:
+            新的访问令牌
+        """
+        return await self.refresh_token_async(token)
+        
     def revoke(self, token: str) -> AuthTokenResponse:
         """
         撤销访问令牌
@@ -116,6 +246,18 @@ class BaseAuthSource(ABC):
         """
         return self.revoke_token(token)
         
+    async def revoke_async(self, token: str) -> AuthTokenResponse:
+        """
+        异步撤销访问令牌
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            撤销结果
+        """
+        return await self.revoke_token_async(token)
+        
     def get_scopes(self) -> str:
         """
         获取授权范围字符串        
@@ -125,7 +267,7 @@ class BaseAuthSource(ABC):
         """
         if self.config.scope:
             return self.config.scope
-        return AuthScope.get_scope_str(self.source.name, self.source.scope_delimiter)
+        return self.source.default_scope
         
     def get_authorize_params(self, state: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -139,7 +281,7 @@ class BaseAuthSource(ABC):
         """       
         # 生成随机state参数
         if not state:
-            state = str(uuid.uuid4())
+            state = token_urlsafe(16)
             
         # 缓存state参数，默认有效期3分钟
         self.cache_store.set(state, state, 180)
@@ -170,9 +312,8 @@ class BaseAuthSource(ABC):
         Returns:
             授权URL
         """
-        # 将参数拼接到URL中
-        query_str = '&'.join([f"{k}={v}" for k, v in params.items()])
-        return f"{self.source.authorize_url}?{query_str}"
+        # 将参数编码后拼接到URL中
+        return f"{self.source.authorize_url}?{urlencode(params, safe=_QUERY_SAFE, quote_via=quote)}"
     
     @abstractmethod
     def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
@@ -212,7 +353,7 @@ class BaseAuthSource(ABC):
             新的访问令牌
         """
         # 默认实现，如果平台不支持刷新令牌，则返回未实现
-        return AuthTokenResponse.not_implemented("该平台不支持刷新令牌")
+        return NO_REFRESH_RESPONSE
         
     def revoke_token(self, access_token: str) -> AuthTokenResponse:
         """
@@ -225,4 +366,158 @@ class BaseAuthSource(ABC):
             撤销结果
         """
         # 默认实现，如果平台不支持撤销令牌，则返回未实现
-        return AuthTokenResponse.not_implemented("该平台不支持撤销令牌") 
\ No newline at end of file
+        return NO_REVOKE_RESPONSE
+        
+    async def get_access_token_async(self, callback: AuthCallback) -> AuthTokenResponse:
+        """
+        异步获取访问令牌
+        
+        默认在线程池中执行同步实现，避免阻塞事件循环；
+        子类可基于async_http_client重写为原生异步实现，参见AuthGithubSource
+        
+        Args:
+            callback: 回调参数
+            
+        Returns:
+            访问令牌
+        """
+        return await self._run_sync(self.get_access_token, callback)
+        
+    async def get_user_info_async(self, token: AuthToken, **kwargs) -> AuthUserResponse:
+        """
+        异步获取用户信息
+        
+        默认在线程池中执行同步实现，子类可重写为原生异步实现
+        
+        Args:
+            token: 访问令牌
+            **kwargs: 额外参数，便于子类扩展
+            
+        Returns:
+            用户信息
+        """
+        return await self._run_sync(self.get_user_info, token, **kwargs)
+        
+    async def refresh_token_async(self, refresh_token: str) -> AuthTokenResponse:
+        """
+        异步刷新访问令牌
+        
+        默认在线程池中执行同步实现，子类可重写为原生异步实现
+        
+        Args:
+            refresh_token: 刷新令牌
+            
+        Returns:
+            新的访问令牌
+        """
+        return await self._run_sync(self.refresh_token, refresh_token)
+        
+    async def revoke_token_async(self, access_token: str) -> AuthTokenResponse:
+        """
+        异步撤销访问令牌
+        
+        默认在线程池中执行同步实现，子类可重写为原生异步实现
+        
+        Args:
+            access_token: 访问令牌
+            
+        Returns:
+            撤销结果
+        """
+        return await self._run_sync(self.revoke_token, access_token)
+        
+    @staticmethod
+    def _parse_token_response(response: Dict[str, Any], message: str = '获取访问令牌失败',
+                              **defaults) -> AuthTokenResponse:
+        """
+        解析标准OAuth2令牌响应，响应中包含error时返回失败响应
+        
+        Args:
+            response: 响应数据
+            message: 响应中没有error_description时的失败消息
+            **defaults: 令牌字段的默认值，如授权码code、响应中没有返回时沿用的refresh_token
+            
+        Returns:
+            访问令牌
+        """
+        if 'error' in response:
+            return AuthTokenResponse.failure(message=response.get('error_description', message))
+        fields = {'access_token': None, 'token_type': None, 'expires_in': 0, **defaults}
+        fields.update((k, response[k]) for k in _TOKEN_KEYS if k in response)
+        return AuthTokenResponse.success(AuthToken(**fields))
+        
+    @staticmethod
+    def _http_error_response(error: HttpError, message: str = '获取访问令牌失败') -> AuthTokenResponse:
+        """
+        将HTTP状态错误转换为失败响应，优先使用平台返回的错误描述
+        
+        Args:
+            error: HTTP状态错误
+            message: 响应中没有error_description时的失败消息
+            
+        Returns:
+            失败响应
+        """
+        # 响应体可能是JSON数组或标量，只有对象才读取错误描述
+        if isinstance(error.body, dict):
+            message = error.body.get('error_description', message)
+        return AuthTokenResponse.failure(message=message, code=error.status)
+        
+    def _token_body(self, code: str) -> str:
+        """
+        生成换取访问令牌的表单请求体
+        
+        Args:
+            code: 授权码
+            
+        Returns:
+            已编码的表单数据
+        """
+        return self._token_body_prefix + '&code=' + quote_plus(code)
+        
+    def _refresh_body(self, refresh_token: str) -> str:
+        """
+        生成刷新访问令牌的表单请求体
+        
+        Args:
+            refresh_token: 刷新令牌
+            
+        Returns:
+            已编码的表单数据
+        """
+        return self._refresh_body_prefix + '&refresh_token=' + quote_plus(refresh_token)
+        
+    def _check_state(self, callback: Union[Dict[str, Any], AuthCallback]) -> bool:
+        """
+        校验回调中的state参数是否由本服务生成且未过期
+        忽略state校验或回调中没有state时视为通过
+        
+        Args:
+            callback: 回调参数字典或AuthCallback对象
+            
+        Returns:
+            是否通过校验
+        """
+        if self.config.ignore_check_state:
+            return True
+        state = callback.state if isinstance(callback, AuthCallback) else callback.get('state')
+        return not state or bool(self.cache_store.get(state))
+        
+    @staticmethod
+    async def _run_sync(func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        在默认线程池中执行同步方法
+        
+        Args:
+            func: 同步方法
+            
+        Returns:
+            方法返回值
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+# BaseAuthSource默认的授权参数和授权URL构建方法，用于判断子类是否重写
+_DEFAULT_GET_AUTHORIZE_PARAMS = BaseAuthSource.get_authorize_params
+_DEFAULT_BUILD_AUTHORIZE_URL = BaseAuthSource.build_authorize_url
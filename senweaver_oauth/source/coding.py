@@ -2,17 +2,24 @@
 Coding认证源
 """
 
+from types import MappingProxyType
 from typing import Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS, HttpError
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 请求头，要求返回JSON
+_HEADERS = MappingProxyType({
+    'Accept': 'application/json'
+})
+
 
 class AuthCodingSource(BaseAuthSource):
     """
@@ -43,19 +50,11 @@ class AuthCodingSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
+            return EMPTY_CODE_RESPONSE
             
-        params = {
-            'code': callback.code,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'redirect_uri': self.config.redirect_uri,
-            'grant_type': 'authorization_code'
-        }
+        params = {**self._base_token_params, 'code': callback.code}
         
-        headers = {
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -64,23 +63,15 @@ class AuthCodingSource(BaseAuthSource):
                 headers=headers
             )
             
-            if 'error' in response or 'access_token' not in response:
+            if 'access_token' not in response:
                 return AuthTokenResponse.failure(
                     message=response.get('error_description', '获取访问令牌失败')
                 )
-                
-            token = AuthToken(
-                access_token=response.get('access_token'),
-                token_type=response.get('token_type', 'Bearer'),
-                refresh_token=response.get('refresh_token'),
-                expires_in=response.get('expires_in', 0),
-                scope=response.get('scope'),
-                code=callback.code
-            )
-            
-            return AuthTokenResponse.success(token)
+            return self._parse_token_response(response, token_type='Bearer', code=callback.code)
             
-        except Exception as e:
+        except HttpError as e:
+            return self._http_error_response(e)
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -128,5 +119,5 @@ class AuthCodingSource(BaseAuthSource):
             
             return AuthUserResponse.success(user)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}") 
\ No newline at end of file
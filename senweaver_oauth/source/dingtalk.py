@@ -1,19 +1,66 @@
 """
 钉钉认证源
 """
-import uuid
+import base64
+import hashlib
+import hmac
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from secrets import token_urlsafe
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_scope import AuthScope
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
 from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 获取企业访问凭证的线程池，与获取用户身份的请求并发执行，首次使用时创建
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# 按应用区分的企业访问凭证锁，同一应用的多个认证源实例共用，凭证过期时只有一个线程请求新凭证；
+# 只保存弱引用，没有认证源实例使用时自动移除
+_corp_token_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
+_corp_token_locks_guard = threading.Lock()
+
+
+def _get_corp_token_lock(client_id: str) -> threading.Lock:
+    """
+    获取应用的企业访问凭证锁，同一应用只会创建一个
+    
+    Args:
+        client_id: 应用的appKey
+        
+    Returns:
+        锁
+    """
+    with _corp_token_locks_guard:
+        return _corp_token_locks.setdefault(client_id, threading.Lock())
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    获取共享的线程池（懒加载）
+    
+    Returns:
+        线程池
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='senweaver-oauth-dingtalk')
+    return _executor
+
 
 class AuthDingtalkSource(BaseAuthSource):
     """
@@ -33,6 +80,15 @@ class AuthDingtalkSource(BaseAuthSource):
             config=config,
             source=source or AuthDefaultSource.DINGTALK
         )
+        # 企业访问凭证的缓存键和请求参数
+        self._corp_token_key = f"dingtalk_corp_token_{config.client_id}"
+        self._corp_token_lock = _get_corp_token_lock(config.client_id)
+        self._corp_token_params = MappingProxyType({
+            "appkey": config.client_id,
+            "appsecret": config.client_secret
+        })
+        # 以appSecret为密钥的HMAC-SHA256对象，签名时复制使用，密钥只处理一次
+        self._hmac_proto = hmac.new(config.client_secret.encode('utf-8'), digestmod=hashlib.sha256)
         
     def get_authorize_params(self, state: Optional[str] = None) -> Dict[str, str]:
         """
@@ -44,29 +100,24 @@ class AuthDingtalkSource(BaseAuthSource):
         Returns:
             授权参数
         """
+        return {**self._static_authorize_params(), "state": state or token_urlsafe(16)}
+        
+    def _static_authorize_params(self) -> Dict[str, Any]:
+        """
+        获取授权URL中不变的授权参数，使用默认的build_authorize_url，可以使用授权URL模板
+        
+        Returns:
+            不变的授权参数
+        """
         params = {
             "appid": self.config.client_id,
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4())
+            "state": None
         }
         return params
         
-    def build_authorize_url(self, params: Dict[str, str]) -> str:
-        """
-        构建授权URL
-        
-        Args:
-            params: 授权参数
-            
-        Returns:
-            授权URL
-        """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query}"
-        
     def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
         获取访问令牌
@@ -81,21 +132,27 @@ class AuthDingtalkSource(BaseAuthSource):
         Returns:
             访问令牌响应
         """
+        # 企业访问凭证与用户身份互不依赖，未缓存时在线程池中并发获取
+        token_info = self.cache_store.get(self._corp_token_key)
+        token_future = _get_executor().submit(self._get_corp_access_token) if not token_info else None
+        
         # 第一步：通过临时授权码获取用户身份
         temp_auth_code_url = "https://oapi.dingtalk.com/sns/getuserinfo_bycode"
+        timestamp = str(int(self._get_timestamp() * 1000))
         params = {
             "accessKey": self.config.client_id,
-            "timestamp": str(int(self._get_timestamp() * 1000)),
-            "signature": self._compute_signature()
+            "timestamp": timestamp,
+            "signature": self._compute_signature(timestamp)
         }
         
         post_data = {
             "tmp_auth_code": callback.code
         }
         
-        response = self.http_client.post(temp_auth_code_url, params=params, json=post_data)
-                    
-        user_info = response
+        try:
+            user_info = self.http_client.post(temp_auth_code_url, data=post_data, params=params)
+        except HTTP_ERRORS as e:
+            return AuthTokenResponse.error(f"获取用户身份异常: {str(e)}")
         
         if user_info.get("errcode", 0) != 0:
             return AuthTokenResponse(
@@ -110,15 +167,11 @@ class AuthDingtalkSource(BaseAuthSource):
         nick = user_info_data.get("nick", "")
         
         # 第二步：获取企业访问凭证
-        params = {
-            "appkey": self.config.client_id,
-            "appsecret": self.config.client_secret
-        }
-        
-        response = self.http_client.get(self.source.access_token_url, params=params)
-        
-                    
-        token_info = response
+        if token_future is not None:
+            try:
+                token_info = token_future.result()
+            except HTTP_ERRORS as e:
+                return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
         if token_info.get("errcode", 0) != 0:
             return AuthTokenResponse(
@@ -138,7 +191,7 @@ class AuthDingtalkSource(BaseAuthSource):
         # 缓存昵称，用于用户信息构建
         # 由于钉钉获取用户详细信息需要单独的接口和权限
         # 这里暂存用户基本信息
-        self._cache_user_info(token.access_token, {
+        self._cache_user_info(unionid, {
             "nick": nick, 
             "unionid": unionid,
             "openid": openid
@@ -165,7 +218,7 @@ class AuthDingtalkSource(BaseAuthSource):
             用户信息响应
         """
         # 从缓存获取用户基本信息
-        cached_user_info = self._get_cached_user_info(token.access_token)
+        cached_user_info = self._get_cached_user_info(token.union_id)
         
         if not cached_user_info:
             return AuthUserResponse(
@@ -204,15 +257,10 @@ class AuthDingtalkSource(BaseAuthSource):
             刷新后的访问令牌响应
         """
         # 获取企业访问凭证
-        params = {
-            "appkey": self.config.client_id,
-            "appsecret": self.config.client_secret
-        }
-        
-        response = self.http_client.get(self.source.access_token_url, params=params)
-        
-            
-        token_info = response        
+        try:
+            token_info = self._get_corp_access_token()
+        except HTTP_ERRORS as e:
+            return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}")
         if token_info.get("errcode", 0) != 0:
             return AuthTokenResponse(
                 code=token_info.get("errcode", -1),
@@ -248,19 +296,43 @@ class AuthDingtalkSource(BaseAuthSource):
         # 钉钉不支持主动撤销token
         return False
         
-    def _compute_signature(self) -> str:
+    def _get_corp_access_token(self) -> Dict[str, Any]:
         """
-        计算签名
-        钉钉API需要特殊的签名计算逻辑
+        获取企业访问凭证
+        企业访问凭证由所有用户共享，有效期内缓存复用，提前5分钟过期以免使用即将失效的凭证；
+        缓存未命中时加锁后再次检查，并发登录只发出一次请求
         
-        注意：这里简化实现，实际应使用钉钉官方要求的签名算法
+        Returns:
+            企业访问凭证接口的响应数据
+        """
+        token_info = self.cache_store.get(self._corp_token_key)
+        if token_info:
+            return token_info
+            
+        with self._corp_token_lock:
+            token_info = self.cache_store.get(self._corp_token_key)
+            if token_info:
+                return token_info
+            token_info = self.http_client.get(self.source.access_token_url, params=self._corp_token_params)
+            if token_info.get("errcode", 0) == 0 and token_info.get("access_token"):
+                timeout = max(60, int(token_info.get("expires_in", 7200)) - 300)
+                self.cache_store.set(self._corp_token_key, token_info, timeout)
+            return token_info
+        
+    def _compute_signature(self, timestamp: str) -> str:
+        """
+        计算签名
+        钉钉要求以appSecret为密钥，对毫秒时间戳做HMAC-SHA256后进行Base64编码
         
+        Args:
+            timestamp: 毫秒时间戳，与请求参数中的timestamp一致
+            
         Returns:
             签名字符串
         """
-        # 实际应用中应使用HMAC-SHA256算法计算签名
-        # 这里返回一个占位符
-        return "signature_placeholder"
+        h = self._hmac_proto.copy()
+        h.update(timestamp.encode('utf-8'))
+        return base64.b64encode(h.digest()).decode('utf-8')
         
     def _get_timestamp(self) -> float:
         """
@@ -269,30 +341,29 @@ class AuthDingtalkSource(BaseAuthSource):
         Returns:
             当前时间戳（秒）
         """
-        import time
         return time.time()
         
-    def _cache_user_info(self, access_token: str, user_info: Dict[str, Any]) -> None:
+    def _cache_user_info(self, union_id: str, user_info: Dict[str, Any]) -> None:
         """
         缓存用户信息
         
         Args:
-            access_token: 访问令牌
+            union_id: 用户的unionid
             user_info: 用户信息
         """
-        # 使用AuthToken作为key存储用户信息
-        cache_key = f"dingtalk_user_{access_token}"
+        # 访问令牌由所有用户共享，使用unionid作为key存储用户信息
+        cache_key = f"dingtalk_user_{union_id}"
         self.cache_store.set(cache_key, user_info)
         
-    def _get_cached_user_info(self, access_token: str) -> Optional[Dict[str, Any]]:
+    def _get_cached_user_info(self, union_id: str) -> Optional[Dict[str, Any]]:
         """
         获取缓存的用户信息
         
         Args:
-            access_token: 访问令牌
+            union_id: 用户的unionid
             
         Returns:
             用户信息字典，如果不存在则返回None
         """
-        cache_key = f"dingtalk_user_{access_token}"
+        cache_key = f"dingtalk_user_{union_id}"
         return self.cache_store.get(cache_key) 
\ No newline at end of file
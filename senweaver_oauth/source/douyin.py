@@ -1,8 +1,8 @@
 """
 抖音认证源
 """
-import uuid
-from typing import Dict, Optional
+from secrets import token_urlsafe
+from typing import Any, Dict, Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_scope import AuthScope
@@ -49,29 +49,41 @@ class AuthDouyinSource(BaseAuthSource):
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4())
+            "state": state or token_urlsafe(16)
         }
         return params
         
-    def build_authorize_url(self, params: Dict[str, str]) -> str:
+    def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
-        构建授权URL
+        获取访问令牌
+        
+        抖音API需要使用client_key和client_secret
         
         Args:
-            params: 授权参数
+            callback: 授权回调参数
             
         Returns:
-            授权URL
+            访问令牌响应
         """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query}"
+        response = self.http_client.get(self.source.access_token_url, params=self._token_params(callback))
+        return self._parse_token(response)
         
-    def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
+    def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
         """
-        获取访问令牌
+        获取用户信息
         
-        抖音API需要使用client_key和client_secret
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            用户信息响应
+        """
+        response = self.http_client.get(self.source.user_info_url, params=self._user_params(token))
+        return self._parse_user(response, token)
+        
+    async def get_access_token_async(self, callback: AuthCallback) -> AuthTokenResponse:
+        """
+        异步获取访问令牌
         
         Args:
             callback: 授权回调参数
@@ -79,18 +91,66 @@ class AuthDouyinSource(BaseAuthSource):
         Returns:
             访问令牌响应
         """
-        params = {
+        response = await self.async_http_client.get(self.source.access_token_url, params=self._token_params(callback))
+        return self._parse_token(response)
+        
+    async def get_user_info_async(self, token: AuthToken, **kwargs) -> AuthUserResponse:
+        """
+        异步获取用户信息
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            用户信息响应
+        """
+        response = await self.async_http_client.get(self.source.user_info_url, params=self._user_params(token))
+        return self._parse_user(response, token)
+        
+    def _token_params(self, callback: AuthCallback) -> Dict[str, str]:
+        """
+        获取换取访问令牌的请求参数
+        
+        Args:
+            callback: 授权回调参数
+            
+        Returns:
+            请求参数
+        """
+        return {
             "client_key": self.config.client_id,
             "client_secret": self.config.client_secret,
             "code": callback.code,
             "grant_type": "authorization_code"
         }
         
-        response = self.http_client.get(self.source.access_token_url, params=params)
+    @staticmethod
+    def _user_params(token: AuthToken) -> Dict[str, str]:
+        """
+        获取用户信息的请求参数
         
+        Args:
+            token: 访问令牌
             
-        data = response
+        Returns:
+            请求参数
+        """
+        return {
+            "access_token": token.access_token,
+            "open_id": token.open_id
+        }
+        
+    @staticmethod
+    def _parse_token(data: Dict[str, Any]) -> AuthTokenResponse:
+        """
+        解析访问令牌响应，同步和异步实现共用
         
+        Args:
+            data: 响应数据
+            
+        Returns:
+            访问令牌响应
+        """
         # 抖音API返回格式：{"data": {...}, "message": "success"}
         if data.get("message") != "success":
             return AuthTokenResponse(
@@ -115,25 +175,17 @@ class AuthDouyinSource(BaseAuthSource):
             data=token
         )
         
-    def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
+    def _parse_user(self, data: Dict[str, Any], token: AuthToken) -> AuthUserResponse:
         """
-        获取用户信息
+        解析用户信息响应，同步和异步实现共用
         
         Args:
+            data: 响应数据
             token: 访问令牌
             
         Returns:
             用户信息响应
         """
-        params = {
-            "access_token": token.access_token,
-            "open_id": token.open_id
-        }
-        
-        response = self.http_client.get(self.source.user_info_url, params=params)
-                    
-        data = response
-        
         # 抖音API返回格式：{"data": {...}, "message": "success"}
         if data.get("message") != "success":
             return AuthUserResponse(
@@ -238,9 +290,4 @@ class AuthDouyinSource(BaseAuthSource):
         Returns:
             性别枚举
         """
-        if gender == 1:
-            return AuthGender.MALE
-        elif gender == 2:
-            return AuthGender.FEMALE
-        else:
-            return AuthGender.UNKNOWN 
\ No newline at end of file
+        return AuthGender.get_gender(gender)
\ No newline at end of file
@@ -2,18 +2,24 @@
 饿了么认证源
 """
 
-from typing import Optional
-import time
+from types import MappingProxyType
+from typing import Any, Dict, Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE, NO_REFRESH_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 请求头，要求返回JSON
+_HEADERS = MappingProxyType({
+    'Accept': 'application/json'
+})
+
 
 class AuthElemeSource(BaseAuthSource):
     """
@@ -44,19 +50,11 @@ class AuthElemeSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
-            
-        params = {
-            'code': callback.code,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'redirect_uri': self.config.redirect_uri,
-            'grant_type': 'authorization_code'
-        }
+            return EMPTY_CODE_RESPONSE
+            
+        params = {**self._base_token_params, 'code': callback.code}
         
-        headers = {
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -64,29 +62,9 @@ class AuthElemeSource(BaseAuthSource):
                 data=params,
                 headers=headers
             )
+            return self._parse_token(response, '获取访问令牌失败', code=callback.code)
             
-            if 'error' in response:
-                return AuthTokenResponse.failure(
-                    message=response.get('error_description', '获取访问令牌失败')
-                )
-                
-            # 计算过期时间
-            expires_in = response.get('expires_in', 0)
-            if expires_in:
-                expires_in = int(expires_in)
-                
-            token = AuthToken(
-                access_token=response.get('access_token'),
-                token_type=response.get('token_type', 'Bearer'),
-                refresh_token=response.get('refresh_token'),
-                expires_in=expires_in,
-                scope=response.get('scope'),
-                code=callback.code
-            )
-            
-            return AuthTokenResponse.success(token)
-            
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -100,35 +78,10 @@ class AuthElemeSource(BaseAuthSource):
             用户信息
         """
         try:
-            headers = {
-                'Authorization': f"Bearer {token.access_token}",
-                'Accept': 'application/json'
-            }
-            response = self.http_client.get(self.source.user_info_url, headers=headers)
-            
-            if 'error' in response or response.get('status') != 'success':
-                error_msg = response.get('error_description') or response.get('message') or '获取用户信息失败'
-                return AuthUserResponse.failure(error_msg)
-            
-            # 获取用户信息
-            user_info = response.get('data', {})
-            
-            user = AuthUser(
-                uuid=str(user_info.get('userId')),
-                username=user_info.get('userName', ''),
-                nickname=user_info.get('shopName'),
-                avatar=user_info.get('shopLogo'),
-                mobile=user_info.get('mobile'),
-                email=user_info.get('email'),
-                gender=AuthGender.UNKNOWN,
-                source=self.source.name,
-                token=token,
-                raw_user_info=response
-            )
+            response = self.http_client.get(self.source.user_info_url, headers=self._user_headers(token))
+            return self._parse_user(response, token)
             
-            return AuthUserResponse.success(user)
-            
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
             
     def refresh_token(self, refresh_token: str) -> AuthTokenResponse:
@@ -142,18 +95,11 @@ class AuthElemeSource(BaseAuthSource):
             新的访问令牌
         """
         if not self.source.refresh_token_url:
-            return AuthTokenResponse.not_implemented("该平台不支持刷新令牌")
+            return NO_REFRESH_RESPONSE
             
-        params = {
-            'refresh_token': refresh_token,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'grant_type': 'refresh_token'
-        }
+        params = {**self._base_refresh_params, 'refresh_token': refresh_token}
         
-        headers = {
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -161,26 +107,159 @@ class AuthElemeSource(BaseAuthSource):
                 data=params,
                 headers=headers
             )
+            return self._parse_token(response, '刷新访问令牌失败', refresh_token=refresh_token)
+            
+        except HTTP_ERRORS as e:
+            return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}")
+            
+    async def get_access_token_async(self, callback: AuthCallback) -> AuthTokenResponse:
+        """
+        异步获取访问令牌
+        
+        Args:
+            callback: 回调参数
+            
+        Returns:
+            访问令牌
+        """
+        if not callback.code:
+            return EMPTY_CODE_RESPONSE
+            
+        params = {**self._base_token_params, 'code': callback.code}
+        
+        try:
+            response = await self.async_http_client.post(
+                self.source.access_token_url,
+                data=params,
+                headers=_HEADERS
+            )
+            return self._parse_token(response, '获取访问令牌失败', code=callback.code)
+            
+        except HTTP_ERRORS as e:
+            return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
+            
+    async def get_user_info_async(self, token: AuthToken, **kwargs) -> AuthUserResponse:
+        """
+        异步获取用户信息
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            用户信息
+        """
+        try:
+            response = await self.async_http_client.get(self.source.user_info_url, headers=self._user_headers(token))
+            return self._parse_user(response, token)
+            
+        except HTTP_ERRORS as e:
+            return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
+            
+    async def refresh_token_async(self, refresh_token: str) -> AuthTokenResponse:
+        """
+        异步刷新访问令牌
+        
+        Args:
+            refresh_token: 刷新令牌
+            
+        Returns:
+            新的访问令牌
+        """
+        if not self.source.refresh_token_url:
+            return NO_REFRESH_RESPONSE
+            
+        params = {**self._base_refresh_params, 'refresh_token': refresh_token}
+        
+        try:
+            response = await self.async_http_client.post(
+                self.source.refresh_token_url,
+                data=params,
+                headers=_HEADERS
+            )
+            return self._parse_token(response, '刷新访问令牌失败', refresh_token=refresh_token)
+            
+        except HTTP_ERRORS as e:
+            return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}")
+            
+    @staticmethod
+    def _user_headers(token: AuthToken) -> Dict[str, str]:
+        """
+        获取用户信息的请求头
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            请求头
+        """
+        return {
+            'Authorization': token.authorization,
+            'Accept': 'application/json'
+        }
+        
+    @staticmethod
+    def _parse_token(response: Dict[str, Any], message: str, **defaults) -> AuthTokenResponse:
+        """
+        解析访问令牌响应，换取和刷新令牌、同步和异步实现共用
+        
+        Args:
+            response: 响应数据
+            message: 响应中没有error_description时的失败消息
+            **defaults: 令牌字段的默认值，如授权码code、响应中没有返回时沿用的refresh_token
             
-            if 'error' in response:
-                return AuthTokenResponse.failure(
-                    message=response.get('error_description', '刷新访问令牌失败')
-                )
-            
-            # 计算过期时间
-            expires_in = response.get('expires_in', 0)
-            if expires_in:
-                expires_in = int(expires_in)
-                
-            token = AuthToken(
-                access_token=response.get('access_token'),
-                token_type=response.get('token_type', 'Bearer'),
-                refresh_token=response.get('refresh_token', refresh_token),
-                expires_in=expires_in,
-                scope=response.get('scope')
+        Returns:
+            访问令牌
+        """
+        if 'error' in response:
+            return AuthTokenResponse.failure(
+                message=response.get('error_description', message)
             )
             
-            return AuthTokenResponse.success(token)
+        # 计算过期时间
+        expires_in = response.get('expires_in', 0)
+        if expires_in:
+            expires_in = int(expires_in)
             
-        except Exception as e:
-            return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}") 
\ No newline at end of file
+        token = AuthToken(
+            access_token=response.get('access_token'),
+            token_type=response.get('token_type', 'Bearer'),
+            refresh_token=response.get('refresh_token', defaults.pop('refresh_token', None)),
+            expires_in=expires_in,
+            scope=response.get('scope'),
+            **defaults
+        )
+        
+        return AuthTokenResponse.success(token)
+        
+    def _parse_user(self, response: Dict[str, Any], token: AuthToken) -> AuthUserResponse:
+        """
+        解析用户信息响应，同步和异步实现共用
+        
+        Args:
+            response: 响应数据
+            token: 访问令牌
+            
+        Returns:
+            用户信息
+        """
+        if 'error' in response or response.get('status') != 'success':
+            error_msg = response.get('error_description') or response.get('message') or '获取用户信息失败'
+            return AuthUserResponse.failure(error_msg)
+        
+        # 获取用户信息
+        user_info = response.get('data', {})
+        
+        user = AuthUser(
+            uuid=str(user_info.get('userId')),
+            username=user_info.get('userName', ''),
+            nickname=user_info.get('shopName'),
+            avatar=user_info.get('shopLogo'),
+            mobile=user_info.get('mobile'),
+            email=user_info.get('email'),
+            gender=AuthGender.UNKNOWN,
+            source=self.source.name,
+            token=token,
+            raw_user_info=response
+        )
+        
+        return AuthUserResponse.success(user)
@@ -1,8 +1,8 @@
 """
 Facebook认证源
 """
-import uuid
-from typing import Dict, Optional
+from secrets import token_urlsafe
+from typing import Any, Dict, Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_scope import AuthScope
@@ -14,6 +14,9 @@ from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 获取用户信息时请求的字段
+_USER_FIELDS = "id,name,email,picture.type(large)"
+
 
 class AuthFacebookSource(BaseAuthSource):
     """
@@ -49,27 +52,39 @@ class AuthFacebookSource(BaseAuthSource):
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4())
+            "state": state or token_urlsafe(16)
         }
         return params
         
-    def build_authorize_url(self, params: Dict[str, str]) -> str:
+    def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
-        构建授权URL
+        获取访问令牌
         
         Args:
-            params: 授权参数
+            callback: 授权回调参数
             
         Returns:
-            授权URL
+            访问令牌响应
         """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query}"
+        response = self.http_client.get(self.source.access_token_url, params=self._token_params(callback))
+        return self._parse_token(response)
         
-    def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
+    def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
         """
-        获取访问令牌
+        获取用户信息
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            用户信息响应
+        """
+        response = self.http_client.get(self.source.user_info_url, params=self._user_params(token))
+        return self._parse_user(response, token)
+        
+    async def get_access_token_async(self, callback: AuthCallback) -> AuthTokenResponse:
+        """
+        异步获取访问令牌
         
         Args:
             callback: 授权回调参数
@@ -77,16 +92,67 @@ class AuthFacebookSource(BaseAuthSource):
         Returns:
             访问令牌响应
         """
-        params = {
+        response = await self.async_http_client.get(self.source.access_token_url, params=self._token_params(callback))
+        return self._parse_token(response)
+        
+    async def get_user_info_async(self, token: AuthToken, **kwargs) -> AuthUserResponse:
+        """
+        异步获取用户信息
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            用户信息响应
+        """
+        response = await self.async_http_client.get(self.source.user_info_url, params=self._user_params(token))
+        return self._parse_user(response, token)
+        
+    def _token_params(self, callback: AuthCallback) -> Dict[str, str]:
+        """
+        获取换取访问令牌的请求参数
+        
+        Args:
+            callback: 授权回调参数
+            
+        Returns:
+            请求参数
+        """
+        return {
             "client_id": self.config.client_id,
             "client_secret": self.config.client_secret,
             "code": callback.code,
             "redirect_uri": self.config.redirect_uri
         }
         
-        response = self.http_client.get(self.source.access_token_url, params=params)
+    @staticmethod
+    def _user_params(token: AuthToken) -> Dict[str, str]:
+        """
+        获取用户信息的请求参数
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            请求参数
+        """
+        # Facebook Graph API的用户信息请求参数
+        return {
+            "access_token": token.access_token,
+            "fields": _USER_FIELDS
+        }
         
-        data = response        
+    @staticmethod
+    def _parse_token(data: Dict[str, Any]) -> AuthTokenResponse:
+        """
+        解析访问令牌响应，同步和异步实现共用
+        
+        Args:
+            data: 响应数据
+            
+        Returns:
+            访问令牌响应
+        """
         if "error" in data:
             return AuthTokenResponse(
                 code=400,
@@ -105,27 +171,17 @@ class AuthFacebookSource(BaseAuthSource):
             data=token
         )
         
-    def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
+    def _parse_user(self, data: Dict[str, Any], token: AuthToken) -> AuthUserResponse:
         """
-        获取用户信息
+        解析用户信息响应，同步和异步实现共用
         
         Args:
+            data: 响应数据
             token: 访问令牌
             
         Returns:
             用户信息响应
         """
-        # Facebook Graph API的用户信息请求参数
-        fields = "id,name,email,picture.type(large)"
-        params = {
-            "access_token": token.access_token,
-            "fields": fields
-        }
-        
-        response = self.http_client.get(self.source.user_info_url, params=params)
-                    
-        data = response
-        
         if "error" in data:
             return AuthUserResponse(
                 code=400,
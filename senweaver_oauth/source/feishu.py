@@ -1,8 +1,9 @@
 """
 飞书认证源
 """
-import uuid
-from typing import Dict, Optional
+from secrets import token_urlsafe
+from types import MappingProxyType
+from typing import Any, Dict, Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
@@ -13,6 +14,11 @@ from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 from senweaver_oauth.enums.auth_gender import AuthGender
 
+# JSON请求的请求头
+_HEADERS = MappingProxyType({
+    "Content-Type": "application/json"
+})
+
 
 class AuthFeishuSource(BaseAuthSource):
     """
@@ -46,27 +52,43 @@ class AuthFeishuSource(BaseAuthSource):
         params = {
             "app_id": self.config.client_id,
             "redirect_uri": self.config.redirect_uri,
-            "state": state or str(uuid.uuid4())
+            "state": state or token_urlsafe(16)
         }
         return params
         
-    def build_authorize_url(self, params: Dict[str, str]) -> str:
+    def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
-        构建授权URL
+        获取访问令牌
         
         Args:
-            params: 授权参数
+            callback: 授权回调参数
             
         Returns:
-            授权URL
+            访问令牌响应
         """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query}"
+        response = self.http_client.post(
+            self.source.access_token_url, 
+            data=self._token_data(callback),
+            headers=_HEADERS
+        )
+        return self._parse_token(response)
         
-    def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
+    def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
         """
-        获取访问令牌
+        获取用户信息
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            用户信息响应
+        """
+        response = self.http_client.get(self.source.user_info_url, headers=self._user_headers(token))
+        return self._parse_user(response, token)
+        
+    async def get_access_token_async(self, callback: AuthCallback) -> AuthTokenResponse:
+        """
+        异步获取访问令牌
         
         Args:
             callback: 授权回调参数
@@ -74,26 +96,70 @@ class AuthFeishuSource(BaseAuthSource):
         Returns:
             访问令牌响应
         """
-        # 飞书API需要使用JSON格式请求
-        json_data = {
+        response = await self.async_http_client.post(
+            self.source.access_token_url,
+            data=self._token_data(callback),
+            headers=_HEADERS
+        )
+        return self._parse_token(response)
+        
+    async def get_user_info_async(self, token: AuthToken, **kwargs) -> AuthUserResponse:
+        """
+        异步获取用户信息
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            用户信息响应
+        """
+        response = await self.async_http_client.get(self.source.user_info_url, headers=self._user_headers(token))
+        return self._parse_user(response, token)
+        
+    def _token_data(self, callback: AuthCallback) -> Dict[str, str]:
+        """
+        获取换取访问令牌的请求体，飞书API需要使用JSON格式请求
+        
+        Args:
+            callback: 授权回调参数
+            
+        Returns:
+            请求体数据
+        """
+        return {
             "app_id": self.config.client_id,
             "app_secret": self.config.client_secret,
             "grant_type": "authorization_code",
             "code": callback.code
         }
         
-        headers = {
+    @staticmethod
+    def _user_headers(token: AuthToken) -> Dict[str, str]:
+        """
+        获取用户信息的请求头
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            请求头
+        """
+        return {
+            "Authorization": token.authorization,
             "Content-Type": "application/json"
         }
         
-        response = self.http_client.post(
-            self.source.access_token_url, 
-            json=json_data,
-            headers=headers
-        )
-                    
-        data = response
+    @staticmethod
+    def _parse_token(data: Dict[str, Any]) -> AuthTokenResponse:
+        """
+        解析访问令牌响应，同步和异步实现共用
         
+        Args:
+            data: 响应数据
+            
+        Returns:
+            访问令牌响应
+        """
         # 飞书API返回格式：{"code": 0, "msg": "success", "data": {...}}
         if data.get("code") != 0:
             return AuthTokenResponse(
@@ -111,7 +177,7 @@ class AuthFeishuSource(BaseAuthSource):
             id_token=token_data.get("id_token", ""),
             open_id=token_data.get("open_id", ""),
             union_id=token_data.get("union_id", ""),
-            tenant_key=token_data.get("tenant_key", "")
+            extras={"tenant_key": token_data.get("tenant_key", "")}
         )
         
         return AuthTokenResponse(
@@ -120,25 +186,17 @@ class AuthFeishuSource(BaseAuthSource):
             data=token
         )
         
-    def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
+    def _parse_user(self, data: Dict[str, Any], token: AuthToken) -> AuthUserResponse:
         """
-        获取用户信息
+        解析用户信息响应，同步和异步实现共用
         
         Args:
+            data: 响应数据
             token: 访问令牌
             
         Returns:
             用户信息响应
         """
-        headers = {
-            "Authorization": f"Bearer {token.access_token}",
-            "Content-Type": "application/json"
-        }
-        
-        response = self.http_client.get(self.source.user_info_url, headers=headers)
-                    
-        data = response
-        
         # 飞书API返回格式：{"code": 0, "msg": "success", "data": {...}}
         if data.get("code") != 0:
             return AuthUserResponse(
@@ -197,13 +255,11 @@ class AuthFeishuSource(BaseAuthSource):
             "refresh_token": token.refresh_token
         }
         
-        headers = {
-            "Content-Type": "application/json"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.refresh_token_url, 
-            json=json_data,
+            data=json_data,
             headers=headers
         )
                     
@@ -225,7 +281,7 @@ class AuthFeishuSource(BaseAuthSource):
             refresh_token=token_data.get("refresh_token", ""),
             open_id=token.open_id,
             union_id=token.union_id,
-            tenant_key=token.tenant_key
+            extras={"tenant_key": token.extras.get("tenant_key", "")}
         )
         
         return AuthTokenResponse(
@@ -261,9 +317,4 @@ class AuthFeishuSource(BaseAuthSource):
         Returns:
             性别枚举
         """
-        if gender == 1:
-            return AuthGender.MALE
-        elif gender == 2:
-            return AuthGender.FEMALE
-        else:
-            return AuthGender.UNKNOWN 
\ No newline at end of file
+        return AuthGender.get_gender(gender)
\ No newline at end of file
@@ -5,8 +5,9 @@ Gitee认证源
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_source import AuthDefaultSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
@@ -41,15 +42,9 @@ class AuthGiteeSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
+            return EMPTY_CODE_RESPONSE
             
-        params = {
-            'grant_type': 'authorization_code',
-            'code': callback.code,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'redirect_uri': self.config.redirect_uri
-        }
+        params = {**self._base_token_params, 'code': callback.code}
         
         try:
             response = self.http_client.post(self.source.access_token_url, data=params)
@@ -70,7 +65,7 @@ class AuthGiteeSource(BaseAuthSource):
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -84,7 +79,7 @@ class AuthGiteeSource(BaseAuthSource):
             用户信息
         """
         try:
-            headers = {'Authorization': f"Bearer {token.access_token}"}
+            headers = {'Authorization': token.authorization}
             response = self.http_client.get(self.source.user_info_url, headers=headers)
             
             if 'message' in response and response.get('message') != 'success':
@@ -108,7 +103,7 @@ class AuthGiteeSource(BaseAuthSource):
             
             return AuthUserResponse.success(user)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
             
     def refresh_token(self, refresh_token: str) -> AuthTokenResponse:
@@ -121,12 +116,7 @@ class AuthGiteeSource(BaseAuthSource):
         Returns:
             新的访问令牌
         """
-        params = {
-            'grant_type': 'refresh_token',
-            'refresh_token': refresh_token,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret
-        }
+        params = {**self._base_refresh_params, 'refresh_token': refresh_token}
         
         try:
             response = self.http_client.post(self.source.refresh_token_url, data=params)
@@ -146,5 +136,5 @@ class AuthGiteeSource(BaseAuthSource):
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}") 
\ No newline at end of file
@@ -5,14 +5,19 @@ GitHub认证源
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_source import AuthDefaultSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
-from typing import Optional
+from typing import Any, Dict, Optional
 from senweaver_oauth.enums.auth_source import AuthSource
 
+# 换取访问令牌时要求返回JSON
+_ACCEPT_JSON = {'Accept': 'application/json'}
+
+
 class AuthGithubSource(BaseAuthSource):
     """
     GitHub认证源
@@ -41,43 +46,19 @@ class AuthGithubSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
+            return EMPTY_CODE_RESPONSE
  
-        params = {
-            'code': callback.code,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'redirect_uri': self.config.redirect_uri,
-            'grant_type': 'authorization_code'
-        }
-        
-        headers = {
-            'Accept': 'application/json'
-        }
+        params = {**self._base_token_params, 'code': callback.code}
         
         try:
             response = self.http_client.post(
                 self.source.access_token_url, 
                 data=params,
-                headers=headers
-            )
-            
-            if 'error' in response:
-                return AuthTokenResponse.failure(
-                    message=response.get('error_description', '获取访问令牌失败')
-                )
-                
-            token = AuthToken(
-                access_token=response.get('access_token'),
-                token_type=response.get('token_type'),
-                expires_in=response.get('expires_in', 0),  # GitHub令牌默认不过期
-                scope=response.get('scope'),
-                code=callback.code
+                headers=_ACCEPT_JSON
             )
+            return self._parse_token_response(response, code=callback.code)
             
-            return AuthTokenResponse.success(token)
-            
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -91,32 +72,99 @@ class AuthGithubSource(BaseAuthSource):
             用户信息
         """
         try:
-            headers = {
-                'Authorization': f"token {token.access_token}",
-                'Accept': 'application/json'
-            }            
-            response = self.http_client.get(self.source.user_info_url, headers=headers)
+            response = self.http_client.get(self.source.user_info_url, headers=self._user_headers(token))
+            return self._parse_user(response, token)
+            
+        except HTTP_ERRORS as e:
+            return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
+            
+    async def get_access_token_async(self, callback: AuthCallback) -> AuthTokenResponse:
+        """
+        异步获取访问令牌
+        
+        Args:
+            callback: 回调参数
             
-            if 'message' in response and response.get('message') != 'success':
-                return AuthUserResponse.failure(response.get('message', '获取用户信息失败'))
-                
-            user = AuthUser(
-                uuid=str(response.get('id')),
-                username=response.get('login'),
-                nickname=response.get('name'),
-                avatar=response.get('avatar_url'),
-                blog=response.get('blog'),
-                company=response.get('company'),
-                location=response.get('location'),
-                email=response.get('email'),
-                remark=response.get('bio'),
-                gender=AuthGender.UNKNOWN,  # GitHub API不返回性别
-                source=self.source.name,
-                token=token,
-                raw_user_info=response
+        Returns:
+            访问令牌
+        """
+        if not callback.code:
+            return EMPTY_CODE_RESPONSE
+            
+        params = {**self._base_token_params, 'code': callback.code}
+        
+        try:
+            response = await self.async_http_client.post(
+                self.source.access_token_url,
+                data=params,
+                headers=_ACCEPT_JSON
             )
+            return self._parse_token_response(response, code=callback.code)
+            
+        except HTTP_ERRORS as e:
+            return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
+            
+    async def get_user_info_async(self, token: AuthToken, **kwargs) -> AuthUserResponse:
+        """
+        异步获取用户信息
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            用户信息
+        """
+        try:
+            response = await self.async_http_client.get(self.source.user_info_url, headers=self._user_headers(token))
+            return self._parse_user(response, token)
+            
+        except HTTP_ERRORS as e:
+            return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
+            
+    @staticmethod
+    def _user_headers(token: AuthToken) -> Dict[str, str]:
+        """
+        获取用户信息的请求头
+        
+        Args:
+            token: 访问令牌
+            
+        Returns:
+            请求头
+        """
+        return {
+            'Authorization': f"token {token.access_token}",
+            'Accept': 'application/json'
+        }
+        
+    def _parse_user(self, response: Dict[str, Any], token: AuthToken) -> AuthUserResponse:
+        """
+        解析用户信息响应，同步和异步实现共用
+        
+        Args:
+            response: 响应数据
+            token: 访问令牌
             
-            return AuthUserResponse.success(user)
+        Returns:
+            用户信息
+        """
+        if 'message' in response and response.get('message') != 'success':
+            return AuthUserResponse.failure(response.get('message', '获取用户信息失败'))
             
-        except Exception as e:
-            return AuthUserResponse.error(f"获取用户信息异常: {str(e)}") 
\ No newline at end of file
+        user = AuthUser(
+            uuid=str(response.get('id')),
+            username=response.get('login'),
+            nickname=response.get('name'),
+            avatar=response.get('avatar_url'),
+            blog=response.get('blog'),
+            company=response.get('company'),
+            location=response.get('location'),
+            email=response.get('email'),
+            remark=response.get('bio'),
+            gender=AuthGender.UNKNOWN,  # GitHub API不返回性别
+            source=self.source.name,
+            token=token,
+            raw_user_info=response
+        )
+        
+        return AuthUserResponse.success(user)
@@ -1,7 +1,8 @@
 """
 Google认证源
 """
-import uuid
+from secrets import token_urlsafe
+from types import MappingProxyType
 from typing import Dict, Optional
 
 from senweaver_oauth.config import AuthConfig
@@ -14,6 +15,11 @@ from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 表单请求的请求头
+_HEADERS = MappingProxyType({
+    "Content-Type": "application/x-www-form-urlencoded"
+})
+
 
 class AuthGoogleSource(BaseAuthSource):
     """
@@ -49,26 +55,12 @@ class AuthGoogleSource(BaseAuthSource):
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4()),
+            "state": state or token_urlsafe(16),
             "access_type": "offline",  # 获取刷新令牌
             "prompt": "consent"  # 每次都显示同意页面，以获取新的刷新令牌
         }
         return params
         
-    def build_authorize_url(self, params: Dict[str, str]) -> str:
-        """
-        构建授权URL
-        
-        Args:
-            params: 授权参数
-            
-        Returns:
-            授权URL
-        """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query}"
-        
     def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
         获取访问令牌
@@ -87,9 +79,7 @@ class AuthGoogleSource(BaseAuthSource):
             "grant_type": "authorization_code"
         }
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.access_token_url, 
@@ -131,7 +121,7 @@ class AuthGoogleSource(BaseAuthSource):
             用户信息响应
         """
         headers = {
-            "Authorization": f"Bearer {token.access_token}"
+            "Authorization": token.authorization
         }
         
         response = self.http_client.get(self.source.user_info_url, headers=headers)
@@ -188,9 +178,7 @@ class AuthGoogleSource(BaseAuthSource):
             "grant_type": "refresh_token"
         }
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.refresh_token_url, 
@@ -239,9 +227,7 @@ class AuthGoogleSource(BaseAuthSource):
             "token": token.access_token
         }
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        headers = _HEADERS
         
         self.http_client.post(revoke_url, data=params, headers=headers)
         
@@ -2,18 +2,26 @@
 华为认证源
 """
 
+from types import MappingProxyType
 from typing import Optional
 import time
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE, NO_REFRESH_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 请求头
+_HEADERS = MappingProxyType({
+    'Content-Type': 'application/x-www-form-urlencoded',
+    'Accept': 'application/json'
+})
+
 
 class AuthHuaweiSource(BaseAuthSource):
     """
@@ -44,20 +52,11 @@ class AuthHuaweiSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
-            
-        params = {
-            'code': callback.code,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'redirect_uri': self.config.redirect_uri,
-            'grant_type': 'authorization_code'
-        }
+            return EMPTY_CODE_RESPONSE
+            
+        params = self._token_body(callback.code)
         
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -82,11 +81,11 @@ class AuthHuaweiSource(BaseAuthSource):
             
             id_token = response.get('id_token')
             if id_token:
-                token.ext_data = {'id_token': id_token}
+                token.extras.update({'id_token': id_token})
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -143,7 +142,7 @@ class AuthHuaweiSource(BaseAuthSource):
             
             return AuthUserResponse.success(user)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
             
     def refresh_token(self, refresh_token: str) -> AuthTokenResponse:
@@ -157,19 +156,11 @@ class AuthHuaweiSource(BaseAuthSource):
             新的访问令牌
         """
         if not self.source.refresh_token_url:
-            return AuthTokenResponse.not_implemented("该平台不支持刷新令牌")
-            
-        params = {
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'refresh_token': refresh_token,
-            'grant_type': 'refresh_token'
-        }
+            return NO_REFRESH_RESPONSE
+            
+        params = self._refresh_body(refresh_token)
         
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -193,9 +184,9 @@ class AuthHuaweiSource(BaseAuthSource):
             
             id_token = response.get('id_token')
             if id_token:
-                token.ext_data = {'id_token': id_token}
+                token.extras.update({'id_token': id_token})
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}") 
\ No newline at end of file
@@ -1,10 +1,11 @@
 """
 京东认证源
 """
-import uuid
+from secrets import token_urlsafe
 import json
 import time
 import hashlib
+from types import MappingProxyType
 from typing import Dict, Optional
 from urllib.parse import urlencode
 
@@ -18,6 +19,11 @@ from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 表单请求的请求头
+_HEADERS = MappingProxyType({
+    "Content-Type": "application/x-www-form-urlencoded"
+})
+
 
 class AuthJdSource(BaseAuthSource):
     """
@@ -53,7 +59,7 @@ class AuthJdSource(BaseAuthSource):
             "response_type": "code",
             "redirect_uri": self.config.redirect_uri,
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4())
+            "state": state or token_urlsafe(16)
         }
         return params
         
@@ -88,9 +94,7 @@ class AuthJdSource(BaseAuthSource):
             "code": callback.code
         }
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.access_token_url,
@@ -150,9 +154,7 @@ class AuthJdSource(BaseAuthSource):
         # 计算签名，京东API使用特定的签名算法
         method_params["sign"] = self._sign(method_params)
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.user_info_url,
@@ -219,9 +221,7 @@ class AuthJdSource(BaseAuthSource):
             "refresh_token": token.refresh_token
         }
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.refresh_token_url,
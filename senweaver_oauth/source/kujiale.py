@@ -2,17 +2,24 @@
 酷家乐认证源
 """
 
+from types import MappingProxyType
 from typing import Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE, NO_REFRESH_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 请求头，要求返回JSON
+_HEADERS = MappingProxyType({
+    'Accept': 'application/json'
+})
+
 
 class AuthKujialeSource(BaseAuthSource):
     """
@@ -43,19 +50,11 @@ class AuthKujialeSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
-            
-        params = {
-            'code': callback.code,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'redirect_uri': self.config.redirect_uri,
-            'grant_type': 'authorization_code'
-        }
+            return EMPTY_CODE_RESPONSE
+            
+        params = {**self._base_token_params, 'code': callback.code}
         
-        headers = {
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -82,14 +81,14 @@ class AuthKujialeSource(BaseAuthSource):
             )
             
             # 保存额外信息
-            token.ext_data = {
+            token.extras.update({
                 'uid': data.get('uid', ''),
                 'open_id': data.get('openid', '')
-            }
+            })
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -104,7 +103,7 @@ class AuthKujialeSource(BaseAuthSource):
         """
         try:
             headers = {
-                'Authorization': f"Bearer {token.access_token}",
+                'Authorization': token.authorization,
                 'Accept': 'application/json'
             }
             
@@ -118,8 +117,8 @@ class AuthKujialeSource(BaseAuthSource):
             
             # 提取UID
             uid = ''
-            if hasattr(token, 'ext_data') and token.ext_data:
-                uid = token.ext_data.get('uid', '')
+            if token.extras:
+                uid = token.extras.get('uid', '')
                 
             if not uid and 'uid' in user_data:
                 uid = user_data.get('uid')
@@ -139,7 +138,7 @@ class AuthKujialeSource(BaseAuthSource):
             
             return AuthUserResponse.success(user)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
             
     def refresh_token(self, refresh_token: str) -> AuthTokenResponse:
@@ -153,18 +152,11 @@ class AuthKujialeSource(BaseAuthSource):
             新的访问令牌
         """
         if not self.source.refresh_token_url:
-            return AuthTokenResponse.not_implemented("该平台不支持刷新令牌")
-            
-        params = {
-            'refresh_token': refresh_token,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'grant_type': 'refresh_token'
-        }
+            return NO_REFRESH_RESPONSE
+            
+        params = {**self._base_refresh_params, 'refresh_token': refresh_token}
         
-        headers = {
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -190,12 +182,12 @@ class AuthKujialeSource(BaseAuthSource):
             )
             
             # 保存额外信息
-            token.ext_data = {
+            token.extras.update({
                 'uid': data.get('uid', ''),
                 'open_id': data.get('openid', '')
-            }
+            })
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}") 
\ No newline at end of file
@@ -1,7 +1,8 @@
 """
 领英认证源
 """
-import uuid
+from secrets import token_urlsafe
+from types import MappingProxyType
 from typing import Dict, Optional
 
 from senweaver_oauth.config import AuthConfig
@@ -14,6 +15,11 @@ from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 表单请求的请求头
+_HEADERS = MappingProxyType({
+    "Content-Type": "application/x-www-form-urlencoded"
+})
+
 
 class AuthLinkedinSource(BaseAuthSource):
     """
@@ -49,24 +55,10 @@ class AuthLinkedinSource(BaseAuthSource):
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4())
+            "state": state or token_urlsafe(16)
         }
         return params
         
-    def build_authorize_url(self, params: Dict[str, str]) -> str:
-        """
-        构建授权URL
-        
-        Args:
-            params: 授权参数
-            
-        Returns:
-            授权URL
-        """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query}"
-        
     def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
         获取访问令牌
@@ -85,9 +77,7 @@ class AuthLinkedinSource(BaseAuthSource):
             "grant_type": "authorization_code"
         }
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.access_token_url, 
@@ -134,7 +124,7 @@ class AuthLinkedinSource(BaseAuthSource):
         email_url = "https://api.linkedin.com/v2/emailAddress?q=members&projection=(elements*(handle~))"
         
         headers = {
-            "Authorization": f"Bearer {token.access_token}"
+            "Authorization": token.authorization
         }
         
         # 获取基本资料
@@ -202,9 +192,7 @@ class AuthLinkedinSource(BaseAuthSource):
             "grant_type": "refresh_token"
         }
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.refresh_token_url, 
@@ -2,10 +2,10 @@
 QQ认证源
 """
 import re
-import json
-import uuid
+from secrets import token_urlsafe
 from typing import Dict, Optional
 
+from senweaver_oauth._compat import json_loads
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_scope import AuthScope
 from senweaver_oauth.enums.auth_gender import AuthGender
@@ -51,24 +51,10 @@ class AuthQqSource(BaseAuthSource):
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4())
+            "state": state or token_urlsafe(16)
         }
         return params
         
-    def build_authorize_url(self, params: Dict[str, str]) -> str:
-        """
-        构建授权URL
-        
-        Args:
-            params: 授权参数
-            
-        Returns:
-            授权URL
-        """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query}"
-        
     def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
         获取访问令牌
@@ -249,8 +235,8 @@ class AuthQqSource(BaseAuthSource):
             match = re.search(r'callback\((.*)\);', text)
             if match:
                 try:
-                    result = json.loads(match.group(1))
-                except json.JSONDecodeError:
+                    result = json_loads(match.group(1))
+                except ValueError:
                     pass
         else:
             # 标准的URL参数格式处理
@@ -284,15 +270,14 @@ class AuthQqSource(BaseAuthSource):
         
         response = self.http_client.get(url, params=params)
                     
-        try:
-            data = response
-            return data.get("openid", "")
-        except json.JSONDecodeError:
-            # 尝试解析非JSON格式的响应
-            match = re.search(r'"openid":"([^"]+)"', response.text)
-            if match:
-                return match.group(1)
-            return ""
+        openid = response.get("openid")
+        if openid:
+            return openid
+        # 非JSON格式的响应，HTTP客户端以content返回原始文本
+        match = re.search(r'"openid":"([^"]+)"', response.get("content", ""))
+        if match:
+            return match.group(1)
+        return ""
             
     def _get_gender(self, gender: str) -> AuthGender:
         """
@@ -304,9 +289,4 @@ class AuthQqSource(BaseAuthSource):
         Returns:
             性别整数，0: 未知, 1: 男, 2: 女
         """
-        if gender == "男":
-            return AuthGender.MALE
-        elif gender == "女":
-            return AuthGender.FEMALE
-        else:
-            return AuthGender.UNKNOWN
\ No newline at end of file
+        return AuthGender.get_gender(gender)
\ No newline at end of file
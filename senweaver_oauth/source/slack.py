@@ -2,17 +2,24 @@
 Slack认证源
 """
 
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 请求头，要求返回JSON
+_HEADERS = MappingProxyType({
+    'Accept': 'application/json'
+})
+
 
 class AuthSlackSource(BaseAuthSource):
     """
@@ -43,7 +50,7 @@ class AuthSlackSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
+            return EMPTY_CODE_RESPONSE
             
         params = {
             'code': callback.code,
@@ -52,9 +59,7 @@ class AuthSlackSource(BaseAuthSource):
             'redirect_uri': self.config.redirect_uri
         }
         
-        headers = {
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -79,14 +84,14 @@ class AuthSlackSource(BaseAuthSource):
             )
             
             # 保存额外信息，用于获取用户信息
-            token.ext_data = {
+            token.extras.update({
                 'team_id': response.get('team', {}).get('id'),
                 'user_id': response.get('authed_user', {}).get('id')
-            }
+            })
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -102,8 +107,8 @@ class AuthSlackSource(BaseAuthSource):
         try:
             # 从token中获取用户ID
             user_id = None
-            if hasattr(token, 'ext_data') and isinstance(token.ext_data, Dict):
-                user_id = token.ext_data.get('user_id')
+            if token.extras:
+                user_id = token.extras.get('user_id')
                 
             if not user_id:
                 return AuthUserResponse.failure("无法获取用户ID")
@@ -114,7 +119,7 @@ class AuthSlackSource(BaseAuthSource):
             }
             
             headers = {
-                'Authorization': f"Bearer {token.access_token}",
+                'Authorization': token.authorization,
                 'Accept': 'application/json'
             }
             
@@ -146,5 +151,5 @@ class AuthSlackSource(BaseAuthSource):
             
             return AuthUserResponse.success(user)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}") 
\ No newline at end of file
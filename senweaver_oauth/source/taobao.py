@@ -1,7 +1,8 @@
 """
 淘宝认证源
 """
-import uuid
+from secrets import token_urlsafe
+from types import MappingProxyType
 from typing import Dict, Optional
 from urllib.parse import urlencode
 
@@ -14,6 +15,11 @@ from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 表单请求的请求头
+_HEADERS = MappingProxyType({
+    "Content-Type": "application/x-www-form-urlencoded;charset=utf-8"
+})
+
 
 class AuthTaobaoSource(BaseAuthSource):
     """
@@ -49,7 +55,7 @@ class AuthTaobaoSource(BaseAuthSource):
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "view": "web",  # web页面视图
-            "state": state or str(uuid.uuid4())
+            "state": state or token_urlsafe(16)
         }
         return params
         
@@ -86,9 +92,7 @@ class AuthTaobaoSource(BaseAuthSource):
             "view": "web"
         }
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded;charset=utf-8"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.access_token_url,
@@ -185,9 +189,7 @@ class AuthTaobaoSource(BaseAuthSource):
             "refresh_token": token.refresh_token
         }
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded;charset=utf-8"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.access_token_url,
@@ -1,7 +1,7 @@
 """
 微信公众号认证源
 """
-import uuid
+from secrets import token_urlsafe
 from typing import Dict, Optional
 
 from senweaver_oauth.config import AuthConfig
@@ -9,7 +9,7 @@ from senweaver_oauth.enums.auth_scope import AuthScope
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
@@ -49,7 +49,7 @@ class AuthWechatSource(BaseAuthSource):
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4())
+            "state": state or token_urlsafe(16)
         }
         return params
         
@@ -63,9 +63,7 @@ class AuthWechatSource(BaseAuthSource):
         Returns:
             授权URL
         """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query}#wechat_redirect"  # 微信特殊处理
+        return f"{super().build_authorize_url(params)}#wechat_redirect"  # 微信特殊处理
         
     def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
@@ -79,10 +77,7 @@ class AuthWechatSource(BaseAuthSource):
         """
         # 参数校验
         if not callback.code:
-            return AuthTokenResponse(
-                code=400,
-                message="授权码不能为空"
-            )
+            return EMPTY_CODE_RESPONSE
             
         # 准备请求参数
         params = {
@@ -247,9 +242,4 @@ class AuthWechatSource(BaseAuthSource):
         Returns:
             性别枚举
         """
-        if gender_code == "1":
-            return AuthGender.MALE
-        elif gender_code == "2":
-            return AuthGender.FEMALE
-        else:
-            return AuthGender.UNKNOWN 
\ No newline at end of file
+        return AuthGender.get_gender(gender_code)
\ No newline at end of file
@@ -7,8 +7,9 @@ from typing import Optional, Dict, Any
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
@@ -63,7 +64,7 @@ class AuthWechatEnterpriseSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
+            return EMPTY_CODE_RESPONSE
             
         # 获取访问令牌
         params = {
@@ -93,13 +94,13 @@ class AuthWechatEnterpriseSource(BaseAuthSource):
             )
             
             # 保存额外信息，用于获取用户信息
-            token.ext_data = {
+            token.extras.update({
                 'code': callback.code
-            }
+            })
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -115,8 +116,8 @@ class AuthWechatEnterpriseSource(BaseAuthSource):
         try:
             # 获取code
             code = None
-            if hasattr(token, 'ext_data') and token.ext_data:
-                code = token.ext_data.get('code')
+            if token.extras:
+                code = token.extras.get('code')
                 
             if not code:
                 return AuthUserResponse.failure("无法获取用户授权码")
@@ -175,5 +176,5 @@ class AuthWechatEnterpriseSource(BaseAuthSource):
             
             return AuthUserResponse.success(user)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}") 
\ No newline at end of file
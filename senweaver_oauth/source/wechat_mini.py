@@ -3,9 +3,11 @@
 """
 
 from typing import Any,Dict,Optional
+from senweaver_oauth._compat import json_loads
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthSource, AuthDefaultSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
 from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
 from senweaver_oauth.model.auth_token import AuthToken
@@ -109,6 +111,14 @@ class AuthWechatMiniSource(BaseAuthSource):
         token = token_response.data
         return self.decrypt_user_info(token, encrypted_data, iv)        
         
+    async def login_async(self, callback: Dict[str, Any], **kwargs) -> AuthUserResponse:
+        """
+        异步的微信小程序一键登录
+        
+        在线程池中执行login，避免阻塞事件循环
+        """
+        return await self._run_sync(self.login, callback, **kwargs)
+        
     def code_to_session(self, code: str) -> AuthTokenResponse:
         """
         使用code换取session_key和openid
@@ -193,7 +203,6 @@ class AuthWechatMiniSource(BaseAuthSource):
             # 解密用户信息
             from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
             import base64
-            import json
             
             # Base64解码
             session_key = base64.b64decode(token.access_token)
@@ -208,7 +217,7 @@ class AuthWechatMiniSource(BaseAuthSource):
             decrypted = decryptor.update(encrypted_data) + decryptor.finalize()
             
             # 去除PKCS#7填充
-            padding = decrypted[-1]
+            padding = decrypted[-1] if decrypted else 0
             if padding < 1 or padding > 32:
                 return AuthUserResponse(
                     code=400,
@@ -218,10 +227,10 @@ class AuthWechatMiniSource(BaseAuthSource):
             decrypted = decrypted[:-padding]
             
             # 将解密后的JSON转换为字典
-            user_data = json.loads(decrypted)
+            user_data = json_loads(decrypted)
             
             # 验证数据的有效性
-            if user_data.get("watermark", {}).get("appid") != self.config.client_id:
+            if not isinstance(user_data, dict) or user_data.get("watermark", {}).get("appid") != self.config.client_id:
                 return AuthUserResponse(
                     code=400,
                     message="用户数据不合法，appid不匹配"
@@ -246,7 +255,8 @@ class AuthWechatMiniSource(BaseAuthSource):
                 data=user
             )
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
+            # Base64解码、密钥长度、填充和JSON解析的错误均为ValueError
             return AuthUserResponse(
                 code=500,
                 message=f"解密用户信息失败: {str(e)}"
@@ -262,12 +272,7 @@ class AuthWechatMiniSource(BaseAuthSource):
         Returns:
             性别枚举
         """
-        if gender_code == 1:
-            return AuthGender.MALE
-        elif gender_code == 2:
-            return AuthGender.FEMALE
-        else:
-            return AuthGender.UNKNOWN 
+        return AuthGender.get_gender(gender_code)
         
     def refresh_token(self, refresh_token: str) -> AuthTokenResponse:
         """
@@ -1,7 +1,7 @@
 """
 微信开放平台认证源
 """
-import uuid
+from secrets import token_urlsafe
 from typing import Dict, Optional
 
 from senweaver_oauth.config import AuthConfig
@@ -49,7 +49,7 @@ class AuthWechatOpenSource(BaseAuthSource):
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4())
+            "state": state or token_urlsafe(16)
         }
         return params
         
@@ -63,11 +63,8 @@ class AuthWechatOpenSource(BaseAuthSource):
         Returns:
             授权URL
         """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        
         # 微信开放平台的特殊处理，需要添加 #wechat_redirect
-        return f"{url}?{query}#wechat_redirect"
+        return f"{super().build_authorize_url(params)}#wechat_redirect"
         
     def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
@@ -227,9 +224,4 @@ class AuthWechatOpenSource(BaseAuthSource):
         Returns:
             性别枚举
         """
-        if gender_code == "1":
-            return AuthGender.MALE
-        elif gender_code == "2":
-            return AuthGender.FEMALE
-        else:
-            return AuthGender.UNKNOWN 
\ No newline at end of file
+        return AuthGender.get_gender(gender_code)
\ No newline at end of file
@@ -1,7 +1,8 @@
 """
 微博认证源
 """
-import uuid
+from secrets import token_urlsafe
+from types import MappingProxyType
 from typing import Dict, Optional
 
 from senweaver_oauth.config import AuthConfig
@@ -14,6 +15,11 @@ from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 from senweaver_oauth.enums.auth_gender import AuthGender
 
+# 表单请求的请求头
+_HEADERS = MappingProxyType({
+    "Content-Type": "application/x-www-form-urlencoded"
+})
+
 
 class AuthWeiboSource(BaseAuthSource):
     """
@@ -49,24 +55,10 @@ class AuthWeiboSource(BaseAuthSource):
             "redirect_uri": self.config.redirect_uri,
             "response_type": "code",
             "scope": self.get_scopes(),
-            "state": state or str(uuid.uuid4())
+            "state": state or token_urlsafe(16)
         }
         return params
         
-    def build_authorize_url(self, params: Dict[str, str]) -> str:
-        """
-        构建授权URL
-        
-        Args:
-            params: 授权参数
-            
-        Returns:
-            授权URL
-        """
-        url = self.source.authorize_url
-        query = "&".join([f"{k}={v}" for k, v in params.items()])
-        return f"{url}?{query}"
-        
     def get_access_token(self, callback: AuthCallback) -> AuthTokenResponse:
         """
         获取访问令牌
@@ -85,9 +77,7 @@ class AuthWeiboSource(BaseAuthSource):
             "grant_type": "authorization_code"
         }
         
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
+        headers = _HEADERS
         
         response = self.http_client.post(
             self.source.access_token_url, 
@@ -215,9 +205,4 @@ class AuthWeiboSource(BaseAuthSource):
         Returns:
             性别枚举
         """
-        if gender == "m":
-            return AuthGender.MALE
-        elif gender == "f":
-            return AuthGender.FEMALE
-        else:
-            return AuthGender.UNKNOWN 
\ No newline at end of file
+        return AuthGender.get_gender(gender)
\ No newline at end of file
@@ -2,17 +2,27 @@
 小米认证源
 """
 
+from types import MappingProxyType
 from typing import Optional
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE, NO_REFRESH_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 小米性别代码，1表示男性，0表示女性
+_GENDER_MAP = {1: AuthGender.MALE, 0: AuthGender.FEMALE}
+
+# 请求头，要求返回JSON
+_HEADERS = MappingProxyType({
+    'Accept': 'application/json'
+})
+
 
 class AuthXiaomiSource(BaseAuthSource):
     """
@@ -43,19 +53,11 @@ class AuthXiaomiSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
-            
-        params = {
-            'code': callback.code,
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'redirect_uri': self.config.redirect_uri,
-            'grant_type': 'authorization_code'
-        }
+            return EMPTY_CODE_RESPONSE
+            
+        params = {**self._base_token_params, 'code': callback.code}
         
-        headers = {
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -79,14 +81,14 @@ class AuthXiaomiSource(BaseAuthSource):
             
             # 小米API可能会返回mac_key和mac_algorithm
             if 'mac_key' in response:
-                token.ext_data = {
+                token.extras.update({
                     'mac_key': response.get('mac_key'),
                     'mac_algorithm': response.get('mac_algorithm')
-                }
+                })
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
         
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -101,7 +103,7 @@ class AuthXiaomiSource(BaseAuthSource):
         """
         try:
             headers = {
-                'Authorization': f"Bearer {token.access_token}",
+                'Authorization': token.authorization,
                 'Accept': 'application/json'
             }
             
@@ -132,7 +134,7 @@ class AuthXiaomiSource(BaseAuthSource):
             
             return AuthUserResponse.success(user)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
     
     def _get_gender(self, gender_code: Optional[int]) -> AuthGender:
@@ -145,12 +147,7 @@ class AuthXiaomiSource(BaseAuthSource):
         Returns:
             性别枚举
         """
-        if gender_code == 1:
-            return AuthGender.MALE
-        elif gender_code == 0:
-            return AuthGender.FEMALE
-        else:
-            return AuthGender.UNKNOWN
+        return _GENDER_MAP.get(gender_code, AuthGender.UNKNOWN)
             
     def refresh_token(self, refresh_token: str) -> AuthTokenResponse:
         """
@@ -163,18 +160,11 @@ class AuthXiaomiSource(BaseAuthSource):
             新的访问令牌
         """
         if not self.source.refresh_token_url:
-            return AuthTokenResponse.not_implemented("该平台不支持刷新令牌")
-            
-        params = {
-            'client_id': self.config.client_id,
-            'client_secret': self.config.client_secret,
-            'refresh_token': refresh_token,
-            'grant_type': 'refresh_token'
-        }
+            return NO_REFRESH_RESPONSE
+            
+        params = {**self._base_refresh_params, 'refresh_token': refresh_token}
         
-        headers = {
-            'Accept': 'application/json'
-        }
+        headers = _HEADERS
         
         try:
             response = self.http_client.post(
@@ -197,12 +187,12 @@ class AuthXiaomiSource(BaseAuthSource):
             
             # 小米API可能会返回mac_key和mac_algorithm
             if 'mac_key' in response:
-                token.ext_data = {
+                token.extras.update({
                     'mac_key': response.get('mac_key'),
                     'mac_algorithm': response.get('mac_algorithm')
-                }
+                })
             
             return AuthTokenResponse.success(token)
             
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"刷新访问令牌异常: {str(e)}") 
\ No newline at end of file
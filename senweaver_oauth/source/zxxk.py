@@ -4,20 +4,25 @@
 
 import hashlib
 import time
-import uuid
+from secrets import token_urlsafe
 
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 from urllib.parse import urlencode, urlparse
 
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.enums.auth_gender import AuthGender
 from senweaver_oauth.enums.auth_source import AuthDefaultSource, AuthSource
+from senweaver_oauth.http.http_client import HTTP_ERRORS
 from senweaver_oauth.model.auth_callback import AuthCallback
-from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse, EMPTY_CODE_RESPONSE
 from senweaver_oauth.model.auth_token import AuthToken
 from senweaver_oauth.model.auth_user import AuthUser
 from senweaver_oauth.source.base import BaseAuthSource
 
+# 请求头，要求返回JSON
+_HEADERS = MappingProxyType({"Accept": "application/json"})
+
 
 class AuthZxxkSource(BaseAuthSource):
     """
@@ -79,7 +84,7 @@ class AuthZxxkSource(BaseAuthSource):
 
         # 生成随机state参数
         if not state:
-            state = str(uuid.uuid4())
+            state = token_urlsafe(16)
 
         # 缓存state参数，默认有效期3分钟
         self.cache_store.set(state, state, 180)
@@ -98,7 +103,7 @@ class AuthZxxkSource(BaseAuthSource):
             "extra": extra,
         }
         params["signature"] = self._sign(params)
-        params["state"] = state or str(uuid.uuid4())
+        params["state"] = state or token_urlsafe(16)
         # 生成授权URL
         return self.build_authorize_url(params)
 
@@ -156,7 +161,7 @@ class AuthZxxkSource(BaseAuthSource):
             访问令牌
         """
         if not callback.code:
-            return AuthTokenResponse.failure("授权码不能为空")
+            return EMPTY_CODE_RESPONSE
 
         params = {
             "client_id": self.config.client_id,
@@ -165,7 +170,7 @@ class AuthZxxkSource(BaseAuthSource):
         }
         params["signature"] = self._sign(params)
 
-        headers = {"Accept": "application/json"}
+        headers = _HEADERS
         query = urlencode(params)
         try:
             response = self.http_client.post(
@@ -187,7 +192,7 @@ class AuthZxxkSource(BaseAuthSource):
 
             return AuthTokenResponse.success(token)
 
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthTokenResponse.error(f"获取访问令牌异常: {str(e)}")
 
     def get_user_info(self, token: AuthToken, **kwargs) -> AuthUserResponse:
@@ -201,7 +206,7 @@ class AuthZxxkSource(BaseAuthSource):
             用户信息
         """
         try:
-            headers = {"Accept": "application/json"}
+            headers = _HEADERS
             response = self.http_client.get(
                 f"{self.source.user_info_url}?access_token={token.access_token}",
                 headers=headers,
@@ -232,7 +237,7 @@ class AuthZxxkSource(BaseAuthSource):
 
             return AuthUserResponse.success(user)
 
-        except Exception as e:
+        except HTTP_ERRORS as e:
             return AuthUserResponse.error(f"获取用户信息异常: {str(e)}")
 
     def aes_encrypt(self, text: str, key: str) -> str:
@@ -0,0 +1,24 @@
+"""
+通用工具函数
+"""
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+def validate_http_url(name: str, url: Optional[str]) -> None:
+    """
+    校验URL为http或https的绝对地址，为空时跳过
+    用于平台接口地址，回调地址可以是原生应用的自定义协议，不使用此校验
+    
+    Args:
+        name: 参数名称，用于错误信息
+        url: URL
+        
+    Raises:
+        ValueError: URL格式不正确
+    """
+    if not url:
+        return
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.netloc:
+        raise ValueError(f"{name}必须是http或https的绝对地址: {url}")
@@ -33,9 +33,13 @@ setup(
     install_requires=[
         "requests>=2.28.0",
         "cryptography>=41.0.0",
-        "cachetools>=5.0.0",
         "redis>=4.0.0"
     ],
+    extras_require={
+        "async": ["httpx[http2]>=0.24.0"],
+        "perf": ["orjson>=3.9.0"],
+        "msgpack": ["msgpack>=1.0.0"],
+    },
     project_urls={
         'Bug Reports': 'https://github.com/senweaver/senweaver-oauth/issues',
         'Source': 'https://github.com/senweaver/senweaver-oauth',
@@ -80,6 +80,30 @@ class TestAuthConfig(unittest.TestCase):
                 redirect_uri=""
             )
 
+    def test_invalid_url(self):
+        """
+        测试平台接口地址不是http或https的绝对地址时抛出异常
+        """
+        for endpoint in ("localhost:8000/token", "/token", "javascript:alert(1)"):
+            with self.assertRaises(ValueError):
+                AuthConfig(
+                    client_id="test_client_id",
+                    client_secret="test_client_secret",
+                    access_token_endpoint=endpoint
+                )
+
+    def test_native_app_redirect_uri(self):
+        """
+        测试回调地址可以使用原生应用的自定义协议
+        """
+        for redirect_uri in ("myapp://callback", "com.example.app:/oauth2redirect"):
+            config = AuthConfig(
+                client_id="test_client_id",
+                client_secret="test_client_secret",
+                redirect_uri=redirect_uri
+            )
+            self.assertEqual(config.redirect_uri, redirect_uri)
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
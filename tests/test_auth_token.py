@@ -0,0 +1,55 @@
+"""
+AuthToken测试用例
+"""
+import unittest
+from datetime import datetime, timedelta
+
+from senweaver_oauth.model.auth_token import AuthToken
+
+
+class TestAuthToken(unittest.TestCase):
+    """
+    AuthToken测试用例
+    """
+    
+    def test_expired(self):
+        """
+        测试令牌过期判断
+        """
+        token = AuthToken(access_token="token", token_type="bearer", expires_in=3600)
+        expired_token = AuthToken(
+            access_token="token",
+            token_type="bearer",
+            expires_in=60,
+            create_time=datetime.now() - timedelta(seconds=120)
+        )
+        
+        self.assertFalse(token.expired)
+        self.assertTrue(expired_token.expired)
+        
+    def test_never_expires(self):
+        """
+        测试过期时间为空或小于等于0时不过期
+        """
+        create_time = datetime.now() - timedelta(days=365)
+        
+        for expires_in in (None, 0, -1, "invalid"):
+            token = AuthToken(access_token="token", token_type="bearer", expires_in=expires_in, create_time=create_time)
+            self.assertFalse(token.expired)
+            
+    def test_string_expires_in(self):
+        """
+        测试字符串形式的过期时间
+        """
+        token = AuthToken(
+            access_token="token",
+            token_type="bearer",
+            expires_in="60",
+            create_time=datetime.now() - timedelta(seconds=120)
+        )
+        
+        self.assertTrue(token.expired)
+
+
+if __name__ == "__main__":
+    unittest.main()
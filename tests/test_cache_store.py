@@ -1,12 +1,16 @@
 """
 缓存存储测试用例
 """
+import asyncio
 import unittest
 import time
 from unittest.mock import patch
 
+from senweaver_oauth._compat import msgpack
 from senweaver_oauth.cache.memory import MemoryCacheStore
 from senweaver_oauth.cache.default import DefaultCacheStore
+from senweaver_oauth.cache.redis import RedisCacheStore
+from senweaver_oauth.cache.redis_async import AsyncRedisCacheStore
 
 
 class TestMemoryCacheStore(unittest.TestCase):
@@ -111,6 +115,62 @@ class TestMemoryCacheStore(unittest.TestCase):
         value2 = self.cache_store.get("test_key")
         self.assertEqual(value2, "test_value")
 
+    def test_custom_timer(self):
+        """
+        测试自定义计时函数
+        """
+        now = [100.0]
+        cache_store = MemoryCacheStore(maxsize=10, ttl=30, timer=lambda: now[0])
+        cache_store.set("test_key", "test_value")
+        
+        # 未到过期时间
+        now[0] += 29
+        self.assertEqual(cache_store.get("test_key"), "test_value")
+        
+        # 到达过期时间
+        now[0] += 1
+        self.assertIsNone(cache_store.get("test_key"))
+
+    def test_lru_eviction(self):
+        """
+        测试分片写满时淘汰最近最少使用的缓存
+        """
+        # 每个分片最多2个缓存；整数的哈希值为自身，0、16、32落在同一个分片
+        cache_store = MemoryCacheStore(maxsize=32)
+        cache_store.set(0, "a")
+        cache_store.set(16, "b")
+        self.assertEqual(cache_store.get(0), "a")
+        cache_store.set(32, "c")
+        
+        self.assertEqual(cache_store.get(0), "a")
+        self.assertIsNone(cache_store.get(16))
+        self.assertEqual(cache_store.get(32), "c")
+
+    def test_eviction_drops_expired_head(self):
+        """
+        测试分片写满时顺带删除淘汰队首已过期的缓存，未过期的缓存保留
+        """
+        # 每个分片最多3个缓存；0、16、32、48落在同一个分片
+        now = [100.0]
+        cache_store = MemoryCacheStore(maxsize=48, timer=lambda: now[0])
+        cache_store.set(0, "a", 10)
+        cache_store.set(16, "b", 10)
+        cache_store.set(32, "c", 100)
+        now[0] += 20
+        cache_store.set(48, "d")
+        
+        data, _ = cache_store._get_shard(0)
+        self.assertEqual(list(data), [32, 48])
+        self.assertEqual(cache_store.get(32), "c")
+
+    def test_set_if_absent(self):
+        """
+        测试仅在键不存在时设置缓存
+        """
+        self.assertTrue(self.cache_store.set_if_absent("test_key", "value1"))
+        self.assertFalse(self.cache_store.set_if_absent("test_key", "value2"))
+        self.assertEqual(self.cache_store.get("test_key"), "value1")
+
 
 class TestDefaultCacheStore(unittest.TestCase):
     """
@@ -162,5 +222,107 @@ class TestDefaultCacheStore(unittest.TestCase):
         self.assertIs(instance1, instance2)
 
 
+class TestRedisCacheStore(unittest.TestCase):
+    """
+    RedisCacheStore测试用例
+    """
+    
+    def test_clear(self):
+        """
+        测试clear方法使用SCAN分批删除
+        """
+        redis_client = unittest.mock.MagicMock()
+        redis_client.scan.side_effect = [(5, [b"senweaver:a"]), (0, [b"senweaver:b"])]
+        pipe = redis_client.pipeline.return_value
+        
+        RedisCacheStore(redis_client).clear()
+        
+        redis_client.keys.assert_not_called()
+        self.assertEqual(redis_client.scan.call_count, 2)
+        pipe.unlink.assert_any_call(b"senweaver:a")
+        pipe.unlink.assert_any_call(b"senweaver:b")
+        pipe.execute.assert_called_once()
+        
+    def test_batch_operations(self):
+        """
+        测试批量操作
+        """
+        redis_client = unittest.mock.MagicMock()
+        redis_client.mget.return_value = [b'{"a": 1}', b"state", None]
+        pipe = redis_client.pipeline.return_value
+        cache_store = RedisCacheStore(redis_client)
+        
+        cache_store.mset({"k1": {"a": 1}, "k2": "state"}, timeout=60)
+        values = cache_store.mget(["k1", "k2", "k3"])
+        cache_store.mdelete(["k1", "k2"])
+        
+        self.assertEqual(pipe.set.call_count, 2)
+        pipe.set.assert_any_call(b"senweaver:k2", "state", ex=60)
+        pipe.execute.assert_called_once()
+        redis_client.mget.assert_called_once_with([b"senweaver:k1", b"senweaver:k2", b"senweaver:k3"])
+        self.assertEqual(values, [{"a": 1}, "state", None])
+        redis_client.unlink.assert_called_once_with(b"senweaver:k1", b"senweaver:k2")
+        
+    def test_set_if_absent(self):
+        """
+        测试使用SET NX设置缓存
+        """
+        redis_client = unittest.mock.MagicMock()
+        redis_client.set.return_value = None
+        cache_store = RedisCacheStore(redis_client)
+        
+        self.assertFalse(cache_store.set_if_absent("state", "value", timeout=180))
+        redis_client.set.assert_called_once_with(b"senweaver:state", "value", ex=180, nx=True)
+        
+    def test_invalid_codec(self):
+        """
+        测试不支持的编码方式
+        """
+        with self.assertRaises(ValueError):
+            RedisCacheStore(unittest.mock.MagicMock(), codec="pickle")
+            
+    def test_json_non_str_keys(self):
+        """
+        测试JSON编码与标准库一致，字典的非字符串键转换为字符串
+        """
+        data = RedisCacheStore._dumps({1: "a", None: "b"})
+        
+        self.assertEqual(RedisCacheStore._loads(data), {"1": "a", "null": "b"})
+        
+    @unittest.skipUnless(msgpack, "未安装msgpack")
+    def test_msgpack_codec(self):
+        """
+        测试msgpack编码的值可以被识别并解析，已有的JSON值仍可读取
+        """
+        data = RedisCacheStore._dumps({"a": 1}, "msgpack")
+        
+        self.assertEqual(data[:1], b"\x01")
+        self.assertEqual(RedisCacheStore._loads(data), {"a": 1})
+        self.assertEqual(RedisCacheStore._loads(b'{"a": 1}'), {"a": 1})
+
+
+class TestAsyncRedisCacheStore(unittest.TestCase):
+    """
+    AsyncRedisCacheStore测试用例
+    """
+    
+    def test_get_and_set(self):
+        """
+        测试异步get和set方法
+        """
+        redis_client = unittest.mock.AsyncMock()
+        redis_client.get.return_value = b'{"a": 1}'
+        cache_store = AsyncRedisCacheStore(redis_client)
+        
+        asyncio.run(cache_store.set("test_key", {"a": 1}, timeout=60))
+        value = asyncio.run(cache_store.get("test_key"))
+        
+        redis_client.set.assert_awaited_once()
+        self.assertEqual(redis_client.set.call_args[0][0], b"senweaver:test_key")
+        self.assertEqual(redis_client.set.call_args[1], {"ex": 60, "nx": False})
+        redis_client.get.assert_awaited_once_with(b"senweaver:test_key")
+        self.assertEqual(value, {"a": 1})
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+HTTP客户端测试用例
+"""
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import httpx
+import requests
+
+from senweaver_oauth.config import AuthConfig
+from senweaver_oauth.http.http_client import HTTP_ERRORS, HttpError
+from senweaver_oauth.http.http_config import HttpConfig
+from senweaver_oauth.http.httpx_http_client import HttpxAsyncHttpClient, HttpxHttpClient
+from senweaver_oauth.http.requests_http_client import RequestsHttpClient
+from senweaver_oauth.http.shared import aclose_shared_clients, get_shared_async_client, get_shared_client
+from senweaver_oauth.source.github import AuthGithubSource
+
+
+class TestSharedHttpClient(unittest.TestCase):
+    """
+    共享HTTP客户端测试用例
+    """
+
+    def setUp(self):
+        """
+        测试前准备
+        """
+        self.auth_config = AuthConfig(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            redirect_uri="http://localhost:8000/callback"
+        )
+
+    def test_get_shared_client(self):
+        """
+        测试共享客户端为单例
+        """
+        client1 = get_shared_client()
+        client2 = get_shared_client()
+
+        self.assertIsInstance(client1, RequestsHttpClient)
+        self.assertIs(client1, client2)
+
+    def test_sources_share_client(self):
+        """
+        测试不同认证源实例复用同一个客户端
+        """
+        source1 = AuthGithubSource(self.auth_config)
+        source2 = AuthGithubSource(self.auth_config)
+
+        self.assertIs(source1.http_client, source2.http_client)
+        self.assertIs(source1.http_client, get_shared_client())
+
+
+class TestRequestsHttpClient(unittest.TestCase):
+    """
+    RequestsHttpClient测试用例
+    """
+
+    def test_form_body(self):
+        """
+        测试字符串请求体按表单发送
+        """
+        headers = {'X-Test': '1'}
+        kwargs = RequestsHttpClient._body_kwargs("a=1&b=2", headers)
+
+        self.assertEqual(kwargs['data'], "a=1&b=2")
+        self.assertEqual(kwargs['headers'], {'X-Test': '1', 'Content-Type': 'application/x-www-form-urlencoded'})
+        self.assertNotIn('Content-Type', headers)
+
+    def test_json_body(self):
+        """
+        测试字典请求体按JSON发送
+        """
+        kwargs = RequestsHttpClient._body_kwargs({'a': 1}, None)
+
+        self.assertEqual(kwargs, {'json': {'a': 1}, 'headers': None})
+
+    def test_text_response(self):
+        """
+        测试非JSON响应按声明的编码返回文本
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response._content = "<xml>错误</xml>".encode('utf-8')
+        response.encoding = 'utf-8'
+
+        self.assertEqual(RequestsHttpClient()._process_response(response), {'content': "<xml>错误</xml>"})
+
+    def test_error_response(self):
+        """
+        测试4xx响应抛出携带状态码和响应内容的HttpError
+        """
+        response = requests.Response()
+        response.status_code = 400
+        response._content = b'{"error": "invalid_grant", "error_description": "Invalid authorization code"}'
+        response.url = "https://example.com/token"
+
+        with self.assertRaises(HttpError) as cm:
+            RequestsHttpClient()._process_response(response)
+        self.assertEqual(cm.exception.status, 400)
+        self.assertEqual(cm.exception.body['error'], "invalid_grant")
+        self.assertIsInstance(cm.exception, HTTP_ERRORS)
+
+    def test_session_config(self):
+        """
+        测试Session只配置一次公共请求头并挂载连接池
+        """
+        client = RequestsHttpClient(HttpConfig(headers={'X-Test': '1'}, verify_ssl=False))
+        adapter = client.session.get_adapter('https://github.com')
+
+        self.assertEqual(client.session.headers['X-Test'], '1')
+        self.assertEqual(client.session.headers['User-Agent'], 'SenWeaver-OAuth')
+        self.assertFalse(client.session.verify)
+        self.assertEqual(adapter._pool_maxsize, RequestsHttpClient.POOL_MAXSIZE)
+
+    def test_context_manager(self):
+        """
+        测试退出上下文时关闭Session
+        """
+        with patch.object(requests.Session, 'close') as close:
+            with RequestsHttpClient() as client:
+                self.assertIsInstance(client, RequestsHttpClient)
+            close.assert_called_once()
+
+
+class TestHttpxHttpClient(unittest.TestCase):
+    """
+    HttpxHttpClient测试用例
+    """
+
+    def test_json_post(self):
+        """
+        测试字典请求体按JSON发送并解析JSON响应
+        """
+        def handler(request):
+            self.assertEqual(request.headers['Content-Type'], 'application/json')
+            self.assertEqual(request.headers['User-Agent'], 'SenWeaver-OAuth')
+            return httpx.Response(200, json={'access_token': 'token'})
+
+        with HttpxHttpClient() as client:
+            client._client.close()
+            client._client = httpx.Client(transport=httpx.MockTransport(handler), headers=client.config.headers)
+            self.assertEqual(client.post("https://example.com/token", {'code': 'abc'}), {'access_token': 'token'})
+
+    def test_query_params(self):
+        """
+        测试查询参数的编码与requests一致：丢弃None、布尔值首字母大写、与URL已有的查询字符串合并
+        """
+        url = "https://example.com/user?lang=zh"
+        params = {'open_id': None, 'verbose': True, 'ids': ['1', '2'], 'name': '张三'}
+        expected = requests.Request('GET', url, params=params).prepare().url
+        sent = []
+
+        def handler(request):
+            sent.append(str(request.url))
+            return httpx.Response(200, json={})
+
+        with HttpxHttpClient() as client:
+            client._client.close()
+            client._client = httpx.Client(transport=httpx.MockTransport(handler))
+            client.get(url, params)
+        self.assertEqual(sent, [expected])
+
+    def test_error_status(self):
+        """
+        测试HTTP状态错误转换为OSError，可被HTTP_ERRORS捕获
+        """
+        with HttpxHttpClient() as client:
+            client._client.close()
+            client._client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(502)))
+            with self.assertRaises(HTTP_ERRORS):
+                client.get("https://example.com/user")
+
+
+class TestHttpxAsyncHttpClient(unittest.TestCase):
+    """
+    HttpxAsyncHttpClient测试用例
+    """
+
+    def test_form_post(self):
+        """
+        测试字符串请求体按表单发送并解析JSON响应
+        """
+        def handler(request):
+            self.assertEqual(request.headers['Content-Type'], 'application/x-www-form-urlencoded')
+            self.assertEqual(request.headers['User-Agent'], 'SenWeaver-OAuth')
+            self.assertEqual(request.content, b"code=abc")
+            return httpx.Response(200, json={'access_token': 'token'})
+
+        async def run():
+            client = HttpxAsyncHttpClient(HttpConfig())
+            await client._client.aclose()
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), headers=client.config.headers)
+            try:
+                return await client.post("https://example.com/token", "code=abc")
+            finally:
+                await client.aclose()
+
+        self.assertEqual(asyncio.run(run()), {'access_token': 'token'})
+
+    def test_query_params(self):
+        """
+        测试异步客户端的查询参数编码与requests一致
+        """
+        url = "https://example.com/user?lang=zh"
+        params = {'open_id': None, 'verbose': False, 'name': '张三'}
+        expected = requests.Request('GET', url, params=params).prepare().url
+        sent = []
+
+        def handler(request):
+            sent.append(str(request.url))
+            return httpx.Response(200, json={})
+
+        async def run():
+            client = HttpxAsyncHttpClient(HttpConfig())
+            await client._client.aclose()
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                await client.get(url, params)
+            finally:
+                await client.aclose()
+
+        asyncio.run(run())
+        self.assertEqual(sent, [expected])
+
+    def test_client_defaults(self):
+        """
+        测试共享客户端与requests客户端一样跟随重定向并发送默认请求头
+        """
+        async def run():
+            client = get_shared_async_client()
+            try:
+                return client.follow_redirects, client.headers['User-Agent']
+            finally:
+                await aclose_shared_clients()
+
+        self.assertEqual(asyncio.run(run()), (True, 'SenWeaver-OAuth'))
+
+    def test_shared_client_per_loop(self):
+        """
+        测试同一事件循环内复用共享客户端，不同事件循环使用各自的客户端
+        """
+        async def run():
+            client = get_shared_async_client()
+            self.assertIs(get_shared_async_client(), client)
+            await aclose_shared_clients()
+            self.assertTrue(client.is_closed)
+            return client
+
+        self.assertIsNot(asyncio.run(run()), asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,23 @@
 """
 集成测试用例
 """
+import asyncio
+import base64
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 from senweaver_oauth import AuthConfig, AuthRequest, AuthRequestBuilder
+from senweaver_oauth.http.http_client import HttpError
+from senweaver_oauth.model.auth_callback import AuthCallback
+from senweaver_oauth.model.auth_response import AuthTokenResponse, AuthUserResponse
+from senweaver_oauth.model.auth_token import AuthToken
+from senweaver_oauth.source.alipay import AuthAlipaySource
+from senweaver_oauth.source.baidu import AuthBaiduSource
+from senweaver_oauth.source.douyin import AuthDouyinSource
+from senweaver_oauth.source.eleme import AuthElemeSource
+from senweaver_oauth.source.facebook import AuthFacebookSource
+from senweaver_oauth.source.feishu import AuthFeishuSource
+from senweaver_oauth.source.gitee import AuthGiteeSource
 from senweaver_oauth.source.github import AuthGithubSource
 
 
@@ -147,6 +160,221 @@ class TestIntegration(unittest.TestCase):
         # 验证模拟对象的调用
         mock_get_authorize_params.assert_called_once_with("test_state")
 
+    def test_authorize_template(self):
+        """
+        测试授权URL模板与逐个参数构建的URL一致
+        """
+        for source_class in (AuthGiteeSource, AuthBaiduSource):
+            source = source_class(self.auth_config)
+            authorize_url = source.authorize("test_state")
+            self.assertTrue(source._authorize_url_parts)
+            self.assertEqual(authorize_url, source.build_authorize_url(source.get_authorize_params("test_state")))
+            self.assertEqual(source.authorize("other_state"), authorize_url.replace("test_state", "other_state"))
+
+    def test_shared_response_immutable(self):
+        """
+        测试复用的共享响应不可修改
+        """
+        response = AuthTokenResponse.success()
+        
+        self.assertIs(response, AuthTokenResponse.success())
+        with self.assertRaises(AttributeError):
+            response.data = AuthToken(access_token="token", token_type="bearer", expires_in=3600)
+
+    def test_token_body_without_redirect_uri(self):
+        """
+        测试未配置redirect_uri时换取令牌的表单中不包含该参数
+        """
+        source = AuthBaiduSource(AuthConfig(client_id="test_client_id", client_secret="test_client_secret"))
+        
+        self.assertEqual(
+            source._token_body("a b"),
+            "client_id=test_client_id&client_secret=test_client_secret&grant_type=authorization_code&code=a+b"
+        )
+
+    def test_alipay_private_key(self):
+        """
+        测试支付宝私钥支持PEM和不带头尾标记的Base64格式，私钥无效时初始化即报错
+        """
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import padding, rsa
+        
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        pem = key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode()
+        der = "".join(pem.splitlines()[1:-1])
+        for private_key in (pem, der):
+            config = AuthConfig(client_id="app_id", client_secret=private_key, redirect_uri="http://localhost:8000/callback")
+            source = AuthAlipaySource(config)
+            sign = source._sign({"app_id": "app_id", "method": "alipay.system.oauth.token"})
+            key.public_key().verify(
+                base64.b64decode(sign), b"app_id=app_id&method=alipay.system.oauth.token", padding.PKCS1v15(), hashes.SHA256()
+            )
+            
+        with self.assertRaises(ValueError):
+            AuthAlipaySource(self.auth_config)
+        source = AuthAlipaySource(AuthConfig(client_id="app_id", client_secret=pem))
+        with self.assertRaises(ValueError):
+            source.reload_key("invalid")
+        self.assertEqual(source.private_key, pem)
+
+    def test_empty_code(self):
+        """
+        测试授权码为空时直接返回失败响应，不发送请求
+        """
+        source = AuthBaiduSource(self.auth_config)
+        source.http_client = MagicMock()
+        
+        response = source.get_access_token(AuthCallback())
+        
+        self.assertEqual(response.message, "授权码不能为空")
+        source.http_client.post.assert_not_called()
+
+    def test_http_error_response(self):
+        """
+        测试HTTP状态错误转换为失败响应，响应体不是JSON对象时使用默认消息
+        """
+        source = AuthBaiduSource(self.auth_config)
+        source.http_client = MagicMock()
+        
+        source.http_client.post.side_effect = HttpError(400, {'error_description': 'invalid code'}, "https://example.com")
+        response = source.get_access_token(AuthCallback(code="code"))
+        self.assertEqual((response.code, response.message), (400, 'invalid code'))
+        
+        source.http_client.post.side_effect = HttpError(502, ['bad gateway'], "https://example.com")
+        response = source.get_access_token(AuthCallback(code="code"))
+        self.assertEqual((response.code, response.message), (502, '获取访问令牌失败'))
+
+    @patch.object(AuthGiteeSource, 'get_access_token')
+    @patch.object(AuthGiteeSource, 'get_user_info')
+    def test_login_async(self, mock_get_user_info, mock_get_access_token):
+        """
+        测试异步登录默认复用同步实现
+        """
+        mock_token_response = MagicMock()
+        mock_token_response.code = 200
+        mock_user_response = MagicMock()
+        mock_user_response.code = 200
+        
+        mock_get_access_token.return_value = mock_token_response
+        mock_get_user_info.return_value = mock_user_response
+        
+        auth_request = AuthRequest.build(AuthGiteeSource, self.auth_config)
+        response = asyncio.run(auth_request.login_async({"code": "test_code"}))
+        
+        self.assertIs(response, mock_user_response)
+        self.assertEqual(mock_get_access_token.call_args[0][0].code, "test_code")
+        mock_get_user_info.assert_called_once_with(mock_token_response.data)
+
+    def test_github_login_async(self):
+        """
+        测试GitHub使用原生异步实现登录
+        """
+        async_http_client = AsyncMock()
+        async_http_client.post.return_value = {'access_token': 'async_access_token', 'token_type': 'bearer'}
+        async_http_client.get.return_value = {'id': 1, 'login': 'octocat'}
+        source = AuthGithubSource(self.auth_config)
+        source._async_http_client = async_http_client
+        
+        response = asyncio.run(AuthRequest(source).login_async({"code": "async_code"}))
+        
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.data.username, "octocat")
+        self.assertEqual(response.data.token.access_token, "async_access_token")
+        self.assertEqual(async_http_client.post.call_args[1]['data']['code'], "async_code")
+
+    def test_feishu_login_async(self):
+        """
+        测试飞书使用原生异步实现登录
+        """
+        async_http_client = AsyncMock()
+        async_http_client.post.return_value = {'code': 0, 'data': {'access_token': 'feishu_token', 'open_id': 'ou_1'}}
+        async_http_client.get.return_value = {'code': 0, 'data': {'name': 'feishu_user'}}
+        source = AuthFeishuSource(self.auth_config)
+        source._async_http_client = async_http_client
+        
+        response = asyncio.run(AuthRequest(source).login_async({"code": "feishu_code"}))
+        
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.data.username, "feishu_user")
+        self.assertEqual(async_http_client.post.call_args[1]['data']['code'], "feishu_code")
+        self.assertEqual(async_http_client.get.call_args[1]['headers']['Authorization'], "Bearer feishu_token")
+
+    def test_async_requests_match_sync(self):
+        """
+        测试原生异步实现与同步实现对同样的输入发出相同的请求
+        """
+        cases = [
+            (AuthDouyinSource,
+             {'message': 'success', 'data': {'access_token': 'token', 'open_id': 'open_id', 'nickname': 'user'}},
+             None),
+            (AuthFeishuSource,
+             {'code': 0, 'data': {'name': 'user'}},
+             {'code': 0, 'data': {'access_token': 'token', 'open_id': 'open_id'}}),
+            (AuthFacebookSource,
+             {'access_token': 'token', 'id': '1', 'name': 'user'},
+             None),
+            (AuthElemeSource,
+             {'status': 'success', 'data': {'userId': 1, 'userName': 'user'}},
+             {'access_token': 'token'}),
+        ]
+        for source_class, get_response, post_response in cases:
+            with self.subTest(source=source_class.__name__):
+                http_client = MagicMock()
+                http_client.get.return_value = get_response
+                http_client.post.return_value = post_response
+                source = source_class(self.auth_config)
+                source.http_client = http_client
+                sync_response = AuthRequest(source).login({"code": "same_code"})
+                
+                async_http_client = AsyncMock()
+                async_http_client.get.return_value = get_response
+                async_http_client.post.return_value = post_response
+                source = source_class(self.auth_config)
+                source._async_http_client = async_http_client
+                async_response = asyncio.run(AuthRequest(source).login_async({"code": "same_code"}))
+                
+                self.assertEqual(sync_response.code, 200)
+                self.assertEqual(async_response.code, 200)
+                self.assertEqual(async_http_client.get.call_args_list, http_client.get.call_args_list)
+                self.assertEqual(async_http_client.post.call_args_list, http_client.post.call_args_list)
+                
+    @patch.object(AuthGithubSource, 'get_access_token')
+    @patch.object(AuthGithubSource, 'get_user_info')
+    def test_login_not_cached(self, mock_get_user_info, mock_get_access_token):
+        """
+        测试每次登录都向平台换取令牌并获取用户信息，访问令牌可能由多个用户共享，不缓存用户信息
+        """
+        token = AuthToken(access_token="shared_access_token", token_type="bearer", expires_in=3600)
+        user_response = AuthUserResponse(code=200)
+        mock_get_access_token.return_value = AuthTokenResponse(code=200, data=token)
+        mock_get_user_info.return_value = user_response
+        
+        auth_request = AuthRequest.build(AuthGithubSource, self.auth_config)
+        response1 = auth_request.login({"code": "alice_code"})
+        response2 = auth_request.login({"code": "bob_code"})
+        
+        self.assertIs(response1, user_response)
+        self.assertIs(response2, user_response)
+        self.assertEqual(mock_get_access_token.call_count, 2)
+        self.assertEqual(mock_get_user_info.call_count, 2)
+
+    @patch.object(AuthGiteeSource, 'get_access_token')
+    @patch.object(AuthGiteeSource, 'get_user_info')
+    def test_login_with_callback_object(self, mock_get_user_info, mock_get_access_token):
+        """
+        测试登录时直接使用已构建好的AuthCallback对象
+        """
+        mock_get_access_token.return_value = AuthTokenResponse(code=400, message="invalid code")
+        callback = AuthCallback(code="object_code")
+        
+        response = AuthRequest.build(AuthGiteeSource, self.auth_config).login(callback)
+        
+        self.assertEqual(response.code, 400)
+        self.assertIs(mock_get_access_token.call_args[0][0], callback)
+        mock_get_user_info.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -8,6 +8,8 @@ from unittest.mock import MagicMock, patch
 from senweaver_oauth.config import AuthConfig
 from senweaver_oauth.request import AuthRequest
 from senweaver_oauth.builder import AuthRequestBuilder
+from senweaver_oauth.cache.default import DefaultCacheStore
+from senweaver_oauth.cache.memory import MemoryCacheStore
 from senweaver_oauth.enums.auth_source import AuthSource
 
 
@@ -187,6 +189,30 @@ class TestAuthRequestBuilder(unittest.TestCase):
         self.assertEqual(result.client_secret, "github_client_secret")
         self.assertEqual(result.redirect_uri, "http://localhost:8000/github/callback")
 
+        
+    def test_build_after_cache_store_replaced(self):
+        """
+        测试替换默认缓存存储后重新构建认证请求，不沿用旧的缓存存储
+        """
+        auth_config = AuthConfig(
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            redirect_uri="http://localhost:8000/callback"
+        )
+        builder = AuthRequestBuilder.builder().source("github").auth_config(auth_config)
+        self.addCleanup(AuthRequestBuilder.clear_cache)
+        self.addCleanup(DefaultCacheStore.set_instance, DefaultCacheStore.get_instance())
+        
+        first = builder.build()
+        self.assertIs(builder.build(), first)
+        
+        cache_store = MemoryCacheStore()
+        DefaultCacheStore.set_instance(cache_store)
+        second = builder.build()
+        
+        self.assertIsNot(second, first)
+        self.assertIs(second.auth_source.cache_store, cache_store)
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file